@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 from uuid import UUID
 
 from application.dtos.page_dtos import PageResponse
@@ -22,8 +23,15 @@ class PageReadModel(ABC):
         pass
 
     @abstractmethod
-    async def count_pages_with_summaries(self, artifact_id: UUID) -> int:
-        """Count pages belonging to an artifact that have a non-empty summary."""
+    async def count_pages_with_summaries(
+        self,
+        artifact_id: UUID,
+        exclude_page_ids: Collection[UUID] = (),
+    ) -> int:
+        """Count pages belonging to an artifact that have a non-empty summary.
+
+        Pages in ``exclude_page_ids`` are left out of the count.
+        """
 
     @abstractmethod
     async def get_pages_by_artifact_ids(
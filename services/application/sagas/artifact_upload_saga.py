@@ -52,7 +52,7 @@ class ArtifactUploadSaga:
             source_uri=blob_response.source_uri,
             source_filename=blob_response.filename,
             artifact_type=upload_req.artifact_type,
-            mime_type=MimeType(blob_response.mime_type),
+            mime_type=MimeType.from_value(blob_response.mime_type),
             storage_location=blob_response.storage_key,
         )
 
@@ -191,7 +191,7 @@ class BatchReEmbedArtifactPagesUseCase:
             if page_blocks:
                 bchunks = [
                     bc for bc in chunk_blocks(page_blocks, max_chars=_settings.chunk_size)
-                    if bc.text.strip()
+                    if bc.text and not bc.text.isspace()
                 ]
                 if bchunks:
                     raw_texts = [bc.text for bc in bchunks]
@@ -60,7 +60,7 @@ class ExtractCompoundMentionsUseCase:
         Returns None if the result has no SMILES (cannot construct a valid CompoundMention).
         Validates and canonicalizes the SMILES using the configured validator.
         """
-        if not result.smiles or not result.smiles.strip():
+        if not result.smiles or result.smiles.isspace():
             return None
         is_valid = self.smiles_validator.validate(result.smiles)
         canonical = self.smiles_validator.canonicalize(result.smiles) if is_valid else None
@@ -171,7 +171,7 @@ class GeneratePageEmbeddingUseCase:
                 block_chunks = [
                     bc
                     for bc in chunk_blocks(page_blocks, max_chars=_settings.chunk_size)
-                    if bc.text.strip()
+                    if bc.text and not bc.text.isspace()
                 ]
                 raw_chunk_texts = [bc.text for bc in block_chunks]
                 chunk_metadata = [chunk_payload(bc) for bc in block_chunks]
@@ -437,7 +437,7 @@ class SearchSimilarPagesUseCase:
                     text = ""
                     if page and page.text_mention and page.text_mention.text:
                         text = page.text_mention.text[:2000]
-                    if not text.strip():
+                    if not text or text.isspace():
                         continue  # skip empty pages — cross-encoder returns nan for empty text
                     doc_text = _rerank_doc_text(text, r.metadata)
                     rerank_docs.append(RerankDocument(id=str(r.page_id), text=doc_text))
@@ -65,20 +65,21 @@ class ExtractPageEntitiesUseCase:
 
             raw_entities = await self.ner_extractor.extract(page.text_mention.text)
 
-            tag_mentions = [
-                TagMention(
-                    tag=entity.text,
-                    entity_type=entity.entity_type,
-                    confidence=entity.confidence,
-                    date_extracted=datetime.now(UTC),
-                    model_name="structflo-ner",
-                    additional_model_params={"entity_type": entity.entity_type}
+            extracted_at = datetime.now(UTC)
+            tag_mentions = TagMention.validate_many(
+                {
+                    "tag": entity.text,
+                    "entity_type": entity.entity_type,
+                    "confidence": entity.confidence,
+                    "date_extracted": extracted_at,
+                    "model_name": "structflo-ner",
+                    "additional_model_params": {"entity_type": entity.entity_type}
                     | (entity.attributes or {}),
-                    pipeline_run_id=None,
-                )
+                    "pipeline_run_id": None,
+                }
                 for entity in raw_entities
-                if entity.text and entity.text.strip()
-            ]
+                if entity.text and not entity.text.isspace()
+            )
 
             # Associate bioactivity tags with their parent compounds;
             # orphan bioactivities (no compound link) are discarded.
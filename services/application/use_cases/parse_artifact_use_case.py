@@ -109,7 +109,7 @@ class ParseArtifactUseCase:
                 owner_id=artifact.owner_id,
             )
 
-            if not seg.text.strip():
+            if not seg.text or seg.text.isspace():
                 continue
 
             # ponytail: idempotent text-set — fresh page always needs text; on retry (create_res is
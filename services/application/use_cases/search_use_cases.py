@@ -367,7 +367,7 @@ class HierarchicalSearchUseCase:
                 text = ""
                 if page and page.text_mention and page.text_mention.text:
                     text = page.text_mention.text[:2000]
-                if not text.strip():
+                if not text or text.isspace():
                     continue
                 rerank_docs.append(RerankDocument(id=str(r.page_id), text=text))
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
@@ -210,7 +211,16 @@ class SummarizeArtifactUseCase:
             artifact_title = artifact.source_filename or "Unknown"
 
             # Load pages sorted by index; collect non-empty summaries.
-            pages = [self.page_repository.get_by_id(pid) for pid in artifact.pages]
+            # Each load is a blocking event store replay, so issue them
+            # concurrently on worker threads rather than one after another.
+            pages = list(
+                await asyncio.gather(
+                    *(
+                        asyncio.to_thread(self.page_repository.get_by_id, pid)
+                        for pid in artifact.pages
+                    ),
+                ),
+            )
             pages.sort(key=lambda p: p.index)
             page_summaries = [
                 p.summary_candidate.summary
@@ -0,0 +1,47 @@
+"""Base classes for trigger use cases that start one workflow per entity.
+
+Most trigger use cases only differ in the workflow ID prefix and the
+orchestrator method they call. Subclasses of ``PageWorkflowTrigger`` /
+``ArtifactWorkflowTrigger`` declare the prefix, pass the bound orchestrator
+method to ``__init__`` and inherit ``execute``. Use cases with preconditions
+subclass ``EntityWorkflowTrigger``, define their own ``execute`` and delegate
+to ``_start`` once the checks pass.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+from application.dtos.workflow_dtos import WorkflowStartedResponse
+from application.workflow_use_cases.workflow_ids import workflow_id_for
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from uuid import UUID
+
+
+class EntityWorkflowTrigger:
+    """Starts a workflow for a single entity with ``start_workflow``."""
+
+    workflow_prefix: ClassVar[str]
+
+    def __init__(self, start_workflow: Callable[[UUID], Awaitable[None]]) -> None:
+        self.start_workflow = start_workflow
+
+    async def _start(self, entity_id: UUID) -> WorkflowStartedResponse:
+        await self.start_workflow(entity_id)
+        return WorkflowStartedResponse(workflow_id=workflow_id_for(self.workflow_prefix, entity_id))
+
+
+class PageWorkflowTrigger(EntityWorkflowTrigger):
+    """Start a page-scoped workflow keyed by ``{workflow_prefix}-{page_id}``."""
+
+    async def execute(self, page_id: UUID) -> WorkflowStartedResponse:
+        return await self._start(page_id)
+
+
+class ArtifactWorkflowTrigger(EntityWorkflowTrigger):
+    """Start an artifact-scoped workflow keyed by ``{workflow_prefix}-{artifact_id}``."""
+
+    async def execute(self, artifact_id: UUID) -> WorkflowStartedResponse:
+        return await self._start(artifact_id)
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 import structlog
 
 from application.dtos.workflow_dtos import WorkflowStartedResponse
+from application.workflow_use_cases.workflow_ids import workflow_id_for
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
     from uuid import UUID
 
     from application.ports.repositories.artifact_repository import ArtifactRepository
@@ -34,30 +37,58 @@ class TriggerArtifactSummarizationUseCase:
         self.page_read_model = page_read_model
         self.workflow_orchestrator = workflow_orchestrator
 
-    async def execute(self, artifact_id: UUID) -> WorkflowStartedResponse | None:
-        artifact = self.artifact_repository.get_by_id(artifact_id)
+    async def execute(
+        self,
+        artifact_id: UUID,
+        *,
+        summarized_page_ids: Collection[UUID] = (),
+    ) -> WorkflowStartedResponse | None:
+        """Start the workflow if every page of the artifact has a summary.
+
+        Args:
+            artifact_id: Artifact whose pages to check.
+            summarized_page_ids: Pages the caller knows were just summarized
+                (one per Page.SummaryCandidateUpdated event it is reacting to).
+                Their summaries may not be projected into the read model yet.
+
+        """
+        # The artifact load (blocking event store I/O, run off the event loop)
+        # and the read model count only depend on artifact_id, so fan them out
+        # instead of paying two sequential round trips.
+        #
+        # Single read model count query instead of N aggregate loads.
+        # The read model projector is a separate process and may not have
+        # projected the just-summarized pages yet, but we KNOW they have a
+        # summary (we received their SummaryCandidateUpdated events). Count
+        # the other pages in the read model and add the known ones, so each
+        # page is counted once whether or not it has been projected.
+        artifact, pages_with_summaries = await asyncio.gather(
+            asyncio.to_thread(self.artifact_repository.get_by_id, artifact_id),
+            self.page_read_model.count_pages_with_summaries(
+                artifact_id=artifact_id,
+                exclude_page_ids=summarized_page_ids,
+            ),
+        )
 
         total_pages = len(artifact.pages) if artifact.pages else 0
         if total_pages == 0:
             log.info(
                 "trigger_artifact_summarization.no_pages",
-                artifact_id=str(artifact_id),
+                artifact_id=artifact_id,
             )
             return None
 
-        # Single read model count query instead of N aggregate loads.
-        # Use total_pages - 1 threshold to handle eventual consistency:
-        # the read model projector is a separate process and may not have
-        # projected the current page's summary yet, but we KNOW the current
-        # page has a summary (we received its SummaryCandidateUpdated event).
-        pages_with_summaries = await self.page_read_model.count_pages_with_summaries(
-            artifact_id=artifact_id,
-        )
+        if summarized_page_ids:
+            pages_with_summaries += len(set(summarized_page_ids))
+        else:
+            # No page IDs given: allow for the single page whose event
+            # triggered this check.
+            pages_with_summaries += 1
 
-        if pages_with_summaries < total_pages - 1:
+        if pages_with_summaries < total_pages:
             log.debug(
                 "trigger_artifact_summarization.pages_not_ready",
-                artifact_id=str(artifact_id),
+                artifact_id=artifact_id,
                 have=pages_with_summaries,
                 need=total_pages,
             )
@@ -65,11 +96,11 @@ class TriggerArtifactSummarizationUseCase:
 
         log.info(
             "trigger_artifact_summarization.all_pages_ready",
-            artifact_id=str(artifact_id),
+            artifact_id=artifact_id,
             page_count=total_pages,
         )
 
-        workflow_id = f"artifact-summarization-{artifact_id}"
+        workflow_id = workflow_id_for("artifact-summarization", artifact_id)
         await self.workflow_orchestrator.start_artifact_summarization_workflow(
             artifact_id=artifact_id,
         )
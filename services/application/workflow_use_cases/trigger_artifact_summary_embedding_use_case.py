@@ -1,28 +1,42 @@
 """Trigger use case: start the artifact summary embedding Temporal workflow."""
 
-from uuid import UUID
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 import structlog
 
-from application.dtos.workflow_dtos import WorkflowStartedResponse
-from application.ports.workflow_orchestrator import WorkflowOrchestrator
+from application.workflow_use_cases.entity_workflow_trigger import EntityWorkflowTrigger
+
+if TYPE_CHECKING:
+    from uuid import UUID
 
-logger = structlog.get_logger()
+    from application.dtos.workflow_dtos import WorkflowStartedResponse
+    from application.ports.workflow_orchestrator import WorkflowOrchestrator
 
+log = structlog.get_logger(__name__)
 
-class TriggerArtifactSummaryEmbeddingUseCase:
+
+class TriggerArtifactSummaryEmbeddingUseCase(EntityWorkflowTrigger):
     """Start the artifact summary embedding workflow.
 
     Called from the pipeline worker when ``Artifact.SummaryCandidateUpdated``
-    is received.
+    is received.  Skipped when the caller reports ``has_summary=False``.
     """
 
+    workflow_prefix = "artifact-summary-embedding"
+
     def __init__(self, workflow_orchestrator: WorkflowOrchestrator) -> None:
-        self.workflow_orchestrator = workflow_orchestrator
-
-    async def execute(self, artifact_id: UUID) -> WorkflowStartedResponse:
-        logger.info("trigger_artifact_summary_embedding", artifact_id=str(artifact_id))
-        await self.workflow_orchestrator.start_artifact_summary_embedding_workflow(
-            artifact_id=artifact_id,
-        )
-        return WorkflowStartedResponse(workflow_id=f"artifact-summary-embedding-{artifact_id}")
+        super().__init__(workflow_orchestrator.start_artifact_summary_embedding_workflow)
+
+    async def execute(
+        self,
+        artifact_id: UUID,
+        *,
+        has_summary: bool = True,
+    ) -> WorkflowStartedResponse | None:
+        if not has_summary:
+            return None
+
+        log.info("trigger_artifact_summary_embedding", artifact_id=artifact_id)
+        return await self._start(artifact_id)
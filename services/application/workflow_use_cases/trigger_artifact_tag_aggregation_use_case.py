@@ -8,24 +8,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from application.dtos.workflow_dtos import WorkflowStartedResponse
+from application.workflow_use_cases.entity_workflow_trigger import ArtifactWorkflowTrigger
 
 if TYPE_CHECKING:
-    from uuid import UUID
-
     from application.ports.workflow_orchestrator import WorkflowOrchestrator
 
 
-class TriggerArtifactTagAggregationUseCase:
-    def __init__(
-        self,
-        workflow_orchestrator: WorkflowOrchestrator,
-    ) -> None:
-        self.workflow_orchestrator = workflow_orchestrator
+class TriggerArtifactTagAggregationUseCase(ArtifactWorkflowTrigger):
+    workflow_prefix = "artifact-tag-aggregation"
 
-    async def execute(self, artifact_id: UUID) -> WorkflowStartedResponse:
-        workflow_id = f"artifact-tag-aggregation-{artifact_id}"
-        await self.workflow_orchestrator.start_artifact_tag_aggregation_workflow(
-            artifact_id=artifact_id,
-        )
-        return WorkflowStartedResponse(workflow_id=workflow_id)
+    def __init__(self, workflow_orchestrator: WorkflowOrchestrator) -> None:
+        super().__init__(workflow_orchestrator.start_artifact_tag_aggregation_workflow)
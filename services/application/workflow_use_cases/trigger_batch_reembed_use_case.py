@@ -6,17 +6,18 @@ from typing import TYPE_CHECKING
 
 import structlog
 
-from application.dtos.workflow_dtos import WorkflowStartedResponse
+from application.workflow_use_cases.entity_workflow_trigger import ArtifactWorkflowTrigger
 
 if TYPE_CHECKING:
     from uuid import UUID
 
+    from application.dtos.workflow_dtos import WorkflowStartedResponse
     from application.ports.workflow_orchestrator import WorkflowOrchestrator
 
 log = structlog.get_logger(__name__)
 
 
-class TriggerBatchReEmbedUseCase:
+class TriggerBatchReEmbedUseCase(ArtifactWorkflowTrigger):
     """Start the batch re-embed workflow for an artifact.
 
     Called when all page summaries are complete so that every page's
@@ -24,17 +25,16 @@ class TriggerBatchReEmbedUseCase:
     in a single batched encoding call.
     """
 
+    workflow_prefix = "batch-reembed"
+
     def __init__(self, workflow_orchestrator: WorkflowOrchestrator) -> None:
-        self.workflow_orchestrator = workflow_orchestrator
+        super().__init__(workflow_orchestrator.start_batch_reembed_workflow)
 
     async def execute(self, artifact_id: UUID) -> WorkflowStartedResponse:
-        workflow_id = f"batch-reembed-{artifact_id}"
-        await self.workflow_orchestrator.start_batch_reembed_workflow(
-            artifact_id=artifact_id,
-        )
+        response = await self._start(artifact_id)
         log.info(
             "trigger_batch_reembed.started",
-            artifact_id=str(artifact_id),
-            workflow_id=workflow_id,
+            artifact_id=artifact_id,
+            workflow_id=response.workflow_id,
         )
-        return WorkflowStartedResponse(workflow_id=workflow_id)
+        return response
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 import structlog
 
 from application.dtos.health_dtos import ALL_REEMBED_TARGETS, BulkWorkflowResponse, ReEmbedTarget
+from application.workflow_use_cases.workflow_ids import workflow_id_for
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -59,7 +60,7 @@ class TriggerBulkReEmbedUseCase:
                 try:
                     method = getattr(self._workflow_orchestrator, method_name)
                     await method(artifact_id=artifact.artifact_id)
-                    workflow_ids.append(f"{wf_prefix}-{artifact.artifact_id}")
+                    workflow_ids.append(workflow_id_for(wf_prefix, artifact.artifact_id))
                 except Exception:
                     log.warning(
                         "trigger_bulk_reembed.artifact_failed",
@@ -71,7 +72,7 @@ class TriggerBulkReEmbedUseCase:
             "trigger_bulk_reembed.completed",
             total=len(workflow_ids),
             targets=effective_targets,
-            workspace_id=str(workspace_id),
+            workspace_id=workspace_id,
         )
 
         return BulkWorkflowResponse(
@@ -1,20 +1,21 @@
-from uuid import UUID
+from __future__ import annotations
 
-from application.dtos.workflow_dtos import WorkflowStartedResponse
-from application.ports.workflow_orchestrator import WorkflowOrchestrator
+from typing import TYPE_CHECKING
 
+from application.workflow_use_cases.entity_workflow_trigger import PageWorkflowTrigger
 
-class TriggerCompoundExtractionUseCase:
+if TYPE_CHECKING:
+    from application.ports.workflow_orchestrator import WorkflowOrchestrator
+
+
+class TriggerCompoundExtractionUseCase(PageWorkflowTrigger):
     """Trigger the compound extraction workflow for a page.
 
     Starts the Temporal workflow and returns a WorkflowStartedResponse.
     Temporal is the source of truth for workflow status.
     """
 
-    def __init__(self, workflow_orchestrator: WorkflowOrchestrator) -> None:
-        self.workflow_orchestrator = workflow_orchestrator
+    workflow_prefix = "compound-extraction"
 
-    async def execute(self, page_id: UUID) -> WorkflowStartedResponse:
-        workflow_id = f"compound-extraction-{page_id}"
-        await self.workflow_orchestrator.start_compound_extraction_workflow(page_id=page_id)
-        return WorkflowStartedResponse(workflow_id=workflow_id)
+    def __init__(self, workflow_orchestrator: WorkflowOrchestrator) -> None:
+        super().__init__(workflow_orchestrator.start_compound_extraction_workflow)
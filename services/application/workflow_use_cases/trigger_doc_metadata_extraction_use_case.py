@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 import structlog
 
 from application.dtos.workflow_dtos import WorkflowStartedResponse
+from application.workflow_use_cases.workflow_ids import workflow_id_for
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -14,7 +16,7 @@ if TYPE_CHECKING:
     from application.ports.repositories.page_repository import PageRepository
     from application.ports.workflow_orchestrator import WorkflowOrchestrator
 
-logger = structlog.get_logger()
+log = structlog.get_logger(__name__)
 
 
 class TriggerDocMetadataExtractionUseCase:
@@ -31,28 +33,28 @@ class TriggerDocMetadataExtractionUseCase:
         page_id: UUID,
         artifact_id: UUID | None = None,
     ) -> WorkflowStartedResponse | None:
-        page = self.page_repository.get_by_id(page_id)
+        page = await asyncio.to_thread(self.page_repository.get_by_id, page_id)
 
         # Only extract metadata from the first page (cover/title page)
         if page.index != 0:
-            logger.debug(
+            log.debug(
                 "trigger_doc_metadata.skip_non_first_page",
-                page_id=str(page_id),
+                page_id=page_id,
                 page_index=page.index,
             )
             return None
 
         resolved_artifact_id = artifact_id or page.artifact_id
-        workflow_id = f"doc-metadata-{resolved_artifact_id}"
+        workflow_id = workflow_id_for("doc-metadata", resolved_artifact_id)
 
         await self.workflow_orchestrator.start_doc_metadata_extraction_workflow(
             artifact_id=resolved_artifact_id,
             page_id=page_id,
         )
 
-        logger.info(
+        log.info(
             "trigger_doc_metadata.workflow_started",
-            page_id=str(page_id),
-            artifact_id=str(resolved_artifact_id),
+            page_id=page_id,
+            artifact_id=resolved_artifact_id,
         )
         return WorkflowStartedResponse(workflow_id=workflow_id)
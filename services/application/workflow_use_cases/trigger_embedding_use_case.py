@@ -2,6 +2,7 @@ from uuid import UUID
 
 from application.dtos.workflow_dtos import WorkflowStartedResponse
 from application.ports.workflow_orchestrator import WorkflowOrchestrator
+from application.workflow_use_cases.workflow_ids import workflow_id_for
 
 
 class TriggerEmbeddingUseCase:
@@ -24,7 +25,7 @@ class TriggerEmbeddingUseCase:
     ) -> WorkflowStartedResponse | None:
         if text_mention is None and not force_regenerate:
             return None
-        workflow_id = f"embedding-{page_id}"
+        workflow_id = workflow_id_for("embedding", page_id)
         await self.workflow_orchestrator.start_embedding_workflow(
             page_id=page_id,
             skip_sparse=skip_sparse,
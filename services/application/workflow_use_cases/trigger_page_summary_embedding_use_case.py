@@ -1,28 +1,44 @@
 """Trigger use case: start the page summary embedding Temporal workflow."""
 
-from uuid import UUID
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 import structlog
 
-from application.dtos.workflow_dtos import WorkflowStartedResponse
-from application.ports.workflow_orchestrator import WorkflowOrchestrator
+from application.workflow_use_cases.entity_workflow_trigger import EntityWorkflowTrigger
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from application.dtos.workflow_dtos import WorkflowStartedResponse
+    from application.ports.workflow_orchestrator import WorkflowOrchestrator
 
-logger = structlog.get_logger()
+log = structlog.get_logger(__name__)
 
 
-class TriggerPageSummaryEmbeddingUseCase:
+class TriggerPageSummaryEmbeddingUseCase(EntityWorkflowTrigger):
     """Start the page summary embedding workflow for a page.
 
     Called from the pipeline worker when ``Page.SummaryCandidateUpdated``
-    is received.  No precondition check — if the summary exists the
-    Temporal activity will find it; if it doesn't, the activity returns
-    a validation failure (non-fatal).
+    is received.  The only precondition is the event's own payload: when
+    the caller reports ``has_summary=False`` the workflow is skipped, since
+    the activity would just return a validation failure (non-fatal).
     """
 
-    def __init__(self, workflow_orchestrator: WorkflowOrchestrator) -> None:
-        self.workflow_orchestrator = workflow_orchestrator
+    workflow_prefix = "page-summary-embedding"
 
-    async def execute(self, page_id: UUID) -> WorkflowStartedResponse:
-        logger.info("trigger_page_summary_embedding", page_id=str(page_id))
-        await self.workflow_orchestrator.start_page_summary_embedding_workflow(page_id=page_id)
-        return WorkflowStartedResponse(workflow_id=f"page-summary-embedding-{page_id}")
+    def __init__(self, workflow_orchestrator: WorkflowOrchestrator) -> None:
+        super().__init__(workflow_orchestrator.start_page_summary_embedding_workflow)
+
+    async def execute(
+        self,
+        page_id: UUID,
+        *,
+        has_summary: bool = True,
+    ) -> WorkflowStartedResponse | None:
+        if not has_summary:
+            return None
+
+        log.info("trigger_page_summary_embedding", page_id=page_id)
+        return await self._start(page_id)
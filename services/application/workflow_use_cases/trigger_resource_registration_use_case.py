@@ -11,7 +11,7 @@ import structlog
 
 from application.ports.permission_registrar import PermissionRegistrar
 
-logger = structlog.get_logger()
+log = structlog.get_logger(__name__)
 
 
 class TriggerResourceRegistrationUseCase:
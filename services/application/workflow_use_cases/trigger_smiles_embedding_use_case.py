@@ -1,20 +1,41 @@
-from uuid import UUID
+from __future__ import annotations
 
-from application.dtos.workflow_dtos import WorkflowStartedResponse
-from application.ports.workflow_orchestrator import WorkflowOrchestrator
+from typing import TYPE_CHECKING
 
+from application.workflow_use_cases.entity_workflow_trigger import EntityWorkflowTrigger
 
-class TriggerSmilesEmbeddingUseCase:
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from application.dtos.workflow_dtos import WorkflowStartedResponse
+    from application.ports.workflow_orchestrator import WorkflowOrchestrator
+    from domain.value_objects.compound_mention import CompoundMention
+
+
+class TriggerSmilesEmbeddingUseCase(EntityWorkflowTrigger):
     """Trigger the SMILES embedding workflow for a page.
 
     Starts the Temporal workflow and returns a WorkflowStartedResponse.
     Temporal is the source of truth for workflow status.
+
+    When the caller already holds the page's compound mentions (e.g. from a
+    ``Page.CompoundMentionsUpdated`` event) and none carry a valid canonical
+    SMILES, the workflow would embed nothing, so it is not started.
     """
 
+    workflow_prefix = "smiles-embedding"
+
     def __init__(self, workflow_orchestrator: WorkflowOrchestrator) -> None:
-        self.workflow_orchestrator = workflow_orchestrator
+        super().__init__(workflow_orchestrator.start_smiles_embedding_workflow)
+
+    async def execute(
+        self,
+        page_id: UUID,
+        compound_mentions: list[CompoundMention] | None = None,
+    ) -> WorkflowStartedResponse | None:
+        if compound_mentions is not None and not any(
+            c.is_smiles_valid and c.canonical_smiles for c in compound_mentions
+        ):
+            return None
 
-    async def execute(self, page_id: UUID) -> WorkflowStartedResponse:
-        workflow_id = f"smiles-embedding-{page_id}"
-        await self.workflow_orchestrator.start_smiles_embedding_workflow(page_id=page_id)
-        return WorkflowStartedResponse(workflow_id=workflow_id)
+        return await self._start(page_id)
@@ -0,0 +1,20 @@
+"""Temporal workflow ID construction shared by the trigger use cases."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+
+@lru_cache(maxsize=4096)
+def workflow_id_for(prefix: str, entity_id: UUID) -> str:
+    """Return the Temporal workflow ID for an entity.
+
+    IDs are deterministic per (prefix, entity) and must match the IDs the
+    orchestrator starts workflows under. Cached because replayed and burst
+    events hit the same handful of entities repeatedly.
+    """
+    return f"{prefix}-{entity_id}"
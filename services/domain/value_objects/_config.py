@@ -0,0 +1,10 @@
+"""Model configuration shared by the Pydantic value objects."""
+
+from pydantic import ConfigDict
+
+VO_CONFIG = ConfigDict(frozen=True, defer_build=True)
+"""Immutable, with validator/serializer construction deferred to first use.
+
+Most processes (API, read worker, pipeline worker) only touch a handful of
+value object types, so building every schema at import time is wasted work.
+"""
@@ -0,0 +1,19 @@
+"""Reusable field constraints for value objects.
+
+Declared as ``Annotated`` metadata so pydantic-core enforces them natively
+instead of calling a Python validator for every instance.
+"""
+
+from typing import Annotated
+
+from pydantic import Field
+
+# pydantic-core's ``\s`` is Unicode White_Space, which leaves out the
+# \x1c-\x1f separators that ``str.isspace`` counts; excluding them too makes
+# this reject exactly the strings where ``not v.strip()``.
+NonBlankStr = Annotated[str, Field(pattern=r"[^\s\x1c-\x1f]")]
+"""A string with at least one non-whitespace character (stored unchanged).
+
+A blank value fails with pydantic's ``string_pattern_mismatch`` error rather
+than a field-specific "cannot be blank or empty" message.
+"""
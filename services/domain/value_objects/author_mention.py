@@ -1,5 +1,4 @@
-from pydantic import field_validator
-
+from domain.value_objects._constraints import NonBlankStr
 from domain.value_objects.extraction_metadata import ExtractionMetadata
 
 
@@ -10,18 +9,9 @@ class AuthorMention(ExtractionMetadata):
     about the extraction process.
     """
 
-    name: str
+    name: NonBlankStr
     """Extracted author name (required, cannot be blank)."""
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Validate that name is not blank or empty."""
-        if not v or not v.strip():
-            msg = "Author name cannot be blank or empty"
-            raise ValueError(msg)
-        return v
-
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, AuthorMention):
             return NotImplemented
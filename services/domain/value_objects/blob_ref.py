@@ -1,10 +1,12 @@
 from pydantic import BaseModel
 
+from domain.value_objects._config import VO_CONFIG
+
 
 class BlobRef(BaseModel):
     """Value object representing a reference to a blob stored in object storage."""
 
-    model_config = {"frozen": True}
+    model_config = VO_CONFIG
 
     key: str
     sha256: str
@@ -1,5 +1,7 @@
-from pydantic import ConfigDict, Field, field_validator
+from pydantic import Field
 
+from domain.value_objects._config import VO_CONFIG
+from domain.value_objects._constraints import NonBlankStr
 from domain.value_objects.extraction_metadata import ExtractionMetadata
 
 
@@ -14,9 +16,12 @@ class CompoundMention(ExtractionMetadata):
 
     """
 
-    model_config = ConfigDict(frozen=True)
+    model_config = VO_CONFIG
 
-    smiles: str = Field(..., description="SMILES notation string (required, cannot be blank)")
+    smiles: NonBlankStr = Field(
+        ...,
+        description="SMILES notation string (required, cannot be blank)",
+    )
     canonical_smiles: str | None = Field(None, description="Canonicalized SMILES representation")
     is_smiles_valid: bool | None = Field(
         None,
@@ -35,15 +40,6 @@ class CompoundMention(ExtractionMetadata):
         description="Primary chemical identifier as extracted from the document",
     )
 
-    @field_validator("smiles")
-    @classmethod
-    def validate_smiles(cls, v: str) -> str:
-        """Validate that SMILES is not blank or empty."""
-        if not v or not v.strip():
-            msg = "SMILES cannot be blank or empty"
-            raise ValueError(msg)
-        return v
-
     # Define a comparison method for easier testing and comparisons
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, CompoundMention):
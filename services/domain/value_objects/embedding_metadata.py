@@ -4,6 +4,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from domain.value_objects._config import VO_CONFIG
+
 
 class EmbeddingType(StrEnum):
     """Supported embedding types."""
@@ -21,7 +23,7 @@ class EmbeddingMetadata(BaseModel):
     aggregates focused on business logic, not storage concerns.
     """
 
-    model_config = {"frozen": True}
+    model_config = VO_CONFIG
 
     embedding_id: UUID
     """Reference to the embedding stored in the vector store."""
@@ -45,5 +47,9 @@ class EmbeddingMetadata(BaseModel):
         return self.embedding_id == other.embedding_id
 
     def __hash__(self) -> int:
-        """Hash based on embedding ID."""
-        return hash(self.embedding_id)
+        """Hash based on embedding ID.
+
+        Returns the UUID's integer directly; ``hash()`` reduces it to the same
+        value ``hash(self.embedding_id)`` gives, minus the ``UUID.__hash__`` call.
+        """
+        return self.embedding_id.int
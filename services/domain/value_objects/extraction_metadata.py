@@ -1,8 +1,12 @@
 import datetime
-from typing import Any
+from collections.abc import Iterable, Mapping
+from functools import cache
+from typing import Any, Self
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+from domain.value_objects._config import VO_CONFIG
 
 
 class ExtractionMetadata(BaseModel):
@@ -12,7 +16,7 @@ class ExtractionMetadata(BaseModel):
     including confidence scores, extraction timestamps, and model information.
     """
 
-    model_config = {"frozen": True}
+    model_config = VO_CONFIG
 
     confidence: float | None = Field(
         None,
@@ -36,3 +40,13 @@ class ExtractionMetadata(BaseModel):
         None,
         description="Identifier for the workflow run that produced this extraction",
     )
+
+    @classmethod
+    def validate_many(cls, rows: Iterable[Mapping[str, Any]]) -> list[Self]:
+        """Validate many mentions of this type in a single pydantic-core call."""
+        return _list_adapter(cls).validate_python(rows)
+
+
+@cache
+def _list_adapter(model: type[ExtractionMetadata]) -> TypeAdapter[list[Any]]:
+    return TypeAdapter(list[model])
@@ -11,3 +11,19 @@ class MimeType(StrEnum):
 
     DOC = "application/msword"
     DOCX = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+    @classmethod
+    def from_value(cls, value: str | None) -> "MimeType":
+        """Look up a member by its MIME string with a single dict access.
+
+        Skips the ``EnumType.__call__`` / ``_missing_`` machinery of ``MimeType(value)``
+        but raises the same ``ValueError`` for unsupported (or missing) values.
+        """
+        try:
+            return _BY_VALUE[value]
+        except KeyError:
+            msg = f"{value!r} is not a valid {cls.__name__}"
+            raise ValueError(msg) from None
+
+
+_BY_VALUE: dict[str, MimeType] = {member.value: member for member in MimeType}
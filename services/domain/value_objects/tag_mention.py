@@ -1,14 +1,16 @@
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 
+from domain.value_objects._config import VO_CONFIG
+from domain.value_objects._constraints import NonBlankStr
 from domain.value_objects.extraction_metadata import ExtractionMetadata
 
 
 class TagSource(BaseModel):
     """Provenance: which page contributed a tag to the artifact-level aggregate."""
 
-    model_config = {"frozen": True}
+    model_config = VO_CONFIG
 
     page_id: UUID
     page_index: int = Field(ge=0)
@@ -26,7 +28,7 @@ class TagMention(ExtractionMetadata):
     contributed each tag.
     """
 
-    tag: str
+    tag: NonBlankStr
     """Extracted tag content (required, cannot be blank)."""
 
     entity_type: str | None = None
@@ -46,15 +48,6 @@ class TagMention(ExtractionMetadata):
     page_count: int | None = None
     """Number of distinct pages where this tag was found."""
 
-    @field_validator("tag")
-    @classmethod
-    def validate_tag(cls, v: str) -> str:
-        """Validate that tag is not blank or empty."""
-        if not v or not v.strip():
-            msg = "Tag cannot be blank or empty"
-            raise ValueError(msg)
-        return v
-
     # Define a comparison method for easier testing and comparisons
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, TagMention):
@@ -1,7 +1,8 @@
-from pydantic import BaseModel, field_validator
+from dataclasses import dataclass
 
 
-class TextChunk(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TextChunk:
     """Represents a chunk of text extracted from a page for embedding.
 
     When page text is too long for an embedding model's context window,
@@ -11,6 +12,9 @@ class TextChunk(BaseModel):
     This value object is model-agnostic — chunking is done by character
     count, not tokens, so switching embedding models only requires
     changing configuration, not code.
+
+    Chunks are created in bulk for every embedded page and never persisted,
+    hence a slotted dataclass with a few checks instead of a Pydantic model.
     """
 
     chunk_index: int
@@ -28,29 +32,14 @@ class TextChunk(BaseModel):
     total_chunks: int
     """Total number of chunks the page was split into."""
 
-    @field_validator("text")
-    @classmethod
-    def validate_text_not_empty(cls, v: str) -> str:
-        """Ensure the chunk text is not empty."""
-        if not v or not v.strip():
+    def __post_init__(self) -> None:
+        """Ensure the chunk is non-empty and its position is valid."""
+        if not self.text or self.text.isspace():
             msg = "Chunk text cannot be empty"
             raise ValueError(msg)
-        return v
-
-    @field_validator("chunk_index")
-    @classmethod
-    def validate_chunk_index(cls, v: int) -> int:
-        """Ensure chunk index is non-negative."""
-        if v < 0:
+        if self.chunk_index < 0:
             msg = "Chunk index must be non-negative"
             raise ValueError(msg)
-        return v
-
-    @field_validator("total_chunks")
-    @classmethod
-    def validate_total_chunks(cls, v: int) -> int:
-        """Ensure total chunks is positive."""
-        if v < 1:
+        if self.total_chunks < 1:
             msg = "Total chunks must be at least 1"
             raise ValueError(msg)
-        return v
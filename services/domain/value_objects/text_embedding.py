@@ -1,25 +1,36 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import partial
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ValidationInfo, field_validator
+_utcnow = partial(datetime.now, UTC)
 
 
-class TextEmbedding(BaseModel):
+@dataclass(frozen=True, slots=True, eq=False)
+class TextEmbedding:
     """Represents a vector embedding of text content.
 
     This value object encapsulates the embedding vector and metadata
     about how it was generated, following domain-driven design principles.
     The actual vector is stored in the vector store, but this object
     provides domain context.
-    """
 
-    model_config = {"frozen": True}
+    A plain slotted dataclass rather than a Pydantic model: one is built per
+    embedded chunk and passed straight to the vector store, so the checks
+    below are all the validation it needs.
+    """
 
     embedding_id: UUID
     """Unique identifier for this embedding."""
 
-    vector: list[float]
-    """The embedding vector (dense numerical representation of text)."""
+    vector: Sequence[float]
+    """The embedding vector (dense numerical representation of text).
+
+    Generators pass the float32 array rows they get from the model as-is
+    rather than boxing every component into a Python float; any sequence of
+    floats is accepted. Use ``vector_list()`` where plain floats are required.
+    """
 
     model_name: str
     """Name of the model used to generate this embedding."""
@@ -27,37 +38,28 @@ class TextEmbedding(BaseModel):
     dimensions: int
     """Dimensionality of the embedding vector."""
 
-    generated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    generated_at: datetime = field(default_factory=_utcnow)
     """Timestamp when the embedding was generated."""
 
-    @field_validator("vector")
-    @classmethod
-    def validate_vector_not_empty(cls, v: list[float]) -> list[float]:
-        """Ensure the vector is not empty."""
-        if not v:
+    def __post_init__(self) -> None:
+        """Ensure the vector is non-empty, matches its dimensions, and has a model."""
+        if len(self.vector) == 0:
             msg = "Embedding vector cannot be empty"
             raise ValueError(msg)
-        return v
-
-    @field_validator("dimensions")
-    @classmethod
-    def validate_dimensions_match(cls, v: int, info: ValidationInfo) -> int:
-        """Ensure dimensions match the actual vector length."""
-        if "vector" in info.data:
-            actual_dims = len(info.data["vector"])
-            if v != actual_dims:
-                msg = f"Declared dimensions ({v}) don't match vector length ({actual_dims})"
-                raise ValueError(msg)
-        return v
-
-    @field_validator("model_name")
-    @classmethod
-    def validate_model_name(cls, v: str) -> str:
-        """Validate model name is not empty."""
-        if not v or not v.strip():
+        if self.dimensions != len(self.vector):
+            msg = (
+                f"Declared dimensions ({self.dimensions}) don't match vector length "
+                f"({len(self.vector)})"
+            )
+            raise ValueError(msg)
+        if not self.model_name or self.model_name.isspace():
             msg = "Model name cannot be empty"
             raise ValueError(msg)
-        return v
+
+    def vector_list(self) -> list[float]:
+        """Return the vector as a list of Python floats (e.g. for the Qdrant client)."""
+        tolist = getattr(self.vector, "tolist", None)
+        return tolist() if tolist is not None else list(self.vector)
 
     def __eq__(self, other: object) -> bool:
         """Compare embeddings by their ID."""
@@ -67,4 +69,4 @@ class TextEmbedding(BaseModel):
 
     def __hash__(self) -> int:
         """Hash based on embedding ID."""
-        return hash(self.embedding_id)
+        return self.embedding_id.int  # same hash as the UUID, without UUID.__hash__
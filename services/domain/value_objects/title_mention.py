@@ -1,5 +1,4 @@
-from pydantic import field_validator
-
+from domain.value_objects._constraints import NonBlankStr
 from domain.value_objects.extraction_metadata import ExtractionMetadata
 
 
@@ -11,18 +10,9 @@ class TitleMention(ExtractionMetadata):
 
     """
 
-    title: str
+    title: NonBlankStr
     """Extracted title content (required, cannot be blank)."""
 
-    @field_validator("title")
-    @classmethod
-    def validate_title(cls, v: str) -> str:
-        """Validate that title is not blank or empty."""
-        if not v or not v.strip():
-            msg = "Title cannot be blank or empty"
-            raise ValueError(msg)
-        return v
-
     # Define a comparison method for easier testing and comparisons
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, TitleMention):
@@ -1,10 +1,13 @@
 from datetime import UTC, datetime
 from uuid import UUID
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, model_validator
 
+from domain.value_objects._config import VO_CONFIG
 from domain.value_objects.workflow_state import WorkflowState
 
+_TERMINAL_STATES = frozenset({WorkflowState.COMPLETED, WorkflowState.FAILED})
+
 
 class WorkflowStatus(BaseModel):
     """Value object representing the state of a workflow run.
@@ -22,7 +25,7 @@ class WorkflowStatus(BaseModel):
     message: str | None = None
     """Optional message providing additional context about the workflow status."""
 
-    progress: float | None = None
+    progress: float | None = Field(default=None, ge=0.0, le=1.0)
     """Progress percentage (0.0 to 1.0). None if not applicable."""
 
     started_at: datetime | None = None
@@ -31,26 +34,19 @@ class WorkflowStatus(BaseModel):
     completed_at: datetime | None = None
     """Timestamp when the workflow run completed (success or failure)."""
 
-    @field_validator("progress")
-    @classmethod
-    def validate_progress(cls, v: float | None) -> float | None:
-        """Ensure progress is between 0.0 and 1.0 if provided."""
-        if v is not None and not (0.0 <= v <= 1.0):
-            msg = "progress must be between 0.0 and 1.0"
-            raise ValueError(msg)
-        return v
-
-    @field_validator("completed_at")
-    @classmethod
-    def validate_completion_times(cls, v: datetime | None, info: object) -> datetime | None:
+    @model_validator(mode="after")
+    def validate_completion_times(self) -> "WorkflowStatus":
         """Ensure completed_at >= started_at if both are provided."""
-        data = info.data
-        if v is not None and data.get("started_at") is not None and v < data["started_at"]:
+        if (
+            self.completed_at is not None
+            and self.started_at is not None
+            and self.completed_at < self.started_at
+        ):
             msg = "completed_at must be after or equal to started_at"
             raise ValueError(msg)
-        return v
+        return self
 
-    model_config = {"frozen": True}  # Immutable value object
+    model_config = VO_CONFIG
 
     # ========================================================================
     # STATE QUERY PROPERTIES
@@ -59,27 +55,27 @@ class WorkflowStatus(BaseModel):
     @property
     def is_pending(self) -> bool:
         """Check if workflow is in pending state."""
-        return self.state == WorkflowState.PENDING
+        return self.state is WorkflowState.PENDING
 
     @property
     def is_in_progress(self) -> bool:
         """Check if workflow is currently running."""
-        return self.state == WorkflowState.IN_PROGRESS
+        return self.state is WorkflowState.IN_PROGRESS
 
     @property
     def is_completed(self) -> bool:
         """Check if workflow finished successfully."""
-        return self.state == WorkflowState.COMPLETED
+        return self.state is WorkflowState.COMPLETED
 
     @property
     def is_failed(self) -> bool:
         """Check if workflow encountered an error."""
-        return self.state == WorkflowState.FAILED
+        return self.state is WorkflowState.FAILED
 
     @property
     def is_terminal(self) -> bool:
         """Check if workflow is in a terminal state (COMPLETED or FAILED)."""
-        return self.is_completed or self.is_failed
+        return self.state in _TERMINAL_STATES
 
     # ========================================================================
     # TIMING PROPERTIES
@@ -112,19 +108,17 @@ class WorkflowStatus(BaseModel):
         if elapsed is None:
             return None
 
-        hours = int(elapsed // 3600)
-        minutes = int((elapsed % 3600) // 60)
-        seconds = int(elapsed % 60)
+        hours, rest = divmod(int(elapsed), 3600)
+        minutes, seconds = divmod(rest, 60)
 
-        parts = []
+        # Zero components are omitted, except a lone "0s".
         if hours > 0:
-            parts.append(f"{hours}h")
+            minutes_part = f" {minutes}m" if minutes else ""
+            seconds_part = f" {seconds}s" if seconds else ""
+            return f"{hours}h{minutes_part}{seconds_part}"
         if minutes > 0:
-            parts.append(f"{minutes}m")
-        if seconds > 0 or not parts:
-            parts.append(f"{seconds}s")
-
-        return " ".join(parts)
+            return f"{minutes}m {seconds}s" if seconds else f"{minutes}m"
+        return f"{seconds}s"
 
     @property
     def progress_percentage(self) -> float:
@@ -148,8 +142,12 @@ class WorkflowStatus(BaseModel):
         message: str | None = None,
         workflow_id: UUID | None = None,
     ) -> "WorkflowStatus":
-        """Create a pending workflow status."""
-        return cls(
+        """Create a pending workflow status.
+
+        Nothing here can fail validation (no progress, no timestamps), so the
+        instance is built with ``model_construct``.
+        """
+        return cls.model_construct(
             state=WorkflowState.PENDING,
             message=message,
             workflow_id=workflow_id,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+import shutil
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
@@ -13,6 +14,37 @@ import fsspec
 
 from application.ports.blob_store import BlobStore, StoredBlob
 
+_COPY_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+class _TeeReader:
+    """Readable wrapper that copies every chunk read from ``source`` into ``sink``.
+
+    Lets ``hashlib.file_digest`` drive the upload: it reads into one reusable
+    buffer, so neither the hash nor the write allocates a ``bytes`` per chunk.
+    """
+
+    def __init__(self, source: BinaryIO, sink: BinaryIO) -> None:
+        self._source = source
+        self._sink = sink
+        self.size = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray) -> int:
+        readinto = getattr(self._source, "readinto", None)
+        if readinto is not None:
+            n = readinto(buffer) or 0
+        else:
+            data = self._source.read(len(buffer))
+            n = len(data)
+            buffer[:n] = data
+        if n:
+            self._sink.write(memoryview(buffer)[:n])
+            self.size += n
+        return n
+
 
 class FsspecBlobStore(BlobStore):
     def __init__(self, base_url: str, *, storage_options: dict | None = None) -> None:
@@ -25,19 +57,11 @@ class FsspecBlobStore(BlobStore):
     def put_stream(self, key: str, stream: BinaryIO, *, mime_type: str | None = None) -> StoredBlob:
         url = self._url(key)
 
-        h = hashlib.sha256()
-        size = 0
-
         with fsspec.open(url, "wb", **self.storage_options) as out:
-            while True:
-                chunk = stream.read(1024 * 1024)
-                if not chunk:
-                    break
-                out.write(chunk)
-                h.update(chunk)
-                size += len(chunk)
+            tee = _TeeReader(stream, out)
+            h = hashlib.file_digest(tee, "sha256")
 
-        return StoredBlob(key=key, size_bytes=size, sha256=h.hexdigest(), mime_type=mime_type)
+        return StoredBlob(key=key, size_bytes=tee.size, sha256=h.hexdigest(), mime_type=mime_type)
 
     def get_bytes(self, key: str) -> bytes:
         with fsspec.open(self._url(key), "rb", **self.storage_options) as f:
@@ -53,16 +77,17 @@ class FsspecBlobStore(BlobStore):
 
         Yields a Path that is valid within the context. Cleans up after.
         """
-        # Get blob content
-        content = self.get_bytes(key)
-
         # Create temporary file with appropriate extension
         suffix = Path(key).suffix or ".bin"
         temp_file = None
         try:
-            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-                tmp.write(content)
+            # Stream the blob into the file instead of holding it in memory first
+            with (
+                fsspec.open(self._url(key), "rb", **self.storage_options) as src,
+                tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp,
+            ):
                 temp_file = Path(tmp.name)
+                shutil.copyfileobj(src, tmp, _COPY_CHUNK_SIZE)
 
             yield temp_file
         finally:
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import math
 import threading
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import structlog
 from PIL import Image
@@ -12,35 +13,78 @@ from application.dtos.cser_dtos import CserCompoundResult
 from application.ports.cser_service import CserService
 
 if TYPE_CHECKING:
+    import fitz
+    from structflo.cser.pipeline import ChemPipeline
+
     from application.ports.blob_store import BlobStore
 
 logger = structlog.get_logger()
 
+# Long side of an A3 sheet in PDF points; larger pages are rendered in tiles.
+_A3_LONG_SIDE = 1191.0
+# Tiles overlap so a structure cut by one tile edge is whole in its neighbour.
+_TILE_OVERLAP = 0.15
+
+
+def _tile_spans(length: float, max_length: float, overlap: float) -> list[tuple[float, float]]:
+    """Split ``[0, length]`` into evenly spaced spans of at most ``max_length``.
+
+    Consecutive spans overlap by at least ``overlap * max_length``.
+    """
+    if length <= max_length:
+        return [(0.0, length)]
+    stride = max_length * (1 - overlap)
+    count = math.ceil((length - max_length) / stride) + 1
+    step = (length - max_length) / (count - 1)
+    return [(i * step, i * step + max_length) for i in range(count)]
+
 
 class CserPipelineService(CserService):
     """Wraps structflo ChemPipeline to implement the CserService port.
 
     Lazy-loads the ML pipeline on first use to avoid paying startup cost
-    until compound extraction is actually needed.
+    until compound extraction is actually needed. The pipeline is shared by
+    every instance in the process, so a new DI-resolved service does not
+    reload the models.
     """
 
-    def __init__(self, blob_store: BlobStore) -> None:
+    _pipeline: ClassVar[ChemPipeline | None] = None
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        blob_store: BlobStore,
+        render_zoom: float = 2.0,
+        max_tile_side: float = _A3_LONG_SIDE,
+    ) -> None:
         self._blob_store = blob_store
-        self._pipeline = None
-        self._lock = threading.Lock()
+        self._render_zoom = render_zoom
+        self._max_tile_side = max_tile_side
 
-    def _ensure_pipeline_loaded(self) -> None:
+    @classmethod
+    def _get_pipeline(cls) -> ChemPipeline:
         """Lazy-load the ChemPipeline (thread-safe double-check locking)."""
-        if self._pipeline is not None:
-            return
-        with self._lock:
-            if self._pipeline is not None:
-                return
-            from structflo.cser.pipeline import ChemPipeline
+        if cls._pipeline is None:
+            with cls._lock:
+                if cls._pipeline is None:
+                    from structflo.cser.pipeline import ChemPipeline
+
+                    logger.info("cser_pipeline_loading")
+                    cls._pipeline = ChemPipeline()
+                    logger.info("cser_pipeline_loaded")
+        return cls._pipeline
+
+    @classmethod
+    def prewarm(cls) -> None:
+        """Start loading the pipeline in a background thread."""
+
+        def warm() -> None:
+            try:
+                cls._get_pipeline()
+            except Exception:
+                logger.exception("cser_pipeline_prewarm_failed")
 
-            logger.info("cser_pipeline_loading")
-            self._pipeline = ChemPipeline()
-            logger.info("cser_pipeline_loaded")
+        threading.Thread(target=warm, name="cser-prewarm", daemon=True).start()
 
     def extract_compounds_from_pdf_page(
         self,
@@ -50,29 +94,47 @@ class CserPipelineService(CserService):
         """Render a PDF page to an image and run ChemPipeline on it."""
         import fitz  # PyMuPDF — already a project dependency
 
-        self._ensure_pipeline_loaded()
+        pipeline = self._get_pipeline()
 
-        logger.info(
+        logger.debug(
             "cser_extracting_compounds",
             storage_key=storage_key,
             page_index=page_index,
         )
 
-        with self._blob_store.get_file(storage_key) as pdf_path:
-            doc = fitz.open(pdf_path)
-            page = doc[page_index]
-            # 2x zoom gives ~144 dpi — good balance of quality vs. speed
-            mat = fitz.Matrix(2, 2)
-            pix = page.get_pixmap(matrix=mat)
-            image = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            doc.close()
-
-        pairs = self._pipeline.process(image)
+        # PyMuPDF opens the PDF straight from memory, without a temp-file copy on disk.
+        # The default 2x zoom gives ~144 dpi — good balance of quality vs. speed
+        mat = fitz.Matrix(self._render_zoom, self._render_zoom)
+        pdf_bytes = self._blob_store.get_bytes(storage_key)
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            images = self._render_page(doc[page_index], mat)
+
+        # ChemPipeline only takes one image per call, so tiles go through one by one.
+        pairs_per_image = [pipeline.process(image) for image in images]
+
+        if len(images) == 1:
+            pairs = pairs_per_image[0]
+        else:
+            # Deduplicate structures found in the overlap of neighbouring tiles,
+            # keeping the raw pair; DTOs are built once per surviving structure.
+            # Only tiled pages are deduplicated: distinct pairs on a single image
+            # are never merged.
+            best: dict[tuple[str | None, str | None], Any] = {}
+            for tile_pairs in pairs_per_image:
+                for pair in tile_pairs:
+                    key = (pair.smiles, pair.label_text)
+                    seen = best.get(key)
+                    if seen is None or (pair.match_confidence or 0.0) > (
+                        seen.match_confidence or 0.0
+                    ):
+                        best[key] = pair
+            pairs = list(best.values())
 
         logger.info(
             "cser_extraction_complete",
             storage_key=storage_key,
             page_index=page_index,
+            num_tiles=len(images),
             num_pairs=len(pairs),
         )
 
@@ -84,3 +146,20 @@ class CserPipelineService(CserService):
             )
             for pair in pairs
         ]
+
+    def _render_page(self, page: fitz.Page, mat: fitz.Matrix) -> list[Image.Image]:
+        """Render ``page`` through ``mat``, in tiles if it is larger than A3."""
+        import fitz
+
+        rect = page.rect
+        images = []
+        for y0, y1 in _tile_spans(rect.height, self._max_tile_side, _TILE_OVERLAP):
+            for x0, x1 in _tile_spans(rect.width, self._max_tile_side, _TILE_OVERLAP):
+                clip = fitz.Rect(rect.x0 + x0, rect.y0 + y0, rect.x0 + x1, rect.y0 + y1)
+                # Annotations never carry structures, so skip rendering them.
+                pix = page.get_pixmap(matrix=mat, clip=clip, alpha=False, annots=False)
+                # samples_mv is a view of the pixmap buffer; pix.samples would
+                # first copy it into a bytes object for frombytes to copy again.
+                images.append(Image.frombytes("RGB", (pix.width, pix.height), pix.samples_mv))
+                del pix
+        return images
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from eventsourcing.application import Application
-from lagom import Container
+from lagom import Container, Singleton
 from motor.motor_asyncio import AsyncIOMotorClient
 
 from application.ports.blob_store import BlobStore
@@ -123,6 +124,8 @@ from application.workflow_use_cases.trigger_resource_registration_use_case impor
 from application.workflow_use_cases.trigger_smiles_embedding_use_case import (
     TriggerSmilesEmbeddingUseCase,
 )
+from domain.aggregates.artifact import Artifact
+from domain.aggregates.page import Page
 from domain.value_objects.author_mention import AuthorMention
 from domain.value_objects.blob_ref import BlobRef
 from domain.value_objects.compound_mention import CompoundMention
@@ -134,49 +137,37 @@ from domain.value_objects.summary_candidate import SummaryCandidate
 from domain.value_objects.tag_mention import TagMention
 from domain.value_objects.text_mention import TextMention
 from domain.value_objects.title_mention import TitleMention
-from infrastructure.auth import sentinel
-from infrastructure.blob_stores.fsspec_blob_store import FsspecBlobStore
-from infrastructure.chemistry.rdkit_smiles_validator import RdkitSmilesValidator
-from infrastructure.config import settings
-from infrastructure.cser.cser_pipeline_service import CserPipelineService
+from infrastructure.config import get_settings
 from infrastructure.embeddings.chemberta_generator import ChemBertaEmbeddingGenerator
-from infrastructure.embeddings.sentence_transformer_generator import SentenceTransformerGenerator
-from infrastructure.embeddings.tfidf_sparse_generator import TfidfSparseGenerator
 from infrastructure.event_projectors.event_projector import EventProjector
-from infrastructure.event_sourced_repositories.artifact_repository import (
-    EventSourcedArtifactRepository,
-)
-from infrastructure.event_sourced_repositories.page_repository import EventSourcedPageRepository
+from infrastructure.event_sourced_repositories.aggregate_cache import aggregate_cache_env
 from infrastructure.file_services.docling_parser import DoclingParser
-from infrastructure.file_services.font_title_extractor import FontTitleExtractor
-from infrastructure.file_services.libreoffice_converter import LibreOfficeConverter
-from infrastructure.kafka.kafka_external_event_streamer import KafkaExternalEventPublisher
-from infrastructure.kafka.kafka_publisher import KafkaPublisher
-from infrastructure.llm.factory import (
-    create_chat_llm_client,
-    create_llm_client,
-    create_prompt_repository,
-    create_tool_calling_llm_client,
-)
-from infrastructure.ner.gliner2_extractor import GLiNER2Extractor
-from infrastructure.ner.structflo_ner_extractor import StructfloNERExtractor
-from infrastructure.permissions.sentinel_permission_registrar import SentinelPermissionRegistrar
 from infrastructure.read_repositories.mongo_read_model_materializer import (
     MongoReadModelMaterializer,
 )
-from infrastructure.read_repositories.mongo_read_repository import MongoReadRepository
-from infrastructure.read_repositories.mongo_workflow_status_cache import MongoWorkflowStatusCache
-from infrastructure.rerankers.cross_encoder_reranker import CrossEncoderReranker
 from infrastructure.serialization.pydantic_transcoder import PydanticTranscoding
-from infrastructure.temporal.caching_orchestrator import CachingWorkflowOrchestrator
-from infrastructure.temporal.orchestrator import TemporalWorkflowOrchestrator
-from infrastructure.text_chunkers.langchain_chunker import LangChainTextChunker
-from infrastructure.vector_stores.compound_qdrant_store import CompoundQdrantStore
-from infrastructure.vector_stores.qdrant_store import QdrantStore
-from infrastructure.vector_stores.summary_qdrant_store import SummaryQdrantStore
 
 if TYPE_CHECKING:
     from eventsourcing.persistence import JSONTranscoder
+    from eventsourcing.utils import EnvType
+
+
+# Stateless, so one set is shared by every Application instance.
+_PYDANTIC_TRANSCODINGS = tuple(
+    PydanticTranscoding(model_type)
+    for model_type in (
+        AuthorMention,
+        CompoundMention,
+        PresentationDate,
+        TitleMention,
+        SummaryCandidate,
+        TagMention,
+        TextMention,
+        ExtractionMetadata,
+        BlobRef,
+        EmbeddingMetadata,
+    )
+)
 
 
 class DocuStoreApplication(Application):
@@ -184,23 +175,84 @@ class DocuStoreApplication(Application):
 
     This allows registering custom transcodings for Pydantic models in the latest
     versions of the eventsourcing library.
+
+    Pages and artifacts are snapshotted every ``EVENTSTORE_SNAPSHOT_INTERVAL``
+    events, so rehydration replays the latest snapshot plus a bounded tail
+    instead of the aggregate's whole history. Up to
+    ``EVENTSTORE_AGGREGATE_CACHE_SIZE`` recently loaded aggregates are also
+    kept in eventsourcing's repository cache: a cached load only fetches and
+    applies events newer than the cached version (fast-forward) and hands
+    out a deep copy, so callers can't mutate the cached instance. Saves do
+    not populate the cache.
     """
 
+    def __init__(self, env: EnvType | None = None) -> None:
+        # Read here rather than in the class body so importing this module
+        # does not load the settings. eventsourcing only consults the class
+        # attribute to switch snapshotting on, which the env flag also does.
+        settings = get_settings()
+        interval = settings.eventstore_snapshot_interval
+        if interval > 0:
+            self.snapshotting_intervals = {Page: interval, Artifact: interval}  # type: ignore[misc]
+            env = {**(env or {}), "IS_SNAPSHOTTING_ENABLED": "y"}
+        if settings.eventstore_aggregate_cache_size > 0:
+            env = {
+                **(env or {}),
+                **aggregate_cache_env(settings.eventstore_aggregate_cache_size),
+            }
+        super().__init__(env)
+
     def register_transcodings(self, transcoder: JSONTranscoder) -> None:  # type: ignore[name-defined]
         super().register_transcodings(transcoder)
-        transcoder.register(PydanticTranscoding(AuthorMention))
-        transcoder.register(PydanticTranscoding(CompoundMention))
-        transcoder.register(PydanticTranscoding(PresentationDate))
-        transcoder.register(PydanticTranscoding(TitleMention))
-        transcoder.register(PydanticTranscoding(SummaryCandidate))
-        transcoder.register(PydanticTranscoding(TagMention))
-        transcoder.register(PydanticTranscoding(TextMention))
-        transcoder.register(PydanticTranscoding(ExtractionMetadata))
-        transcoder.register(PydanticTranscoding(BlobRef))
-        transcoder.register(PydanticTranscoding(EmbeddingMetadata))
+        for transcoding in _PYDANTIC_TRANSCODINGS:
+            transcoder.register(transcoding)
+
+
+@lru_cache(maxsize=1)
+def get_container() -> Container:
+    """Return the process-wide container, building it on first call."""
+    return create_container()
+
+
+def reset_container() -> None:
+    """Drop the cached container so the next ``get_container()`` builds a new one."""
+    get_container.cache_clear()
+
+
+async def warm_up_embedding_models(container: Container) -> None:
+    """Load both embedding models and run one encode through each.
+
+    Called at process startup so model loading and the first forward pass
+    (kernel selection, allocator growth) are not paid by the first request.
+    """
+    await container[EmbeddingGenerator].generate_text_embedding("warm-up")
+    await container[ChemBertaEmbeddingGenerator].generate_text_embedding("CCO")
 
 
 def create_container() -> Container:
+    """Build the application's DI container.
+
+    Adapters are imported here, next to their registration, rather than at
+    module level: importing this module stays cheap, and adapters that are
+    only registered behind a lambda (or behind a disabled feature flag) have
+    their client libraries imported on first resolution, if ever.
+    """
+    from infrastructure.blob_stores.fsspec_blob_store import FsspecBlobStore
+    from infrastructure.event_sourced_repositories.artifact_repository import (
+        EventSourcedArtifactRepository,
+    )
+    from infrastructure.event_sourced_repositories.page_repository import (
+        EventSourcedPageRepository,
+    )
+    from infrastructure.llm.factory import (
+        create_chat_llm_client,
+        create_llm_client,
+        create_prompt_repository,
+        create_tool_calling_llm_client,
+    )
+    from infrastructure.read_repositories.mongo_read_repository import MongoReadRepository
+
+    settings = get_settings()
     container = Container()
 
     # Initialize our custom Application subclass
@@ -229,41 +281,54 @@ def create_container() -> Container:
     )
     container[BlobStore] = blob_store_instance
 
-    # Register Kafka Publisher
-    kafka_publisher_instance = (
-        KafkaPublisher() if settings.enable_external_event_streaming else None
-    )
-    if kafka_publisher_instance:
-        # Initialize the Kafka publisher connection in a sync context
-        # The connect() method will be called asynchronously when first used
-        container[KafkaPublisher] = kafka_publisher_instance
-
-    # Register Kafka External Event Publisher
+    # Register Kafka Publisher and External Event Publisher
     # Infrastructure - Notifications
     if settings.enable_external_event_streaming:
-        container[ExternalEventPublisher] = lambda c: KafkaExternalEventPublisher(
-            publisher=c[KafkaPublisher],
+        from infrastructure.kafka.kafka_external_event_streamer import (
+            KafkaExternalEventPublisher,
+        )
+        from infrastructure.kafka.kafka_publisher import KafkaPublisher
+
+        # The librdkafka producer (and its broker connections) is created on
+        # first resolution; connect() starts delivery polling on first publish.
+        container[KafkaPublisher] = Singleton(lambda _: KafkaPublisher())
+        container[ExternalEventPublisher] = Singleton(
+            lambda c: KafkaExternalEventPublisher(publisher=c[KafkaPublisher]),
         )
     else:
         container[ExternalEventPublisher] = lambda _: None  # type: ignore[return-value]
 
     # Register Read Model Infrastructure
-    container[MongoReadModelMaterializer] = lambda _: MongoReadModelMaterializer()
+    container[MongoReadModelMaterializer] = Singleton(lambda _: MongoReadModelMaterializer())
     container[EventProjector] = lambda c: EventProjector(
         materializer=c[MongoReadModelMaterializer],
     )
 
     # Register MongoDB Client and Read Repository
+    # One client (one connection pool and set of monitor threads) shared by
+    # every read store; a client per resolution would open its own pool.
     def mongo_client_factory(_: object) -> AsyncIOMotorClient:
-        return AsyncIOMotorClient(settings.mongo_uri)
+        return AsyncIOMotorClient(
+            settings.mongo_uri,
+            maxPoolSize=settings.mongo_max_pool_size,
+            minPoolSize=settings.mongo_min_pool_size,
+            serverSelectionTimeoutMS=settings.mongo_server_selection_timeout_ms,
+        )
 
-    container[AsyncIOMotorClient] = mongo_client_factory
+    container[AsyncIOMotorClient] = Singleton(mongo_client_factory)
 
-    def mongo_repository_factory(c: object) -> MongoReadRepository:
-        return MongoReadRepository(
+    # The Mongo stores only hold collection handles on the shared client, so
+    # each is built once and every port it implements resolves to that one
+    # instance.
+    container[MongoReadRepository] = Singleton(
+        lambda c: MongoReadRepository(
             client=c[AsyncIOMotorClient],
             settings=settings,
-        )
+        ),
+    )
+
+    def mongo_repository_factory(c: Container) -> MongoReadRepository:
+        return c[MongoReadRepository]
 
     container[PageReadModel] = mongo_repository_factory
     container[ArtifactReadModel] = mongo_repository_factory
@@ -283,11 +348,15 @@ def create_container() -> Container:
     from application.ports.repositories.user_preferences_store import UserPreferencesStore
     from infrastructure.read_repositories.mongo_user_store import MongoUserStore
 
-    def user_store_factory(c: object) -> MongoUserStore:
-        return MongoUserStore(
+    container[MongoUserStore] = Singleton(
+        lambda c: MongoUserStore(
             client=c[AsyncIOMotorClient],
             settings=settings,
-        )
+        ),
+    )
+
+    def user_store_factory(c: Container) -> MongoUserStore:
+        return c[MongoUserStore]
 
     container[UserPreferencesStore] = user_store_factory
     container[UserActivityStore] = user_store_factory
@@ -297,109 +366,191 @@ def create_container() -> Container:
         MongoAnalyticsStore,
     )
 
-    container[AnalyticsReadModel] = lambda c: MongoAnalyticsStore(
-        client=c[AsyncIOMotorClient],
-        db_name=settings.mongo_db,
-        artifacts_collection_name=settings.mongo_artifacts_collection,
+    container[AnalyticsReadModel] = Singleton(
+        lambda c: MongoAnalyticsStore(
+            client=c[AsyncIOMotorClient],
+            db_name=settings.mongo_db,
+            artifacts_collection_name=settings.mongo_artifacts_collection,
+        ),
     )
 
     # Register Workflow Status Cache (MongoDB)
-    container[WorkflowStatusCache] = lambda c: MongoWorkflowStatusCache(
-        client=c[AsyncIOMotorClient],
-        db_name=settings.mongo_db,
+    from infrastructure.read_repositories.mongo_workflow_status_cache import (
+        MongoWorkflowStatusCache,
     )
 
-    # Register Pipeline Orchestrator (Temporal + caching decorator)
-    container[WorkflowOrchestrator] = lambda c: CachingWorkflowOrchestrator(
-        inner=TemporalWorkflowOrchestrator(),
-        cache=c[WorkflowStatusCache],
+    container[WorkflowStatusCache] = Singleton(
+        lambda c: MongoWorkflowStatusCache(
+            client=c[AsyncIOMotorClient],
+            db_name=settings.mongo_db,
+        ),
     )
 
+    # Register Pipeline Orchestrator (Temporal + caching decorator)
+    def workflow_orchestrator_factory(c: object) -> WorkflowOrchestrator:
+        from infrastructure.temporal.caching_orchestrator import CachingWorkflowOrchestrator
+        from infrastructure.temporal.orchestrator import TemporalWorkflowOrchestrator
+
+        return CachingWorkflowOrchestrator(
+            inner=TemporalWorkflowOrchestrator(),
+            cache=c[WorkflowStatusCache],
+        )
+
+    container[WorkflowOrchestrator] = Singleton(workflow_orchestrator_factory)
+
     # Permission Registrar (Sentinel entity-level permissions)
-    container[PermissionRegistrar] = lambda _: SentinelPermissionRegistrar(sentinel.permissions)
-    container[TriggerResourceRegistrationUseCase] = lambda c: TriggerResourceRegistrationUseCase(
-        permission_registrar=c[PermissionRegistrar],
+    def permission_registrar_factory(_: object) -> PermissionRegistrar:
+        # infrastructure.auth builds the Sentinel client on import
+        from infrastructure.auth import sentinel
+        from infrastructure.permissions.sentinel_permission_registrar import (
+            SentinelPermissionRegistrar,
+        )
+
+        return SentinelPermissionRegistrar(sentinel.permissions)
+
+    container[PermissionRegistrar] = Singleton(permission_registrar_factory)
+    container[TriggerResourceRegistrationUseCase] = Singleton(
+        lambda c: TriggerResourceRegistrationUseCase(
+            permission_registrar=c[PermissionRegistrar],
+        ),
     )
 
     # Register Docling Parser (document parsing — PDF → structured IR + page images)
-    container[DoclingParser] = lambda c: DoclingParser(blob_store=c[BlobStore])
+    container[DoclingParser] = Singleton(lambda c: DoclingParser(blob_store=c[BlobStore]))
+
+    from infrastructure.chemistry.rdkit_smiles_validator import RdkitSmilesValidator
+    from infrastructure.file_services.font_title_extractor import FontTitleExtractor
+    from infrastructure.file_services.libreoffice_converter import LibreOfficeConverter
+    from infrastructure.ner.gliner2_extractor import GLiNER2Extractor
+    from infrastructure.ner.structflo_ner_extractor import StructfloNERExtractor
 
     # Register Office→PDF converter (PPTX/DOCX → PDF, so they reuse the PDF pipeline)
-    container[OfficeToPdfConverter] = lambda c: LibreOfficeConverter(blob_store=c[BlobStore])
+    container[OfficeToPdfConverter] = Singleton(
+        lambda c: LibreOfficeConverter(blob_store=c[BlobStore]),
+    )
 
     # Register CSER Service
-    container[CserService] = lambda c: CserPipelineService(blob_store=c[BlobStore])
+    def cser_service_factory(c: object) -> CserService:
+        from infrastructure.cser.cser_pipeline_service import CserPipelineService
+
+        return CserPipelineService(
+            blob_store=c[BlobStore],
+            render_zoom=settings.cser_render_zoom,
+            max_tile_side=settings.cser_max_tile_side,
+        )
+
+    container[CserService] = Singleton(cser_service_factory)
 
     # Register Title Extractor (font-based, PyMuPDF)
-    container[TitleExtractorPort] = lambda _: FontTitleExtractor()
+    container[TitleExtractorPort] = Singleton(lambda _: FontTitleExtractor())
 
     # Register Structured Extractor (GLiNER2 — document metadata)
-    container[StructuredExtractorPort] = lambda _: GLiNER2Extractor(
-        model_name=settings.gliner2_model_name,
+    container[StructuredExtractorPort] = Singleton(
+        lambda _: GLiNER2Extractor(model_name=settings.gliner2_model_name),
     )
 
     # Register NER Extractor (dual-mode: fast + LLM, reuses configured LLM settings)
-    container[NERExtractorPort] = lambda _: StructfloNERExtractor(
-        model_id=settings.llm_model_name,
-        model_url=settings.llm_base_url,
-        max_char_buffer=settings.ner_max_char_buffer,
+    container[NERExtractorPort] = Singleton(
+        lambda _: StructfloNERExtractor(
+            model_id=settings.llm_model_name,
+            model_url=settings.llm_base_url,
+            max_char_buffer=settings.ner_max_char_buffer,
+        ),
     )
 
     # Register SMILES Validator
-    container[SmilesValidator] = lambda _: RdkitSmilesValidator()
+    container[SmilesValidator] = Singleton(lambda _: RdkitSmilesValidator())
+
+    # Embedding models, vector stores and the chunker are built on first
+    # resolution: constructing the sentence-transformers generator imports
+    # torch, and the stores import qdrant_client, which a worker that never
+    # resolves them should not pay for at startup.
 
     # Embedding Generator (singleton — model loaded once, reused across requests)
-    embedding_generator_instance = SentenceTransformerGenerator(
-        model_name=settings.embedding_model_name,
-        device=settings.embedding_device,
-        query_prefix=settings.embedding_query_prefix,
-        document_prefix=settings.embedding_document_prefix,
-    )
-    container[EmbeddingGenerator] = embedding_generator_instance
+    def embedding_generator_factory(_: object) -> EmbeddingGenerator:
+        from infrastructure.embeddings.sentence_transformer_generator import (
+            SentenceTransformerGenerator,
+        )
+
+        return SentenceTransformerGenerator(
+            model_name=settings.embedding_model_name,
+            device=settings.embedding_device,
+            backend=settings.embedding_backend,
+            precision=settings.embedding_precision,
+            compile_model=settings.embedding_compile,
+            onnx_cache_dir=settings.embedding_onnx_cache_dir,
+            onnx_quantization=settings.embedding_onnx_quantization,
+            query_prefix=settings.embedding_query_prefix,
+            document_prefix=settings.embedding_document_prefix,
+        )
+
+    container[EmbeddingGenerator] = Singleton(embedding_generator_factory)
 
     # Vector Store (text embeddings — page chunks)
-    vector_store_instance = QdrantStore(
-        url=settings.qdrant_url,
-        api_key=settings.qdrant_api_key,
-        collection_name=settings.qdrant_collection_name,
-        vector_size=settings.embedding_dimensions,
-    )
-    container[VectorStore] = vector_store_instance
+    def vector_store_factory(_: object) -> VectorStore:
+        from infrastructure.vector_stores.qdrant_store import QdrantStore
+
+        return QdrantStore(
+            url=settings.qdrant_url,
+            api_key=settings.qdrant_api_key,
+            collection_name=settings.qdrant_collection_name,
+            vector_size=settings.embedding_dimensions,
+        )
+
+    container[VectorStore] = Singleton(vector_store_factory)
 
     # Compound Vector Store (SMILES embeddings — ChemBERTa)
-    compound_vector_store_instance = CompoundQdrantStore(
-        url=settings.qdrant_url,
-        api_key=settings.qdrant_api_key,
-        collection_name=settings.qdrant_compound_collection_name,
-    )
-    container[CompoundVectorStore] = compound_vector_store_instance
+    def compound_vector_store_factory(_: object) -> CompoundVectorStore:
+        from infrastructure.vector_stores.compound_qdrant_store import CompoundQdrantStore
+
+        return CompoundQdrantStore(
+            url=settings.qdrant_url,
+            api_key=settings.qdrant_api_key,
+            collection_name=settings.qdrant_compound_collection_name,
+        )
+
+    container[CompoundVectorStore] = Singleton(compound_vector_store_factory)
 
     # Summary Vector Store (page + artifact summary embeddings)
-    summary_vector_store_instance = SummaryQdrantStore(
-        url=settings.qdrant_url,
-        api_key=settings.qdrant_api_key,
-        collection_name=settings.qdrant_summary_collection_name,
-        vector_size=settings.embedding_dimensions,
-    )
-    container[SummaryVectorStore] = summary_vector_store_instance
+    def summary_vector_store_factory(_: object) -> SummaryVectorStore:
+        from infrastructure.vector_stores.summary_qdrant_store import SummaryQdrantStore
+
+        return SummaryQdrantStore(
+            url=settings.qdrant_url,
+            api_key=settings.qdrant_api_key,
+            collection_name=settings.qdrant_summary_collection_name,
+            vector_size=settings.embedding_dimensions,
+        )
+
+    container[SummaryVectorStore] = Singleton(summary_vector_store_factory)
 
     # ChemBERTa embedding generator (SMILES) — singleton
     chemberta_instance = ChemBertaEmbeddingGenerator(
         model_name=settings.smiles_embedding_model_name,
         device=settings.smiles_embedding_device,
+        precision=settings.smiles_embedding_precision,
+        cache_size=settings.smiles_embedding_cache_size,
+        coalesce_ms=settings.smiles_embedding_coalesce_ms,
+        compile_model=settings.smiles_embedding_compile,
     )
     container[ChemBertaEmbeddingGenerator] = chemberta_instance
 
     # Text Chunker — singleton (stateless, no model)
-    text_chunker_instance = LangChainTextChunker(
-        chunk_size=settings.chunk_size,
-        chunk_overlap=settings.chunk_overlap,
-    )
-    container[TextChunker] = text_chunker_instance
+    def text_chunker_factory(_: object) -> TextChunker:
+        from infrastructure.text_chunkers.langchain_chunker import LangChainTextChunker
+
+        return LangChainTextChunker(
+            chunk_size=settings.chunk_size,
+            chunk_overlap=settings.chunk_overlap,
+        )
+
+    container[TextChunker] = Singleton(text_chunker_factory)
 
     # Sparse Embedding Generator (hashing-based for hybrid search)
     # Only wired when SPARSE_ENCODING_ENABLED=true (ablation config 10)
     if settings.sparse_encoding_enabled:
+        from infrastructure.embeddings.tfidf_sparse_generator import TfidfSparseGenerator
+
         sparse_generator_instance = TfidfSparseGenerator()
         container[SparseEmbeddingGenerator] = sparse_generator_instance
     else:
@@ -407,6 +558,8 @@ def create_container() -> Container:
 
     # Cross-encoder reranker (Stage 2 — reranks retrieval candidates) — singleton
     if settings.reranker_enabled:
+        from infrastructure.rerankers.cross_encoder_reranker import CrossEncoderReranker
+
         reranker_instance = CrossEncoderReranker(
             model_name=settings.reranker_model_name,
             device=settings.reranker_device,
@@ -417,225 +570,292 @@ def create_container() -> Container:
 
     # Register Use Cases
     # Page Use Cases
-    container[CreatePageUseCase] = lambda c: CreatePageUseCase(
-        page_repository=c[PageRepository],
-        artifact_repository=c[ArtifactRepository],
-        external_event_publisher=c[ExternalEventPublisher],
+    container[CreatePageUseCase] = Singleton(
+        lambda c: CreatePageUseCase(
+            page_repository=c[PageRepository],
+            artifact_repository=c[ArtifactRepository],
+            external_event_publisher=c[ExternalEventPublisher],
+        ),
     )
-    container[AddCompoundMentionsUseCase] = lambda c: AddCompoundMentionsUseCase(
-        page_repository=c[PageRepository],
-        external_event_publisher=c[ExternalEventPublisher],
+    container[AddCompoundMentionsUseCase] = Singleton(
+        lambda c: AddCompoundMentionsUseCase(
+            page_repository=c[PageRepository],
+            external_event_publisher=c[ExternalEventPublisher],
+        ),
     )
-    container[UpdateTagMentionsUseCase] = lambda c: UpdateTagMentionsUseCase(
-        page_repository=c[PageRepository],
-        external_event_publisher=c[ExternalEventPublisher],
+    container[UpdateTagMentionsUseCase] = Singleton(
+        lambda c: UpdateTagMentionsUseCase(
+            page_repository=c[PageRepository],
+            external_event_publisher=c[ExternalEventPublisher],
+        ),
     )
-    container[UpdateTextMentionUseCase] = lambda c: UpdateTextMentionUseCase(
-        page_repository=c[PageRepository],
-        external_event_publisher=c[ExternalEventPublisher],
+    container[UpdateTextMentionUseCase] = Singleton(
+        lambda c: UpdateTextMentionUseCase(
+            page_repository=c[PageRepository],
+            external_event_publisher=c[ExternalEventPublisher],
+        ),
     )
-    container[UpdatePageSummaryCandidateUseCase] = lambda c: UpdatePageSummaryCandidateUseCase(
-        page_repository=c[PageRepository],
-        external_event_publisher=c[ExternalEventPublisher],
+    container[UpdatePageSummaryCandidateUseCase] = Singleton(
+        lambda c: UpdatePageSummaryCandidateUseCase(
+            page_repository=c[PageRepository],
+            external_event_publisher=c[ExternalEventPublisher],
+        ),
     )
-    container[DeletePageUseCase] = lambda c: DeletePageUseCase(
-        page_repository=c[PageRepository],
-        artifact_repository=c[ArtifactRepository],
-        external_event_publisher=c[ExternalEventPublisher],
+    container[DeletePageUseCase] = Singleton(
+        lambda c: DeletePageUseCase(
+            page_repository=c[PageRepository],
+            artifact_repository=c[ArtifactRepository],
+            external_event_publisher=c[ExternalEventPublisher],
+        ),
     )
 
     # Embedding Use Cases
-    container[GeneratePageEmbeddingUseCase] = lambda c: GeneratePageEmbeddingUseCase(
-        page_repository=c[PageRepository],
-        embedding_generator=c[EmbeddingGenerator],
-        vector_store=c[VectorStore],
-        text_chunker=c[TextChunker],
-        sparse_embedding_generator=c[SparseEmbeddingGenerator],
-        artifact_repository=c[ArtifactRepository],
-        blob_store=c[BlobStore],
+    container[GeneratePageEmbeddingUseCase] = Singleton(
+        lambda c: GeneratePageEmbeddingUseCase(
+            page_repository=c[PageRepository],
+            embedding_generator=c[EmbeddingGenerator],
+            vector_store=c[VectorStore],
+            text_chunker=c[TextChunker],
+            sparse_embedding_generator=c[SparseEmbeddingGenerator],
+            artifact_repository=c[ArtifactRepository],
+            blob_store=c[BlobStore],
+        ),
     )
 
-    container[SearchSimilarPagesUseCase] = lambda c: SearchSimilarPagesUseCase(
-        embedding_generator=c[EmbeddingGenerator],
-        vector_store=c[VectorStore],
-        page_read_model=c[PageReadModel],
-        artifact_read_model=c[ArtifactReadModel],
-        sparse_embedding_generator=c[SparseEmbeddingGenerator],
-        reranker=c[Reranker],
+    container[SearchSimilarPagesUseCase] = Singleton(
+        lambda c: SearchSimilarPagesUseCase(
+            embedding_generator=c[EmbeddingGenerator],
+            vector_store=c[VectorStore],
+            page_read_model=c[PageReadModel],
+            artifact_read_model=c[ArtifactReadModel],
+            sparse_embedding_generator=c[SparseEmbeddingGenerator],
+            reranker=c[Reranker],
+        ),
     )
 
     # Artifact Use Cases
-    container[CreateArtifactUseCase] = lambda c: CreateArtifactUseCase(
-        artifact_repository=c[ArtifactRepository],
-        external_event_publisher=c[ExternalEventPublisher],
+    container[CreateArtifactUseCase] = Singleton(
+        lambda c: CreateArtifactUseCase(
+            artifact_repository=c[ArtifactRepository],
+            external_event_publisher=c[ExternalEventPublisher],
+        ),
     )
-    container[AddPagesUseCase] = lambda c: AddPagesUseCase(
-        artifact_repository=c[ArtifactRepository],
-        page_repository=c[PageRepository],
-        external_event_publisher=c[ExternalEventPublisher],
+    container[AddPagesUseCase] = Singleton(
+        lambda c: AddPagesUseCase(
+            artifact_repository=c[ArtifactRepository],
+            page_repository=c[PageRepository],
+            external_event_publisher=c[ExternalEventPublisher],
+        ),
     )
-    container[RemovePagesUseCase] = lambda c: RemovePagesUseCase(
-        artifact_repository=c[ArtifactRepository],
-        external_event_publisher=c[ExternalEventPublisher],
+    container[RemovePagesUseCase] = Singleton(
+        lambda c: RemovePagesUseCase(
+            artifact_repository=c[ArtifactRepository],
+            external_event_publisher=c[ExternalEventPublisher],
+        ),
     )
-    container[UpdateTitleMentionUseCase] = lambda c: UpdateTitleMentionUseCase(
-        artifact_repository=c[ArtifactRepository],
-        external_event_publisher=c[ExternalEventPublisher],
+    container[UpdateTitleMentionUseCase] = Singleton(
+        lambda c: UpdateTitleMentionUseCase(
+            artifact_repository=c[ArtifactRepository],
+            external_event_publisher=c[ExternalEventPublisher],
+        ),
     )
-    container[UpdateArtifactSummaryCandidateUseCase] = (
+    container[UpdateArtifactSummaryCandidateUseCase] = Singleton(
         lambda c: UpdateArtifactSummaryCandidateUseCase(
             artifact_repository=c[ArtifactRepository],
             external_event_publisher=c[ExternalEventPublisher],
-        )
+        ),
     )
-    container[UpdateArtifactTagMentionsUseCase] = lambda c: UpdateArtifactTagMentionsUseCase(
-        artifact_repository=c[ArtifactRepository],
-        external_event_publisher=c[ExternalEventPublisher],
+    container[UpdateArtifactTagMentionsUseCase] = Singleton(
+        lambda c: UpdateArtifactTagMentionsUseCase(
+            artifact_repository=c[ArtifactRepository],
+            external_event_publisher=c[ExternalEventPublisher],
+        ),
     )
-    container[DeleteArtifactUseCase] = lambda c: DeleteArtifactUseCase(
-        artifact_repository=c[ArtifactRepository],
-        page_repository=c[PageRepository],
-        external_event_publisher=c[ExternalEventPublisher],
-        vector_store=c[VectorStore],
-        compound_vector_store=c[CompoundVectorStore],
-        summary_vector_store=c[SummaryVectorStore],
-        blob_store=c[BlobStore],
-        permission_registrar=c[PermissionRegistrar],
+    container[DeleteArtifactUseCase] = Singleton(
+        lambda c: DeleteArtifactUseCase(
+            artifact_repository=c[ArtifactRepository],
+            page_repository=c[PageRepository],
+            external_event_publisher=c[ExternalEventPublisher],
+            vector_store=c[VectorStore],
+            compound_vector_store=c[CompoundVectorStore],
+            summary_vector_store=c[SummaryVectorStore],
+            blob_store=c[BlobStore],
+            permission_registrar=c[PermissionRegistrar],
+        ),
     )
 
-    container[UploadBlobUseCase] = lambda c: UploadBlobUseCase(
-        blob_store=c[BlobStore],
+    container[UploadBlobUseCase] = Singleton(
+        lambda c: UploadBlobUseCase(
+            blob_store=c[BlobStore],
+        ),
     )
 
     # Register Sagas
-    container[ArtifactUploadSaga] = lambda c: ArtifactUploadSaga(
-        upload_blob_use_case=c[UploadBlobUseCase],
-        create_artifact_use_case=c[CreateArtifactUseCase],
-        permission_registrar=c[PermissionRegistrar],
+    container[ArtifactUploadSaga] = Singleton(
+        lambda c: ArtifactUploadSaga(
+            upload_blob_use_case=c[UploadBlobUseCase],
+            create_artifact_use_case=c[CreateArtifactUseCase],
+            permission_registrar=c[PermissionRegistrar],
+        ),
     )
 
     # NER Extraction Use Cases
-    container[ExtractPageEntitiesUseCase] = lambda c: ExtractPageEntitiesUseCase(
-        page_repository=c[PageRepository],
-        artifact_repository=c[ArtifactRepository],
-        ner_extractor=c[NERExtractorPort],
-        external_event_publisher=c[ExternalEventPublisher],
+    container[ExtractPageEntitiesUseCase] = Singleton(
+        lambda c: ExtractPageEntitiesUseCase(
+            page_repository=c[PageRepository],
+            artifact_repository=c[ArtifactRepository],
+            ner_extractor=c[NERExtractorPort],
+            external_event_publisher=c[ExternalEventPublisher],
+        ),
     )
-    container[AggregateArtifactTagsUseCase] = lambda c: AggregateArtifactTagsUseCase(
-        artifact_repository=c[ArtifactRepository],
-        page_repository=c[PageRepository],
-        external_event_publisher=c[ExternalEventPublisher],
+    container[AggregateArtifactTagsUseCase] = Singleton(
+        lambda c: AggregateArtifactTagsUseCase(
+            artifact_repository=c[ArtifactRepository],
+            page_repository=c[PageRepository],
+            external_event_publisher=c[ExternalEventPublisher],
+        ),
     )
-    container[TriggerNERExtractionUseCase] = lambda c: TriggerNERExtractionUseCase(
-        workflow_orchestrator=c[WorkflowOrchestrator],
+    container[TriggerNERExtractionUseCase] = Singleton(
+        lambda c: TriggerNERExtractionUseCase(
+            workflow_orchestrator=c[WorkflowOrchestrator],
+        ),
     )
 
     # Document Metadata Extraction Use Cases
-    container[ExtractDocumentMetadataUseCase] = lambda c: ExtractDocumentMetadataUseCase(
-        page_repository=c[PageRepository],
-        artifact_repository=c[ArtifactRepository],
-        structured_extractor=c[StructuredExtractorPort],
-        llm_client=c[LLMClientPort],
-        prompt_repository=c[PromptRepositoryPort],
-        title_extractor=c[TitleExtractorPort],
-        blob_store=c[BlobStore],
-        external_event_publisher=c[ExternalEventPublisher],
+    container[ExtractDocumentMetadataUseCase] = Singleton(
+        lambda c: ExtractDocumentMetadataUseCase(
+            page_repository=c[PageRepository],
+            artifact_repository=c[ArtifactRepository],
+            structured_extractor=c[StructuredExtractorPort],
+            llm_client=c[LLMClientPort],
+            prompt_repository=c[PromptRepositoryPort],
+            title_extractor=c[TitleExtractorPort],
+            blob_store=c[BlobStore],
+            external_event_publisher=c[ExternalEventPublisher],
+        ),
     )
-    container[TriggerDocMetadataExtractionUseCase] = lambda c: TriggerDocMetadataExtractionUseCase(
-        page_repository=c[PageRepository],
-        workflow_orchestrator=c[WorkflowOrchestrator],
+    container[TriggerDocMetadataExtractionUseCase] = Singleton(
+        lambda c: TriggerDocMetadataExtractionUseCase(
+            page_repository=c[PageRepository],
+            workflow_orchestrator=c[WorkflowOrchestrator],
+        ),
     )
-    container[TriggerArtifactTagAggregationUseCase] = (
+    container[TriggerArtifactTagAggregationUseCase] = Singleton(
         lambda c: TriggerArtifactTagAggregationUseCase(
             workflow_orchestrator=c[WorkflowOrchestrator],
-        )
+        ),
     )
 
     # Compound Extraction Use Case
-    container[ExtractCompoundMentionsUseCase] = lambda c: ExtractCompoundMentionsUseCase(
-        page_repository=c[PageRepository],
-        artifact_repository=c[ArtifactRepository],
-        cser_service=c[CserService],
-        smiles_validator=c[SmilesValidator],
-        external_event_publisher=c[ExternalEventPublisher],
+    container[ExtractCompoundMentionsUseCase] = Singleton(
+        lambda c: ExtractCompoundMentionsUseCase(
+            page_repository=c[PageRepository],
+            artifact_repository=c[ArtifactRepository],
+            cser_service=c[CserService],
+            smiles_validator=c[SmilesValidator],
+            external_event_publisher=c[ExternalEventPublisher],
+        ),
     )
 
     # SMILES Embedding Use Case
-    container[EmbedCompoundSmilesUseCase] = lambda c: EmbedCompoundSmilesUseCase(
-        page_repository=c[PageRepository],
-        smiles_embedding_generator=c[ChemBertaEmbeddingGenerator],
-        compound_vector_store=c[CompoundVectorStore],
+    container[EmbedCompoundSmilesUseCase] = Singleton(
+        lambda c: EmbedCompoundSmilesUseCase(
+            page_repository=c[PageRepository],
+            smiles_embedding_generator=c[ChemBertaEmbeddingGenerator],
+            compound_vector_store=c[CompoundVectorStore],
+        ),
     )
 
     # SMILES Search Use Case
-    container[SearchSimilarCompoundsUseCase] = lambda c: SearchSimilarCompoundsUseCase(
-        smiles_embedding_generator=c[ChemBertaEmbeddingGenerator],
-        compound_vector_store=c[CompoundVectorStore],
-        artifact_read_model=c[ArtifactReadModel],
-        smiles_validator=c[SmilesValidator],
+    container[SearchSimilarCompoundsUseCase] = Singleton(
+        lambda c: SearchSimilarCompoundsUseCase(
+            smiles_embedding_generator=c[ChemBertaEmbeddingGenerator],
+            compound_vector_store=c[CompoundVectorStore],
+            artifact_read_model=c[ArtifactReadModel],
+            smiles_validator=c[SmilesValidator],
+        ),
     )
 
     # Artifact Parse Use Cases
-    container[ParseArtifactUseCase] = lambda c: ParseArtifactUseCase(
-        # PPTX/DOCX are converted to PDF first (see office_converter), then parsed as PDF.
-        parsers={
-            MimeType.PDF: c[DoclingParser],
-            MimeType.PPTX: c[DoclingParser],
-            MimeType.DOCX: c[DoclingParser],
-        },
-        blob_store=c[BlobStore],
-        artifact_repository=c[ArtifactRepository],
-        page_repository=c[PageRepository],
-        create_page_use_case=c[CreatePageUseCase],
-        update_text_mention_use_case=c[UpdateTextMentionUseCase],
-        add_pages_use_case=c[AddPagesUseCase],
-        office_converter=c[OfficeToPdfConverter],
-    )
-    container[TriggerArtifactParseUseCase] = lambda c: TriggerArtifactParseUseCase(
-        workflow_orchestrator=c[WorkflowOrchestrator],
+    container[ParseArtifactUseCase] = Singleton(
+        lambda c: ParseArtifactUseCase(
+            # PPTX/DOCX are converted to PDF first (see office_converter), then parsed as PDF.
+            parsers={
+                MimeType.PDF: c[DoclingParser],
+                MimeType.PPTX: c[DoclingParser],
+                MimeType.DOCX: c[DoclingParser],
+            },
+            blob_store=c[BlobStore],
+            artifact_repository=c[ArtifactRepository],
+            page_repository=c[PageRepository],
+            create_page_use_case=c[CreatePageUseCase],
+            update_text_mention_use_case=c[UpdateTextMentionUseCase],
+            add_pages_use_case=c[AddPagesUseCase],
+            office_converter=c[OfficeToPdfConverter],
+        ),
+    )
+    container[TriggerArtifactParseUseCase] = Singleton(
+        lambda c: TriggerArtifactParseUseCase(
+            workflow_orchestrator=c[WorkflowOrchestrator],
+        ),
     )
 
     # Register Workflow Use Cases
-    container[TriggerCompoundExtractionUseCase] = lambda c: TriggerCompoundExtractionUseCase(
-        workflow_orchestrator=c[WorkflowOrchestrator],
+    container[TriggerCompoundExtractionUseCase] = Singleton(
+        lambda c: TriggerCompoundExtractionUseCase(
+            workflow_orchestrator=c[WorkflowOrchestrator],
+        ),
     )
-    container[TriggerEmbeddingUseCase] = lambda c: TriggerEmbeddingUseCase(
-        workflow_orchestrator=c[WorkflowOrchestrator],
+    container[TriggerEmbeddingUseCase] = Singleton(
+        lambda c: TriggerEmbeddingUseCase(
+            workflow_orchestrator=c[WorkflowOrchestrator],
+        ),
     )
-    container[TriggerSmilesEmbeddingUseCase] = lambda c: TriggerSmilesEmbeddingUseCase(
-        workflow_orchestrator=c[WorkflowOrchestrator],
+    container[TriggerSmilesEmbeddingUseCase] = Singleton(
+        lambda c: TriggerSmilesEmbeddingUseCase(
+            workflow_orchestrator=c[WorkflowOrchestrator],
+        ),
     )
 
     # LLM Infrastructure (shared — provider selected via LLM_PROVIDER config)
-    container[LLMClientPort] = lambda _: create_llm_client(settings)
-    container[PromptRepositoryPort] = lambda _: create_prompt_repository(settings)
+    # Built once: each client carries its own HTTP session (and Langfuse handler).
+    container[LLMClientPort] = Singleton(lambda _: create_llm_client(settings))
+    container[PromptRepositoryPort] = Singleton(lambda _: create_prompt_repository(settings))
 
     # Summarization Use Cases
-    container[SummarizePageUseCase] = lambda c: SummarizePageUseCase(
-        page_repository=c[PageRepository],
-        artifact_repository=c[ArtifactRepository],
-        llm_client=c[LLMClientPort],
-        prompt_repository=c[PromptRepositoryPort],
-        blob_store=c[BlobStore],
-        external_event_publisher=c[ExternalEventPublisher],
+    container[SummarizePageUseCase] = Singleton(
+        lambda c: SummarizePageUseCase(
+            page_repository=c[PageRepository],
+            artifact_repository=c[ArtifactRepository],
+            llm_client=c[LLMClientPort],
+            prompt_repository=c[PromptRepositoryPort],
+            blob_store=c[BlobStore],
+            external_event_publisher=c[ExternalEventPublisher],
+        ),
     )
-    container[TriggerPageSummarizationUseCase] = lambda c: TriggerPageSummarizationUseCase(
-        workflow_orchestrator=c[WorkflowOrchestrator],
+    container[TriggerPageSummarizationUseCase] = Singleton(
+        lambda c: TriggerPageSummarizationUseCase(
+            workflow_orchestrator=c[WorkflowOrchestrator],
+        ),
     )
 
     # Artifact Summarization Use Cases
-    container[SummarizeArtifactUseCase] = lambda c: SummarizeArtifactUseCase(
-        artifact_repository=c[ArtifactRepository],
-        page_repository=c[PageRepository],
-        llm_client=c[LLMClientPort],
-        prompt_repository=c[PromptRepositoryPort],
-        external_event_publisher=c[ExternalEventPublisher],
-        batch_size=settings.artifact_summarization_batch_size,
+    container[SummarizeArtifactUseCase] = Singleton(
+        lambda c: SummarizeArtifactUseCase(
+            artifact_repository=c[ArtifactRepository],
+            page_repository=c[PageRepository],
+            llm_client=c[LLMClientPort],
+            prompt_repository=c[PromptRepositoryPort],
+            external_event_publisher=c[ExternalEventPublisher],
+            batch_size=settings.artifact_summarization_batch_size,
+        ),
     )
-    container[TriggerArtifactSummarizationUseCase] = lambda c: TriggerArtifactSummarizationUseCase(
-        artifact_repository=c[ArtifactRepository],
-        page_read_model=c[PageReadModel],
-        workflow_orchestrator=c[WorkflowOrchestrator],
+    container[TriggerArtifactSummarizationUseCase] = Singleton(
+        lambda c: TriggerArtifactSummarizationUseCase(
+            artifact_repository=c[ArtifactRepository],
+            page_read_model=c[PageReadModel],
+            workflow_orchestrator=c[WorkflowOrchestrator],
+        ),
     )
 
     # Batch re-embed use cases
@@ -648,28 +868,36 @@ def create_container() -> Container:
         TriggerBatchReEmbedUseCase,
     )
 
-    container[BatchReEmbedArtifactPagesUseCase] = lambda c: BatchReEmbedArtifactPagesUseCase(
-        artifact_repository=c[ArtifactRepository],
-        page_repository=c[PageRepository],
-        embedding_generator=c[EmbeddingGenerator],
-        vector_store=c[VectorStore],
-        text_chunker=c[TextChunker],
-        blob_store=c[BlobStore],
+    container[BatchReEmbedArtifactPagesUseCase] = Singleton(
+        lambda c: BatchReEmbedArtifactPagesUseCase(
+            artifact_repository=c[ArtifactRepository],
+            page_repository=c[PageRepository],
+            embedding_generator=c[EmbeddingGenerator],
+            vector_store=c[VectorStore],
+            text_chunker=c[TextChunker],
+            blob_store=c[BlobStore],
+        ),
     )
-    container[BatchReEmbedSmilesUseCase] = lambda c: BatchReEmbedSmilesUseCase(
-        artifact_repository=c[ArtifactRepository],
-        page_repository=c[PageRepository],
-        smiles_embedding_generator=c[ChemBertaEmbeddingGenerator],
-        compound_vector_store=c[CompoundVectorStore],
+    container[BatchReEmbedSmilesUseCase] = Singleton(
+        lambda c: BatchReEmbedSmilesUseCase(
+            artifact_repository=c[ArtifactRepository],
+            page_repository=c[PageRepository],
+            smiles_embedding_generator=c[ChemBertaEmbeddingGenerator],
+            compound_vector_store=c[CompoundVectorStore],
+        ),
     )
-    container[BatchReEmbedSummariesUseCase] = lambda c: BatchReEmbedSummariesUseCase(
-        artifact_repository=c[ArtifactRepository],
-        page_repository=c[PageRepository],
-        embedding_generator=c[EmbeddingGenerator],
-        summary_vector_store=c[SummaryVectorStore],
+    container[BatchReEmbedSummariesUseCase] = Singleton(
+        lambda c: BatchReEmbedSummariesUseCase(
+            artifact_repository=c[ArtifactRepository],
+            page_repository=c[PageRepository],
+            embedding_generator=c[EmbeddingGenerator],
+            summary_vector_store=c[SummaryVectorStore],
+        ),
     )
-    container[TriggerBatchReEmbedUseCase] = lambda c: TriggerBatchReEmbedUseCase(
-        workflow_orchestrator=c[WorkflowOrchestrator],
+    container[TriggerBatchReEmbedUseCase] = Singleton(
+        lambda c: TriggerBatchReEmbedUseCase(
+            workflow_orchestrator=c[WorkflowOrchestrator],
+        ),
     )
 
     # Bulk re-embed (admin action)
@@ -677,9 +905,11 @@ def create_container() -> Container:
         TriggerBulkReEmbedUseCase,
     )
 
-    container[TriggerBulkReEmbedUseCase] = lambda c: TriggerBulkReEmbedUseCase(
-        artifact_read_model=c[ArtifactReadModel],
-        workflow_orchestrator=c[WorkflowOrchestrator],
+    container[TriggerBulkReEmbedUseCase] = Singleton(
+        lambda c: TriggerBulkReEmbedUseCase(
+            artifact_read_model=c[ArtifactReadModel],
+            workflow_orchestrator=c[WorkflowOrchestrator],
+        ),
     )
 
     # Worker heartbeat store (infrastructure → port)
@@ -708,59 +938,73 @@ def create_container() -> Container:
         heartbeat_store=c[WorkerHeartbeatStore],
         settings=settings,
     )
-    container[GetSystemHealthUseCase] = lambda c: GetSystemHealthUseCase(
-        health_checker=c[SystemHealthChecker],
+    container[GetSystemHealthUseCase] = Singleton(
+        lambda c: GetSystemHealthUseCase(
+            health_checker=c[SystemHealthChecker],
+        ),
     )
 
     # Summary Embedding Use Cases
-    container[EmbedPageSummaryUseCase] = lambda c: EmbedPageSummaryUseCase(
-        page_repository=c[PageRepository],
-        artifact_repository=c[ArtifactRepository],
-        embedding_generator=c[EmbeddingGenerator],
-        summary_vector_store=c[SummaryVectorStore],
+    container[EmbedPageSummaryUseCase] = Singleton(
+        lambda c: EmbedPageSummaryUseCase(
+            page_repository=c[PageRepository],
+            artifact_repository=c[ArtifactRepository],
+            embedding_generator=c[EmbeddingGenerator],
+            summary_vector_store=c[SummaryVectorStore],
+        ),
     )
-    container[EmbedArtifactSummaryUseCase] = lambda c: EmbedArtifactSummaryUseCase(
-        artifact_repository=c[ArtifactRepository],
-        embedding_generator=c[EmbeddingGenerator],
-        summary_vector_store=c[SummaryVectorStore],
+    container[EmbedArtifactSummaryUseCase] = Singleton(
+        lambda c: EmbedArtifactSummaryUseCase(
+            artifact_repository=c[ArtifactRepository],
+            embedding_generator=c[EmbeddingGenerator],
+            summary_vector_store=c[SummaryVectorStore],
+        ),
     )
-    container[TriggerPageSummaryEmbeddingUseCase] = lambda c: TriggerPageSummaryEmbeddingUseCase(
-        workflow_orchestrator=c[WorkflowOrchestrator],
+    container[TriggerPageSummaryEmbeddingUseCase] = Singleton(
+        lambda c: TriggerPageSummaryEmbeddingUseCase(
+            workflow_orchestrator=c[WorkflowOrchestrator],
+        ),
     )
-    container[TriggerArtifactSummaryEmbeddingUseCase] = (
+    container[TriggerArtifactSummaryEmbeddingUseCase] = Singleton(
         lambda c: TriggerArtifactSummaryEmbeddingUseCase(
             workflow_orchestrator=c[WorkflowOrchestrator],
-        )
+        ),
     )
 
     # Vector Metadata Sync Use Cases
-    container[SyncPageTagsToVectorStoreUseCase] = lambda c: SyncPageTagsToVectorStoreUseCase(
-        page_repository=c[PageRepository],
-        vector_store=c[VectorStore],
-        summary_vector_store=c[SummaryVectorStore],
+    container[SyncPageTagsToVectorStoreUseCase] = Singleton(
+        lambda c: SyncPageTagsToVectorStoreUseCase(
+            page_repository=c[PageRepository],
+            vector_store=c[VectorStore],
+            summary_vector_store=c[SummaryVectorStore],
+        ),
     )
-    container[SyncArtifactMetadataToVectorStoreUseCase] = (
+    container[SyncArtifactMetadataToVectorStoreUseCase] = Singleton(
         lambda c: SyncArtifactMetadataToVectorStoreUseCase(
             artifact_repository=c[ArtifactRepository],
             vector_store=c[VectorStore],
             summary_vector_store=c[SummaryVectorStore],
-        )
+        ),
     )
 
     # Search Use Cases
-    container[SearchSummariesUseCase] = lambda c: SearchSummariesUseCase(
-        embedding_generator=c[EmbeddingGenerator],
-        summary_vector_store=c[SummaryVectorStore],
-        artifact_read_model=c[ArtifactReadModel],
+    container[SearchSummariesUseCase] = Singleton(
+        lambda c: SearchSummariesUseCase(
+            embedding_generator=c[EmbeddingGenerator],
+            summary_vector_store=c[SummaryVectorStore],
+            artifact_read_model=c[ArtifactReadModel],
+        ),
     )
-    container[HierarchicalSearchUseCase] = lambda c: HierarchicalSearchUseCase(
-        embedding_generator=c[EmbeddingGenerator],
-        vector_store=c[VectorStore],
-        summary_vector_store=c[SummaryVectorStore],
-        page_read_model=c[PageReadModel],
-        artifact_read_model=c[ArtifactReadModel],
-        reranker=c[Reranker],
-        sparse_embedding_generator=c[SparseEmbeddingGenerator],
+    container[HierarchicalSearchUseCase] = Singleton(
+        lambda c: HierarchicalSearchUseCase(
+            embedding_generator=c[EmbeddingGenerator],
+            vector_store=c[VectorStore],
+            summary_vector_store=c[SummaryVectorStore],
+            page_read_model=c[PageReadModel],
+            artifact_read_model=c[ArtifactReadModel],
+            reranker=c[Reranker],
+            sparse_embedding_generator=c[SparseEmbeddingGenerator],
+        ),
     )
 
     # --- Chat (Agentic RAG) ---
@@ -797,9 +1041,11 @@ def create_container() -> Container:
         lane="synthesis",
     )
 
-    container[ChatRepository] = lambda c: MongoChatRepository(
-        client=c[AsyncIOMotorClient],
-        db_name=settings.mongo_db,
+    container[ChatRepository] = Singleton(
+        lambda c: MongoChatRepository(
+            client=c[AsyncIOMotorClient],
+            db_name=settings.mongo_db,
+        ),
     )
 
     # --- Quick Mode nodes (existing pipeline) ---
@@ -908,27 +1154,41 @@ def create_container() -> Container:
     )
 
     # Chat Use Cases
-    container[CreateConversationUseCase] = lambda c: CreateConversationUseCase(
-        chat_repository=c[ChatRepository],
-    )
-    container[ListConversationsUseCase] = lambda c: ListConversationsUseCase(
-        chat_repository=c[ChatRepository],
-    )
-    container[GetConversationUseCase] = lambda c: GetConversationUseCase(
-        chat_repository=c[ChatRepository],
-    )
-    container[GetUserTokenUsageUseCase] = lambda c: GetUserTokenUsageUseCase(
-        chat_repository=c[ChatRepository],
-    )
-    container[DeleteConversationUseCase] = lambda c: DeleteConversationUseCase(
-        chat_repository=c[ChatRepository],
-    )
-    container[SendMessageUseCase] = lambda c: SendMessageUseCase(
-        chat_repository=c[ChatRepository],
-        chat_agent=c[ChatAgentPort],
-    )
-    container[RecordFeedbackUseCase] = lambda c: RecordFeedbackUseCase(
-        chat_repository=c[ChatRepository],
+    container[CreateConversationUseCase] = Singleton(
+        lambda c: CreateConversationUseCase(
+            chat_repository=c[ChatRepository],
+        ),
+    )
+    container[ListConversationsUseCase] = Singleton(
+        lambda c: ListConversationsUseCase(
+            chat_repository=c[ChatRepository],
+        ),
+    )
+    container[GetConversationUseCase] = Singleton(
+        lambda c: GetConversationUseCase(
+            chat_repository=c[ChatRepository],
+        ),
+    )
+    container[GetUserTokenUsageUseCase] = Singleton(
+        lambda c: GetUserTokenUsageUseCase(
+            chat_repository=c[ChatRepository],
+        ),
+    )
+    container[DeleteConversationUseCase] = Singleton(
+        lambda c: DeleteConversationUseCase(
+            chat_repository=c[ChatRepository],
+        ),
+    )
+    container[SendMessageUseCase] = Singleton(
+        lambda c: SendMessageUseCase(
+            chat_repository=c[ChatRepository],
+            chat_agent=c[ChatAgentPort],
+        ),
+    )
+    container[RecordFeedbackUseCase] = Singleton(
+        lambda c: RecordFeedbackUseCase(
+            chat_repository=c[ChatRepository],
+        ),
     )
 
     return container
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+from collections import OrderedDict
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Literal
 from uuid import uuid4
@@ -8,14 +11,37 @@ import structlog
 
 from application.ports.embedding_generator import EmbeddingGenerator
 from domain.value_objects.text_embedding import TextEmbedding
+from infrastructure.embeddings.ids import batch_embedding_ids
+from infrastructure.embeddings.precision import apply_precision
+from infrastructure.lib.micro_batcher import MicroBatcher
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
     import torch
     from transformers import AutoModel, AutoTokenizer
 
+    from infrastructure.embeddings.precision import EmbeddingPrecision
+
 logger = structlog.get_logger()
 
 _CHEMBERTA_DIMENSIONS = 384
+_MAX_TOKENS = 512
+# Rows in the reusable CUDA input buffers; larger buckets fall back to a plain copy.
+_PINNED_BATCH_ROWS = 256
+
+
+def _length_buckets(lengths: list[int]) -> list[list[int]]:
+    """Group indices by token length into power-of-two buckets, shortest first.
+
+    Padding inside a bucket is at most the bucket's longest sequence, which
+    is less than twice its shortest.
+    """
+    buckets: dict[int, list[int]] = {}
+    for index, length in enumerate(lengths):
+        buckets.setdefault(length.bit_length(), []).append(index)
+    return [buckets[key] for key in sorted(buckets)]
 
 
 class ChemBertaEmbeddingGenerator(EmbeddingGenerator):
@@ -32,9 +58,17 @@ class ChemBertaEmbeddingGenerator(EmbeddingGenerator):
         self,
         model_name: str = "DeepChem/ChemBERTa-77M-MTR",
         device: Literal["cpu", "cuda", "mps"] = "cpu",
+        precision: EmbeddingPrecision = "fp32",
+        cache_size: int = 10_000,
+        coalesce_ms: float = 5.0,
+        *,
+        compile_model: bool = False,
     ) -> None:
         self.model_name = model_name
         self.device = device
+        self.precision = precision
+        self.cache_size = cache_size
+        self.compile_model = compile_model
 
         logger.info(
             "initializing_chemberta_generator",
@@ -46,58 +80,169 @@ class ChemBertaEmbeddingGenerator(EmbeddingGenerator):
         self._tokenizer: AutoTokenizer | None = None
         self._model: AutoModel | None = None
         self._torch: torch | None = None
+        # CUDA only: [2, rows, 512] pinned host / device buffers holding
+        # input_ids and attention_mask, reused by every forward.
+        self._pinned_inputs: torch.Tensor | None = None
+        self._device_inputs: torch.Tensor | None = None
+        self._load_lock = threading.Lock()
+        # Batches are encoded off the event loop; forwards still run one at a
+        # time, since each already spreads across torch's intra-op threads.
+        self._forward_lock = threading.Lock()
+
+        # SMILES -> vector LRU. The same compound recurs across pages and
+        # papers; vectors are kept as float32 rows (~1.5 KB each at 384-d).
+        self._cache: OrderedDict[str, Sequence[float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Single-SMILES calls (search queries) arriving within coalesce_ms of
+        # each other share one forward pass.
+        self._single_batcher: MicroBatcher[str, Sequence[float]] | None = (
+            MicroBatcher(self._encode_batch, max_size=64, max_wait=coalesce_ms / 1000)
+            if coalesce_ms > 0
+            else None
+        )
 
     def _ensure_model_loaded(self) -> None:
-        """Lazy-load tokenizer and model on first use."""
+        """Lazy-load tokenizer and model on first use (thread-safe double-check locking)."""
         if self._model is not None:
             return
-
-        import torch
-        from transformers import AutoModel, AutoTokenizer
-
-        logger.info("loading_chemberta_model", model_name=self.model_name)
-
-        self._torch = torch
-        self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-        self._model = AutoModel.from_pretrained(self.model_name)
-        self._model.to(self.device)
-        self._model.eval()
-
-        logger.info(
-            "chemberta_model_loaded",
-            model_name=self.model_name,
-            device=self.device,
-        )
+        with self._load_lock:
+            if self._model is not None:
+                return
+
+            import torch
+            from transformers import AutoModel, AutoTokenizer
+
+            logger.info("loading_chemberta_model", model_name=self.model_name)
+
+            self._torch = torch
+            self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            model = AutoModel.from_pretrained(self.model_name)
+            model.to(self.device)
+            model.eval()
+            model = apply_precision(model, self.precision, self.device)
+            if self.compile_model:
+                # Compiles lazily on the first forward; length buckets keep the
+                # number of distinct sequence lengths (and recompiles) small.
+                model = torch.compile(model, dynamic=True)
+            if self.device == "cuda":
+                self._pinned_inputs = torch.empty(
+                    (2, _PINNED_BATCH_ROWS, _MAX_TOKENS),
+                    dtype=torch.long,
+                    pin_memory=True,
+                )
+                self._device_inputs = torch.empty_like(self._pinned_inputs, device="cuda")
+            self._model = model
+
+            logger.info(
+                "chemberta_model_loaded",
+                model_name=self.model_name,
+                device=self.device,
+            )
 
     def _mean_pool(
         self,
         token_embeddings: torch.Tensor,
         attention_mask: torch.Tensor,
     ) -> torch.Tensor:
-        """Mean-pool token embeddings weighted by attention mask."""
-        mask_expanded = attention_mask.unsqueeze(-1).expand(token_embeddings.size()).float()
-        sum_embeddings = self._torch.sum(token_embeddings * mask_expanded, dim=1)
-        sum_mask = self._torch.clamp(mask_expanded.sum(1), min=1e-9)
-        return sum_embeddings / sum_mask
-
-    def _encode_batch(self, texts: list[str]) -> list[list[float]]:
-        """Tokenize and encode a batch of SMILES strings."""
+        """Mean-pool token embeddings weighted by attention mask.
+
+        The masked sum is a batched ``[1, L] @ [L, H]`` product, so no
+        ``[B, L, H]`` masked copy of the hidden states is materialized.
+        """
+        mask = attention_mask.to(token_embeddings.dtype).unsqueeze(1)
+        sum_embeddings = self._torch.bmm(mask, token_embeddings).squeeze(1)
+        sum_mask = mask.sum(dim=2).clamp_(min=1e-9)
+        return sum_embeddings.div_(sum_mask)
+
+    def _to_device(self, inputs: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+        """Move a padded bucket to the model's device.
+
+        On CUDA the bucket is staged through the preallocated pinned buffer and
+        copied into views of the preallocated device buffer, so no memory is
+        allocated per call and the host-to-device copy is asynchronous. Reusing
+        the pinned buffer is safe because the previous bucket's ``.cpu()``
+        synchronized the stream before this is called again.
+        """
+        input_ids = inputs["input_ids"]
+        rows, length = input_ids.shape
+        if self._device_inputs is None or rows > _PINNED_BATCH_ROWS:
+            return {k: v.to(self.device) for k, v in inputs.items()}
+
+        pinned = self._pinned_inputs[:, :rows, :length]
+        pinned[0].copy_(input_ids)
+        pinned[1].copy_(inputs["attention_mask"])
+        staged = self._device_inputs[:, :rows, :length]
+        staged.copy_(pinned, non_blocking=True)
+        return {"input_ids": staged[0], "attention_mask": staged[1]}
+
+    def _encode_batch(self, texts: list[str]) -> Sequence[Sequence[float]]:
+        """Encode a batch of SMILES strings, running the model only on cache misses."""
+        if self.cache_size <= 0:
+            return self._forward(texts)
+
+        vectors: list[Sequence[float] | None] = [None] * len(texts)
+        misses: dict[str, list[int]] = {}
+        with self._cache_lock:
+            for i, text in enumerate(texts):
+                cached = self._cache.get(text)
+                if cached is None:
+                    misses.setdefault(text, []).append(i)
+                else:
+                    self._cache.move_to_end(text)
+                    vectors[i] = cached
+
+        if misses:
+            computed = self._forward(list(misses))
+            with self._cache_lock:
+                for (text, positions), vector in zip(misses.items(), computed, strict=True):
+                    for i in positions:
+                        vectors[i] = vector
+                    # A copy, so the entry doesn't keep the whole batch array alive
+                    self._cache[text] = vector.copy()
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        logger.debug(
+            "chemberta_cache_lookup",
+            requested=len(texts),
+            computed=len(misses),
+        )
+        return vectors  # type: ignore[return-value]
+
+    def _forward(self, texts: list[str]) -> np.ndarray:
+        """Tokenize and encode a batch of SMILES strings into a float32 ``[N, D]`` array.
+
+        Rows are handed to TextEmbedding as-is; the vector stores convert
+        them with ``vector_list()`` only where the client needs plain floats.
+        """
+        import numpy as np
+
         self._ensure_model_loaded()
 
-        inputs = self._tokenizer(
-            texts,
-            padding=True,
-            truncation=True,
-            max_length=512,
-            return_tensors="pt",
-        )
-        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        # Tokenize once without padding, then pad and run each length bucket
+        # separately so one long SMILES doesn't pad the whole batch to its length.
+        input_ids = self._tokenizer(texts, truncation=True, max_length=_MAX_TOKENS)["input_ids"]
+        vectors = np.empty((len(texts), self._model.config.hidden_size), dtype=np.float32)
+
+        # Tokenization (Rust, GIL released) may overlap another batch's forward.
+        with self._forward_lock:
+            for bucket in _length_buckets([len(ids) for ids in input_ids]):
+                inputs = self._tokenizer.pad(
+                    {"input_ids": [input_ids[i] for i in bucket]},
+                    return_tensors="pt",
+                )
+                inputs = self._to_device(inputs)
+
+                with self._torch.inference_mode():
+                    outputs = self._model(**inputs)
+                    pooled = self._mean_pool(outputs.last_hidden_state, inputs["attention_mask"])
 
-        with self._torch.no_grad():
-            outputs = self._model(**inputs)
+                # Reduced-precision weights give fp16/bf16 outputs; numpy has no
+                # bf16, so cast before leaving torch (a no-op for fp32).
+                vectors[bucket] = pooled.float().cpu().numpy()
 
-        pooled = self._mean_pool(outputs.last_hidden_state, inputs["attention_mask"])
-        return pooled.cpu().numpy().tolist()
+        return vectors
 
     async def generate_text_embedding(
         self,
@@ -105,12 +250,14 @@ class ChemBertaEmbeddingGenerator(EmbeddingGenerator):
         model_name: str | None = None,
     ) -> TextEmbedding:
         """Generate a ChemBERTa embedding for a single SMILES string."""
-        if not text or not text.strip():
+        if not text or text.isspace():
             msg = "SMILES cannot be empty"
             raise ValueError(msg)
 
-        vectors = self._encode_batch([text])
-        vector = vectors[0]
+        if self._single_batcher is not None:
+            vector = await self._single_batcher.submit(text)
+        else:
+            vector = (await asyncio.to_thread(self._encode_batch, [text]))[0]
 
         return TextEmbedding(
             embedding_id=uuid4(),
@@ -131,24 +278,24 @@ class ChemBertaEmbeddingGenerator(EmbeddingGenerator):
             raise ValueError(msg)
 
         for i, text in enumerate(texts):
-            if not text or not text.strip():
+            if not text or text.isspace():
                 msg = f"SMILES at index {i} cannot be empty"
                 raise ValueError(msg)
 
         logger.debug("generating_chemberta_batch", count=len(texts))
 
-        vectors = self._encode_batch(texts)
+        vectors = await asyncio.to_thread(self._encode_batch, texts)
         now = datetime.now(UTC)
 
         embeddings = [
             TextEmbedding(
-                embedding_id=uuid4(),
+                embedding_id=embedding_id,
                 vector=vector,
                 model_name=self.model_name,
                 dimensions=len(vector),
                 generated_at=now,
             )
-            for vector in vectors
+            for embedding_id, vector in zip(batch_embedding_ids(len(vectors)), vectors, strict=True)
         ]
 
         logger.debug("chemberta_batch_generated", count=len(embeddings))
@@ -0,0 +1,17 @@
+"""Embedding IDs for batch results.
+
+An embedding ID only has to be unique, not unpredictable. A batch therefore
+draws one random UUID4 and derives the rest by XOR-ing the index into its
+low bits, instead of reading 16 bytes from ``os.urandom`` for every vector.
+The version and variant bits are left alone, so every ID is a valid UUID4.
+"""
+
+from __future__ import annotations
+
+from uuid import UUID, uuid4
+
+
+def batch_embedding_ids(count: int) -> list[UUID]:
+    """Return ``count`` distinct UUID4s derived from a single random one."""
+    base = uuid4().int
+    return [UUID(int=base ^ i) for i in range(count)]
@@ -0,0 +1,58 @@
+"""Reduced-precision loading for local embedding models.
+
+fp16 halves memory traffic and runs on tensor cores, but only pays off on an
+accelerator; on CPU half-precision matmuls are slower than fp32. bf16 has
+fp32's exponent range and is fast on CUDA and on CPUs with AVX-512 BF16 or
+AMX (oneDNN); older CPUs emulate it and run slower than fp32. int8 uses
+PyTorch dynamic quantization of the Linear layers, which is a CPU-only
+kernel. A precision that does not fit the resolved device is logged and the
+model is left in fp32, so the setting is always safe to enable.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+
+import structlog
+
+if TYPE_CHECKING:
+    from torch import nn
+
+logger = structlog.get_logger()
+
+EmbeddingPrecision = Literal["fp32", "fp16", "bf16", "int8"]
+
+
+def apply_precision[M: nn.Module](model: M, precision: EmbeddingPrecision, device: str) -> M:
+    """Convert ``model`` (already on ``device``) to ``precision`` in place.
+
+    Call this before the first forward pass; the model should be in eval mode.
+    """
+    if precision == "fp32":
+        return model
+
+    import torch  # heavy import — deferred until a model is actually loaded
+
+    if precision == "fp16":
+        if device == "cpu":
+            logger.warning("fp16_not_supported_on_cpu_using_fp32")
+            return model
+        model.half()
+    elif precision == "bf16":
+        if device == "mps":
+            logger.warning("bf16_not_supported_on_mps_using_fp32")
+            return model
+        model.to(torch.bfloat16)
+    else:
+        if device != "cpu":
+            logger.warning("int8_requires_cpu_using_fp32", device=device)
+            return model
+        torch.ao.quantization.quantize_dynamic(
+            model,
+            {torch.nn.Linear},
+            dtype=torch.qint8,
+            inplace=True,
+        )
+
+    logger.info("embedding_model_precision_applied", precision=precision, device=device)
+    return model
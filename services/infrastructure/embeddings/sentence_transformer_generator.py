@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import importlib.util
 import threading
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 from uuid import uuid4
 
@@ -9,12 +11,52 @@ import structlog
 
 from application.ports.embedding_generator import EmbeddingGenerator
 from domain.value_objects.text_embedding import TextEmbedding
+from infrastructure.embeddings.ids import batch_embedding_ids
+from infrastructure.embeddings.precision import apply_precision
 
 if TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
 
+    from infrastructure.embeddings.precision import EmbeddingPrecision
+
 logger = structlog.get_logger()
 
+OnnxQuantization = Literal["arm64", "avx2", "avx512", "avx512_vnni"]
+
+# Runtimes the non-torch backends need. They are not installed by default;
+# the docu-store[openvino] extra pulls in the OpenVINO one. ONNX has no extra:
+# optimum-onnx caps transformers below 4.58, under this project's pin.
+_BACKEND_MODULES: dict[str, tuple[str, ...]] = {
+    "onnx": ("onnxruntime", "optimum.onnxruntime"),
+    "openvino": ("openvino", "optimum.intel"),
+}
+
+_BACKEND_INSTALL_HINTS: dict[str, str] = {
+    "onnx": (
+        "No docu-store extra provides it (optimum-onnx requires transformers<4.58); "
+        "use EMBEDDING_BACKEND=torch or openvino."
+    ),
+    "openvino": "Install it with `uv sync --extra openvino` or use EMBEDDING_BACKEND=torch.",
+}
+
+
+def _module_available(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:  # parent package missing
+        return False
+
+
+def check_backend_installed(backend: str) -> None:
+    """Raise ImportError saying how to install ``backend``'s runtime if it is missing."""
+    missing = [name for name in _BACKEND_MODULES.get(backend, ()) if not _module_available(name)]
+    if missing:
+        msg = (
+            f"EMBEDDING_BACKEND={backend} needs sentence-transformers[{backend}]; "
+            f"missing: {', '.join(missing)}. {_BACKEND_INSTALL_HINTS[backend]}"
+        )
+        raise ImportError(msg)
+
 
 class SentenceTransformerGenerator(EmbeddingGenerator):
     """Adapter for generating embeddings using sentence-transformers library.
@@ -32,6 +74,12 @@ class SentenceTransformerGenerator(EmbeddingGenerator):
         self,
         model_name: str = "nomic-ai/nomic-embed-text-v1.5",
         device: Literal["cpu", "cuda", "mps"] = "cpu",
+        *,
+        backend: Literal["torch", "onnx", "openvino"] = "torch",
+        precision: EmbeddingPrecision = "fp32",
+        compile_model: bool = False,
+        onnx_cache_dir: Path = Path("models/onnx"),
+        onnx_quantization: OnnxQuantization = "avx512_vnni",
         query_prefix: str = "",
         document_prefix: str = "",
     ) -> None:
@@ -40,12 +88,26 @@ class SentenceTransformerGenerator(EmbeddingGenerator):
         Args:
             model_name: HuggingFace model name or path
             device: Device to run the model on (cpu, cuda, or mps for Apple Silicon)
+            backend: Inference runtime; onnx/openvino run the exported graph instead of torch
+            precision: Weight precision (fp16 on cuda/mps, bf16 on cuda/cpu, int8 on cpu,
+                otherwise fp32); with the onnx backend only int8 on cpu applies
+            compile_model: torch.compile the transformer module (torch backend only)
+            onnx_cache_dir: Where int8-quantized ONNX exports are written and reused
+            onnx_quantization: Target instruction set for the int8 ONNX export
             query_prefix: Prefix prepended to query text (e.g. "search_query: " for nomic)
             document_prefix: Prefix prepended to document text (e.g. "search_document: " for nomic)
 
         """
+        # Fail at startup rather than on the first encode
+        check_backend_installed(backend)
+
         self.model_name = model_name
         self.device = self._resolve_device(device)
+        self.backend = backend
+        self.precision = precision
+        self.compile_model = compile_model
+        self.onnx_cache_dir = onnx_cache_dir
+        self.onnx_quantization = onnx_quantization
         self.query_prefix = query_prefix
         self.document_prefix = document_prefix
 
@@ -53,6 +115,8 @@ class SentenceTransformerGenerator(EmbeddingGenerator):
             "initializing_sentence_transformer",
             model_name=model_name,
             device=self.device,
+            backend=backend,
+            precision=precision,
         )
 
         # Lazy loading - will load on first use
@@ -84,11 +148,33 @@ class SentenceTransformerGenerator(EmbeddingGenerator):
             )  # heavy import — deferred until first use
 
             logger.info("loading_sentence_transformer_model", model_name=self.model_name)
-            self._model = SentenceTransformer(
-                self.model_name,
-                device=self.device,
-                trust_remote_code=True,
-            )
+            int8_onnx = self.backend == "onnx" and self.precision == "int8" and self.device == "cpu"
+            if int8_onnx:
+                model = self._load_int8_onnx()
+            else:
+                model = SentenceTransformer(
+                    self.model_name,
+                    device=self.device,
+                    backend=self.backend,
+                    trust_remote_code=True,
+                )
+            if self.backend == "torch":
+                model.eval()
+                model = apply_precision(model, self.precision, self.device)
+                if self.compile_model:
+                    import torch
+
+                    # Only the HF transformer is compiled; pooling and normalize
+                    # stay eager. Compiles on the first encode (the startup warm-up).
+                    transformer = model[0]
+                    transformer.auto_model = torch.compile(transformer.auto_model, dynamic=True)
+            elif self.precision != "fp32" and not int8_onnx:
+                logger.warning(
+                    "embedding_precision_ignored_for_backend",
+                    backend=self.backend,
+                    precision=self.precision,
+                )
+            self._model = model
             self._dimensions = self._model.get_sentence_embedding_dimension()
             logger.info(
                 "model_loaded",
@@ -96,6 +182,43 @@ class SentenceTransformerGenerator(EmbeddingGenerator):
                 dimensions=self._dimensions,
             )
 
+    def _load_int8_onnx(self) -> SentenceTransformer:
+        """Load a dynamically int8-quantized ONNX export, creating it on first use.
+
+        Quantizing takes a while, so the export is written under
+        ``onnx_cache_dir`` once and later processes load it from there.
+        """
+        from sentence_transformers import (
+            SentenceTransformer,
+            export_dynamic_quantized_onnx_model,
+        )
+
+        export_dir = self.onnx_cache_dir / self.model_name.replace("/", "--")
+        file_name = f"onnx/model_qint8_{self.onnx_quantization}.onnx"
+        if not (export_dir / file_name).exists():
+            logger.info(
+                "exporting_int8_onnx_model",
+                model_name=self.model_name,
+                quantization=self.onnx_quantization,
+                path=str(export_dir),
+            )
+            model = SentenceTransformer(
+                self.model_name,
+                device="cpu",
+                backend="onnx",
+                trust_remote_code=True,
+            )
+            model.save(str(export_dir))
+            export_dynamic_quantized_onnx_model(model, self.onnx_quantization, str(export_dir))
+
+        return SentenceTransformer(
+            str(export_dir),
+            device="cpu",
+            backend="onnx",
+            trust_remote_code=True,
+            model_kwargs={"file_name": file_name},
+        )
+
     async def generate_text_embedding(
         self,
         text: str,
@@ -114,7 +237,7 @@ class SentenceTransformerGenerator(EmbeddingGenerator):
             ValueError: If text is empty or invalid
 
         """
-        if not text or not text.strip():
+        if not text or text.isspace():
             msg = "Text cannot be empty"
             raise ValueError(msg)
 
@@ -124,7 +247,11 @@ class SentenceTransformerGenerator(EmbeddingGenerator):
 
         # Apply query prefix (e.g. "search_query: " for nomic asymmetric retrieval)
         prefixed_text = self.query_prefix + text if self.query_prefix else text
-        vector = self._model.encode(prefixed_text, convert_to_tensor=False).tolist()
+        vector = self._model.encode(
+            prefixed_text,
+            convert_to_tensor=False,
+            show_progress_bar=False,
+        )
 
         embedding = TextEmbedding(
             embedding_id=uuid4(),
@@ -167,7 +294,7 @@ class SentenceTransformerGenerator(EmbeddingGenerator):
             raise ValueError(msg)
 
         for i, text in enumerate(texts):
-            if not text or not text.strip():
+            if not text or text.isspace():
                 msg = f"Text at index {i} cannot be empty"
                 raise ValueError(msg)
 
@@ -179,18 +306,22 @@ class SentenceTransformerGenerator(EmbeddingGenerator):
         if self.document_prefix:
             texts = [self.document_prefix + t for t in texts]
 
-        # Batch encode all texts at once — much faster than encoding one by one
-        vectors = self._model.encode(texts, convert_to_tensor=False).tolist()
+        # Batch encode all texts at once — much faster than encoding one by one.
+        # encode() already sorts by length before mini-batching (and restores
+        # the input order), so each mini-batch pads to similar lengths.
+        # Rows of the float32 result are handed to TextEmbedding without copying.
+        vectors = self._model.encode(texts, convert_to_tensor=False, show_progress_bar=False)
+        now = datetime.now(UTC)
 
         embeddings = [
             TextEmbedding(
-                embedding_id=uuid4(),
+                embedding_id=embedding_id,
                 vector=vector,
                 model_name=self.model_name,
                 dimensions=len(vector),
-                generated_at=datetime.now(UTC),
+                generated_at=now,
             )
-            for vector in vectors
+            for embedding_id, vector in zip(batch_embedding_ids(len(vectors)), vectors, strict=True)
         ]
 
         logger.debug(
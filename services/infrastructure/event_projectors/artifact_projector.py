@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from pydantic_core import to_jsonable_python
+
 if TYPE_CHECKING:
     from domain.aggregates.artifact import Artifact
     from infrastructure.read_repositories.read_model_materializer import ReadModelMaterializer
@@ -77,10 +79,7 @@ class ArtifactProjector:
         Uses a combined transaction to avoid duplicate-tracking IntegrityError
         that previously caused the tag_dictionary write to be silently skipped.
         """
-        tag_mentions_data = [
-            tag_mention.model_dump(mode="json")
-            for tag_mention in event.tag_mentions  # type: ignore[attr-defined]
-        ]
+        tag_mentions_data = to_jsonable_python(event.tag_mentions, by_alias=False)  # type: ignore[attr-defined]
         tags = [
             {"tag": tm.tag, "tag_normalized": tm.tag.lower(), "entity_type": tm.entity_type}
             for tm in event.tag_mentions  # type: ignore[attr-defined]
@@ -94,10 +93,7 @@ class ArtifactProjector:
 
     def author_mentions_updated(self, event: object, tracking: object) -> None:
         """Project AuthorMentionsUpdated event to read model and tag dictionary."""
-        author_mentions_data = [
-            author_mention.model_dump(mode="json")
-            for author_mention in event.author_mentions  # type: ignore[attr-defined]
-        ]
+        author_mentions_data = to_jsonable_python(event.author_mentions, by_alias=False)  # type: ignore[attr-defined]
         tags = [
             {"tag": am.name, "tag_normalized": am.name.lower(), "entity_type": "author"}
             for am in event.author_mentions  # type: ignore[attr-defined]
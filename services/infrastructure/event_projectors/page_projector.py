@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from pydantic_core import to_jsonable_python
+
 if TYPE_CHECKING:
     from domain.aggregates.page import Page
     from infrastructure.read_repositories.read_model_materializer import ReadModelMaterializer
@@ -35,11 +37,8 @@ class PageProjector:
 
     def compound_mentions_updated(self, event: object, tracking: object) -> None:
         """Project CompoundMentionsUpdated event to read model."""
-        # Convert Pydantic models to dicts for storage
-        compound_mentions_data = [
-            compound_mention.model_dump(mode="json")
-            for compound_mention in event.compound_mentions  # type: ignore[attr-defined]
-        ]
+        # One serializer call for the whole list; same output as model_dump(mode="json") per item
+        compound_mentions_data = to_jsonable_python(event.compound_mentions, by_alias=False)  # type: ignore[attr-defined]
         self._materializer.upsert_page(
             page_id=str(event.originator_id),  # type: ignore[attr-defined]
             fields={
@@ -50,11 +49,8 @@ class PageProjector:
 
     def tag_mentions_updated(self, event: object, tracking: object) -> None:
         """Project TagMentionsUpdated event to read model."""
-        # Convert Pydantic models to dicts for storage
-        tag_mentions_data = [
-            tag_mention.model_dump(mode="json")
-            for tag_mention in event.tag_mentions  # type: ignore[attr-defined]
-        ]
+        # One serializer call for the whole list; same output as model_dump(mode="json") per item
+        tag_mentions_data = to_jsonable_python(event.tag_mentions, by_alias=False)  # type: ignore[attr-defined]
         self._materializer.upsert_page(
             page_id=str(event.originator_id),  # type: ignore[attr-defined]
             fields={
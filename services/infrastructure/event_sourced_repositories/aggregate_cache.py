@@ -0,0 +1,26 @@
+"""Environment for eventsourcing's aggregate cache.
+
+With a cache, ``Repository.get`` keeps the aggregates it rebuilds. A later
+load of a cached aggregate still queries the store, but only for events
+newer than the cached version (fast-forward), so writes from other
+processes are seen and the snapshot read and full replay are skipped.
+Saving does not put aggregates into the cache: with fast-forward the next
+load picks the new events up from the store.
+
+Use cases mutate the aggregates they load before saving them, so every
+load hands out a deep copy. A mutation that is never saved (a failed
+command) then cannot leak into the cached instance.
+"""
+
+from __future__ import annotations
+
+from eventsourcing.application import Application
+
+
+def aggregate_cache_env(maxsize: int) -> dict[str, str]:
+    """Return the eventsourcing env for a fast-forwarding cache of ``maxsize`` aggregates."""
+    return {
+        Application.AGGREGATE_CACHE_MAXSIZE: str(maxsize),
+        Application.AGGREGATE_CACHE_FASTFORWARD: "y",
+        Application.DEEPCOPY_FROM_AGGREGATE_CACHE: "y",
+    }
@@ -1,11 +1,13 @@
 from uuid import UUID
 
+from eventsourcing.application import AggregateNotFoundError as EventSourcingNotFoundError
 from eventsourcing.application import Application
 from eventsourcing.persistence import IntegrityError as EventSourcingIntegrityError
 
 from application.ports.repositories.artifact_repository import ArtifactRepository
 from domain.aggregates.artifact import Artifact
 from domain.exceptions import AggregateNotFoundError, ConcurrencyError, InfrastructureError
+from infrastructure.event_sourced_repositories import identity_map
 
 
 def _raise_artifact_not_found(artifact_id: UUID) -> None:
@@ -35,11 +37,14 @@ class EventSourcedArtifactRepository(ArtifactRepository):
         try:
             self.application.save(artifact)
         except EventSourcingIntegrityError as e:
+            identity_map.forget(artifact.id)
             msg = f"Concurrency conflict saving artifact: {e!s}"
             raise ConcurrencyError(msg) from e
         except Exception as e:
+            identity_map.forget(artifact.id)
             msg = f"Failed to save artifact: {e!s}"
             raise InfrastructureError(msg) from e
+        identity_map.remember(artifact)
 
     def get_by_id(self, artifact_id: UUID) -> Artifact:
         """Retrieve Artifact by rebuilding from event history.
@@ -49,20 +54,19 @@ class EventSourcedArtifactRepository(ArtifactRepository):
             InfrastructureError: If the event store operation fails.
 
         """
+        cached = identity_map.get_cached(artifact_id)
+        if isinstance(cached, Artifact):
+            return cached
         try:
             artifact = self.application.repository.get(artifact_id)
-            if isinstance(artifact, Artifact):
-                return artifact
-            # This shouldn't happen in normal circumstances
-            _raise_artifact_not_found(artifact_id)
-        except AggregateNotFoundError:
-            # Re-raise our domain exception
-            raise
+        except EventSourcingNotFoundError as e:
+            msg = f"Artifact {artifact_id} not found"
+            raise AggregateNotFoundError(msg) from e
         except Exception as e:
-            # Check if it's a 'not found' error from eventsourcing
-            error_msg = str(e).lower()
-            if "not found" in error_msg or "does not exist" in error_msg:
-                msg = f"Artifact {artifact_id} not found"
-                raise AggregateNotFoundError(msg) from e
             # Any other exception (network error, DB error, etc.) is an infrastructure error
             _raise_artifact_retrieval_error(artifact_id, e)
+        if not isinstance(artifact, Artifact):
+            # This shouldn't happen in normal circumstances
+            _raise_artifact_not_found(artifact_id)
+        identity_map.remember(artifact)
+        return artifact
@@ -0,0 +1,74 @@
+"""Scoped identity map for event-sourced aggregates.
+
+Rehydrating an aggregate replays its full event history, so loading the same
+aggregate twice within one unit of work (one pipeline event, one request) is
+pure waste. Inside an ``aggregate_identity_map()`` block the event-sourced
+repositories return the already-loaded instance instead of hitting the store.
+
+The map lives in a ContextVar. Tasks and ``asyncio.to_thread`` calls started
+inside a block copy the context, so they share its map (the pipeline worker's
+TaskGroup triggers all see the same entries); tasks started elsewhere never
+see it. Outside a block every lookup misses and the repositories behave as
+before.
+
+An entry is handed out only while the aggregate is still at the version it
+was loaded or saved at. An aggregate that is mutated and then abandoned
+without saving (a command that returns a failure) is dropped on the next
+lookup and reloaded from the store, so unsaved state never leaks to a later
+``get_by_id``.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from uuid import UUID
+
+    from eventsourcing.domain import Aggregate
+
+# Aggregate id -> (aggregate, version it was loaded or saved at)
+_identity_map: ContextVar[dict[UUID, tuple[Aggregate, int]] | None] = ContextVar(
+    "aggregate_identity_map",
+    default=None,
+)
+
+
+@contextmanager
+def aggregate_identity_map() -> Iterator[None]:
+    """Scope an identity map to the enclosed unit of work."""
+    token = _identity_map.set({})
+    try:
+        yield
+    finally:
+        _identity_map.reset(token)
+
+
+def get_cached(aggregate_id: UUID) -> Aggregate | None:
+    """Return the aggregate loaded or saved earlier in this scope, if unchanged since."""
+    cache = _identity_map.get()
+    if cache is None or aggregate_id not in cache:
+        return None
+    aggregate, version = cache[aggregate_id]
+    if aggregate.version != version:
+        # Mutated since it was loaded or saved, and not saved since.
+        del cache[aggregate_id]
+        return None
+    return aggregate
+
+
+def remember(aggregate: Aggregate) -> None:
+    """Record a loaded or saved aggregate for the current scope."""
+    cache = _identity_map.get()
+    if cache is not None:
+        cache[aggregate.id] = (aggregate, aggregate.version)
+
+
+def forget(aggregate_id: UUID) -> None:
+    """Drop an aggregate whose in-memory state may no longer match the store."""
+    cache = _identity_map.get()
+    if cache is not None:
+        cache.pop(aggregate_id, None)
@@ -1,11 +1,13 @@
 from uuid import UUID
 
+from eventsourcing.application import AggregateNotFoundError as EventSourcingNotFoundError
 from eventsourcing.application import Application
 from eventsourcing.persistence import IntegrityError as EventSourcingIntegrityError
 
 from application.ports.repositories.page_repository import PageRepository
 from domain.aggregates.page import Page
 from domain.exceptions import AggregateNotFoundError, ConcurrencyError, InfrastructureError
+from infrastructure.event_sourced_repositories import identity_map
 
 
 def _raise_page_not_found(page_id: UUID) -> None:
@@ -34,12 +36,15 @@ class EventSourcedPageRepository(PageRepository):
         try:
             self.application.save(page)
         except EventSourcingIntegrityError as e:
+            identity_map.forget(page.id)
             msg = f"Concurrency conflict saving page: {e!s}"
             raise ConcurrencyError(msg) from e
         except Exception as e:
             # Let infrastructure errors bubble up for proper error handling at API layer
+            identity_map.forget(page.id)
             msg = f"Failed to save page: {e!s}"
             raise InfrastructureError(msg) from e
+        identity_map.remember(page)
 
     def get_by_id(self, page_id: UUID) -> Page:
         """Retrieve Page by rebuilding from event history.
@@ -49,20 +54,19 @@ class EventSourcedPageRepository(PageRepository):
             InfrastructureError: If the event store operation fails.
 
         """
+        cached = identity_map.get_cached(page_id)
+        if isinstance(cached, Page):
+            return cached
         try:
             page = self.application.repository.get(page_id)
-            if isinstance(page, Page):
-                return page
-            # This shouldn't happen in normal circumstances
-            _raise_page_not_found(page_id)
-        except AggregateNotFoundError:
-            # Re-raise our domain exception
-            raise
+        except EventSourcingNotFoundError as e:
+            msg = f"Page {page_id} not found"
+            raise AggregateNotFoundError(msg) from e
         except Exception as e:
-            # Check if it's a 'not found' error from eventsourcing
-            error_msg = str(e).lower()
-            if "not found" in error_msg or "does not exist" in error_msg:
-                msg = f"Page {page_id} not found"
-                raise AggregateNotFoundError(msg) from e
             # Any other exception (network error, DB error, etc.) is an infrastructure error
             _raise_page_retrieval_error(page_id, e)
+        if not isinstance(page, Page):
+            # This shouldn't happen in normal circumstances
+            _raise_page_not_found(page_id)
+        identity_map.remember(page)
+        return page
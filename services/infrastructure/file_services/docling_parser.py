@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import io
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import structlog
@@ -15,6 +17,8 @@ from application.dtos.parsed_document import (
 from application.ports.document_parser import DocumentParser
 
 if TYPE_CHECKING:
+    from PIL import Image
+
     from application.ports.blob_store import BlobStore
 
 log = structlog.get_logger(__name__)
@@ -48,14 +52,18 @@ def _dataframe_to_rows(df) -> list[list[str]]:
     return [[str(c) for c in df.columns], *df.astype(str).values.tolist()]
 
 
-def _make_thumb(png: bytes) -> bytes | None:
+def _make_thumb(img: Image.Image) -> bytes | None:
+    """JPEG thumbnail of an RGB page image, downscaled straight from the render."""
     try:
         from PIL import Image
 
-        img = Image.open(io.BytesIO(png))
-        img.thumbnail((_THUMB_MAX, _THUMB_MAX))
+        scale = _THUMB_MAX / max(img.size)
+        if scale < 1:
+            # Same filter as Image.thumbnail, without copying the full page first
+            size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+            img = img.resize(size, Image.Resampling.BICUBIC, reducing_gap=2.0)
         out = io.BytesIO()
-        img.convert("RGB").save(out, format="JPEG", quality=80)
+        img.save(out, format="JPEG", quality=80)
         return out.getvalue()
     except Exception:
         log.warning("docling_parser.thumb_failed", exc_info=True)
@@ -98,12 +106,15 @@ class DoclingParser(DocumentParser):
 
         assign_section_paths(blocks)
 
-        # dl_doc.pages is dict[int, PageItem] keyed by 1-based page number
-        pages: list[RenderedPage] = []
-        for page_no in sorted(dl_doc.pages):
-            png = self._page_png(dl_doc, page_no)
-            if png is not None:
-                pages.append(RenderedPage(index=page_no - 1, png=png, thumb=_make_thumb(png)))
+        # dl_doc.pages is dict[int, PageItem] keyed by 1-based page number.
+        # Pillow's PNG/JPEG encoders release the GIL, so pages encode in parallel.
+        page_nos = sorted(dl_doc.pages)
+        workers = max(1, min(len(page_nos), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            rendered = list(
+                pool.map(lambda page_no: self._rendered_page(dl_doc, page_no), page_nos)
+            )
+        pages = [page for page in rendered if page is not None]
 
         return ParseResult(
             document=ParsedDocument(source_mime="application/pdf", blocks=blocks),
@@ -161,7 +172,7 @@ class DoclingParser(DocumentParser):
             log.warning("docling_parser.table_export_failed", exc_info=True)
             return []
 
-    def _page_png(self, dl_doc, page_no: int) -> bytes | None:
+    def _rendered_page(self, dl_doc, page_no: int) -> RenderedPage | None:
         try:
             page = dl_doc.pages[page_no]
             # page.image is ImageRef; .pil_image is a property -> Optional[PIL.Image.Image]
@@ -169,9 +180,12 @@ class DoclingParser(DocumentParser):
             if pil_img is None:
                 log.warning("docling_parser.page_image_missing", page_no=page_no)
                 return None
+            # One RGB image feeds both encoders: the thumbnail is resized from
+            # it instead of decoding the PNG again, and an RGB render isn't copied.
+            rgb = pil_img if pil_img.mode == "RGB" else pil_img.convert("RGB")
             out = io.BytesIO()
-            pil_img.convert("RGB").save(out, format="PNG")
-            return out.getvalue()
+            rgb.save(out, format="PNG")
+            return RenderedPage(index=page_no - 1, png=out.getvalue(), thumb=_make_thumb(rgb))
         except Exception:
             log.warning("docling_parser.page_image_failed", page_no=page_no, exc_info=True)
             return None
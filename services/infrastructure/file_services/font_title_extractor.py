@@ -74,7 +74,12 @@ class FontTitleExtractor:
                 return []
 
             page = doc[page_index]
-            page_dict = page.get_text("dict")
+            # Only text spans are read; leaving out TEXT_PRESERVE_IMAGES stops
+            # MuPDF from decoding and copying every image into the dict.
+            page_dict = page.get_text(
+                "dict",
+                flags=fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES,
+            )
 
             spans: list[_FontSpan] = []
             for block in page_dict.get("blocks", []):
@@ -23,7 +23,13 @@ class KafkaPublisher:
     """
 
     def __init__(self) -> None:
-        self._producer = Producer({"bootstrap.servers": settings.kafka_bootstrap_servers})
+        self._producer = Producer(
+            {
+                "bootstrap.servers": settings.kafka_bootstrap_servers,
+                "linger.ms": settings.kafka_linger_ms,
+                "compression.type": settings.kafka_compression_type,
+            },
+        )
         self._topic = settings.kafka_topic
         self._poll_thread: threading.Thread | None = None
         self._stop_event = threading.Event()
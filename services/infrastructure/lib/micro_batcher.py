@@ -0,0 +1,71 @@
+"""Coalesce concurrent single-item calls into one batched call.
+
+A model forward pass costs almost the same for one input as for a few
+dozen, so answering N concurrent single-item requests with N forwards wastes
+most of the work. ``MicroBatcher.submit`` parks each item for at most
+``max_wait`` seconds (or until ``max_size`` items are waiting), then runs the
+blocking ``batch_fn`` once on a worker thread and hands every caller its own
+result.
+
+The flush runs in its own task, so a caller that is cancelled while waiting
+neither loses the batch for the others nor leaves them waiting forever.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+class MicroBatcher[T, R]:
+    """Batches ``submit`` calls that arrive within a short window."""
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[T]], Sequence[R]],
+        *,
+        max_size: int,
+        max_wait: float,
+    ) -> None:
+        self._batch_fn = batch_fn
+        self._max_size = max_size
+        self._max_wait = max_wait
+        self._pending: list[tuple[T, asyncio.Future[R]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    async def submit(self, item: T) -> R:
+        """Return ``batch_fn``'s result for ``item``, computed with its neighbours."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self._max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _run(self, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        try:
+            results = await asyncio.to_thread(self._batch_fn, [item for item, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
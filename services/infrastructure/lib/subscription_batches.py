@@ -0,0 +1,76 @@
+"""Batch a blocking event subscription for an asyncio consumer.
+
+``ApplicationSubscription`` is a blocking iterator. Iterating it directly from
+a coroutine stalls the event loop while it waits for the next event, and the
+consumer only ever sees one event at a time. ``iter_batches`` moves iteration
+to a producer thread that feeds a bounded queue; the consumer takes the next
+available item plus whatever else arrives within ``max_wait`` seconds, so a
+burst of events can be handled (and de-duplicated) as one batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
+_DONE = object()
+
+
+class _Failed:
+    """Carries an exception raised by the producer thread to the consumer."""
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+async def iter_batches[T](
+    items: Iterable[T],
+    *,
+    max_size: int,
+    max_wait: float,
+) -> AsyncIterator[list[T]]:
+    """Yield ``items`` in order, grouped into batches of at most ``max_size``.
+
+    An exception raised by ``items`` is re-raised after the items received
+    before it have been yielded.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[object] = asyncio.Queue(maxsize=max_size * 4)
+
+    def put(item: object) -> None:
+        asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+    def produce() -> None:
+        try:
+            for item in items:
+                put(item)
+        except Exception as exc:
+            put(_Failed(exc))
+        else:
+            put(_DONE)
+
+    threading.Thread(target=produce, name="subscription-batches", daemon=True).start()
+
+    while True:
+        batch: list[T] = []
+        item = await queue.get()
+        deadline = loop.time() + max_wait
+        while item is not _DONE and not isinstance(item, _Failed):
+            batch.append(item)  # type: ignore[arg-type]
+            if len(batch) >= max_size:
+                break
+            try:
+                item = await asyncio.wait_for(queue.get(), max(deadline - loop.time(), 0))
+            except TimeoutError:
+                break
+
+        if batch:
+            yield batch
+        if isinstance(item, _Failed):
+            raise item.error
+        if item is _DONE:
+            return
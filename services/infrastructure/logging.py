@@ -1,12 +1,44 @@
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
+from uuid import UUID
 
 import structlog
 
 from infrastructure.config import settings
 
 
+def _stringify_uuids(
+    _logger: object,
+    _method_name: str,
+    event_dict: structlog.types.EventDict,
+) -> structlog.types.EventDict:
+    """Render UUID values as plain strings.
+
+    Lets call sites pass ids as-is (``page_id=page_id``) so the string is only
+    built for records that survive level filtering.
+    """
+    for key, value in event_dict.items():
+        if isinstance(value, UUID):
+            event_dict[key] = str(value)
+    return event_dict
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records untouched for a ``QueueListener`` in the same process.
+
+    The base class formats the record and flattens ``msg`` to a string before
+    enqueueing it, which would hand ``ProcessorFormatter`` a string instead of
+    structlog's event dict. Nothing is pickled here, so the record can travel
+    as-is and is formatted on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 def setup_logging() -> None:
     """Configure unified logging for structlog, uvicorn, and standard library."""
     # Ensure log directory exists
@@ -19,6 +51,7 @@ def setup_logging() -> None:
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
+        _stringify_uuids,
     ]
 
     if settings.app_env == "development":
@@ -28,6 +61,8 @@ def setup_logging() -> None:
 
     structlog.configure(
         processors=[
+            # Drop records below the configured level before any other processing.
+            structlog.stdlib.filter_by_level,
             *common_processors,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
@@ -52,14 +87,21 @@ def setup_logging() -> None:
     )
     file_handler.setFormatter(formatter)
 
+    # Formatting and the stdout/file writes run on a listener thread, so a
+    # log call on a request or worker thread is only an enqueue.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = _InProcessQueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
     # Root Logger
     root_logger = logging.getLogger()
-    root_logger.addHandler(stream_handler)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(queue_handler)
     root_logger.setLevel(settings.log_level.upper())
 
     # Intercept Uvicorn/FastAPI logs
     for logger_name in ("uvicorn", "uvicorn.error", "uvicorn.access", "fastapi"):
         logging_logger = logging.getLogger(logger_name)
-        logging_logger.handlers = [stream_handler, file_handler]
+        logging_logger.handlers = [queue_handler]
         logging_logger.propagate = False
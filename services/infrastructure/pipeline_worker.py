@@ -15,6 +15,7 @@ from __future__ import annotations
 import asyncio
 import os
 import signal
+from typing import TYPE_CHECKING
 
 import structlog
 from eventsourcing.application import Application
@@ -58,12 +59,22 @@ from domain.aggregates.artifact import Artifact
 from domain.aggregates.page import Page
 from infrastructure.config import settings
 from infrastructure.di.container import create_container
+from infrastructure.event_sourced_repositories.identity_map import aggregate_identity_map
 from infrastructure.lib.pipeline_worker_tracking import PipelineWorkerTracking
+from infrastructure.lib.subscription_batches import iter_batches
 from infrastructure.logging import setup_logging
 
+if TYPE_CHECKING:
+    from uuid import UUID
+
 setup_logging()
 logger = structlog.get_logger()
 
+# Events that arrive together (e.g. one Page.SummaryCandidateUpdated per page
+# as a document finishes) are handled as one batch.
+_BATCH_MAX_EVENTS = 64
+_BATCH_MAX_WAIT_SECONDS = 0.005
+
 
 async def run(worker_name: str = "pipeline_worker") -> None:
     """Run the workflow orchestration worker.
@@ -103,6 +114,35 @@ async def run(worker_name: str = "pipeline_worker") -> None:
 
     trigger_batch_reembed_use_case = container[TriggerBatchReEmbedUseCase]
 
+    async def trigger_artifact_summaries(summarized_pages: dict[UUID, set[UUID]]) -> None:
+        """Check summarization readiness once per artifact with pages summarized in a batch.
+
+        A burst of Page.SummaryCandidateUpdated events for one artifact costs a
+        single artifact load and read model count instead of one per page.
+        """
+
+        async def check(artifact_id: UUID, page_ids: set[UUID]) -> None:
+            try:
+                with aggregate_identity_map():
+                    started = await trigger_artifact_summarization_use_case.execute(
+                        artifact_id=artifact_id,
+                        summarized_page_ids=page_ids,
+                    )
+                    # When all page summaries are complete, batch re-embed ALL
+                    # pages with full contextual prefixes (title + tags + summary)
+                    # in a single workflow instead of 100 individual ones.
+                    if started is not None:
+                        await trigger_batch_reembed_use_case.execute(artifact_id=artifact_id)
+            except Exception:
+                logger.exception(
+                    "pipeline_artifact_summarization_check_error",
+                    artifact_id=str(artifact_id),
+                )
+
+        async with asyncio.TaskGroup() as tg:
+            for artifact_id, page_ids in summarized_pages.items():
+                tg.create_task(check(artifact_id, page_ids))
+
     # Setup signal handlers
     def handle_signal(signum: int, _frame: object) -> None:
         logger.info("pipeline_worker_signal_received", signum=signum)
@@ -159,237 +199,264 @@ async def run(worker_name: str = "pipeline_worker") -> None:
         event_count = 0
         with subscription:
             try:
-                for domain_event, tracking in subscription:
-                    try:
-                        event_count += 1
-
-                        match domain_event:
-                            case Page.Created():
-                                logger.info(
-                                    "pipeline_page_created_event_received",
-                                    page_id=str(domain_event.originator_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                                await trigger_compound_extraction_use_case.execute(
-                                    page_id=domain_event.originator_id,
-                                )
-
-                                logger.info(
-                                    "pipeline_compound_extraction_workflow_triggered",
-                                    page_id=str(domain_event.originator_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                            case Artifact.Created():
-                                logger.info(
-                                    "pipeline_artifact_created_event_received",
-                                    artifact_id=str(domain_event.originator_id),
-                                    storage_location=domain_event.storage_location,
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                                await trigger_artifact_parse_use_case.execute(
-                                    artifact_id=domain_event.originator_id,
-                                )
-
-                                logger.info(
-                                    "pipeline_artifact_parse_workflow_triggered",
-                                    artifact_id=str(domain_event.originator_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                                # Note: Sentinel resource registration is handled by
-                                # ArtifactUploadSaga (with user-specified visibility),
-                                # not here in the pipeline worker.
-
-                            case Page.TextMentionUpdated():
-                                logger.info(
-                                    "pipeline_text_mention_updated",
-                                    page_id=str(domain_event.originator_id),
-                                    artifact_id=str(domain_event.artifact_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                                # Summarization starts directly — no longer blocked behind embedding.
-                                # Embedding happens ONCE after all summaries complete (batch embed).
-                                await trigger_page_summarization_use_case.execute(
-                                    page_id=domain_event.originator_id,
-                                )
-
-                                # NER runs in parallel with summarization
-                                await trigger_ner_extraction_use_case.execute(
-                                    page_id=domain_event.originator_id,
-                                )
-
-                                # Doc metadata extraction (title, authors, date) — only runs for page 0
-                                await trigger_doc_metadata_extraction_use_case.execute(
-                                    page_id=domain_event.originator_id,
-                                    artifact_id=domain_event.artifact_id,
-                                )
-
-                                logger.info(
-                                    "pipeline_summarization_ner_metadata_workflows_triggered",
-                                    page_id=str(domain_event.originator_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                            case Page.SummaryCandidateUpdated():
-                                logger.info(
-                                    "pipeline_summary_candidate_updated",
-                                    page_id=str(domain_event.originator_id),
-                                    artifact_id=str(domain_event.artifact_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                                # Check if all pages are done → trigger artifact summarization
-                                # artifact_id is now on the event — no need to load the page aggregate
-                                summarization_result = (
-                                    await trigger_artifact_summarization_use_case.execute(
-                                        artifact_id=domain_event.artifact_id,
-                                    )
-                                )
-
-                                # Embed this page's summary into the summary_embeddings collection
-                                await trigger_page_summary_embedding_use_case.execute(
-                                    page_id=domain_event.originator_id,
-                                )
-
-                                # When all page summaries are complete, batch re-embed ALL
-                                # pages with full contextual prefixes (title + tags + summary)
-                                # in a single workflow instead of 100 individual ones.
-                                if summarization_result is not None:
-                                    await trigger_batch_reembed_use_case.execute(
-                                        artifact_id=domain_event.artifact_id,
-                                    )
-
-                                logger.info(
-                                    "pipeline_page_summary_workflows_triggered",
-                                    page_id=str(domain_event.originator_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                            case Artifact.SummaryCandidateUpdated():
-                                logger.info(
-                                    "pipeline_artifact_summary_candidate_updated",
-                                    artifact_id=str(domain_event.originator_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                                await trigger_artifact_summary_embedding_use_case.execute(
-                                    artifact_id=domain_event.originator_id,
-                                )
-
-                                logger.info(
-                                    "pipeline_artifact_summary_embedding_triggered",
-                                    artifact_id=str(domain_event.originator_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                            case Page.CompoundMentionsUpdated():
-                                logger.info(
-                                    "pipeline_compound_mentions_updated",
-                                    page_id=str(domain_event.originator_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                                await trigger_smiles_embedding_use_case.execute(
-                                    page_id=domain_event.originator_id,
-                                )
-
-                                logger.info(
-                                    "pipeline_smiles_embedding_workflow_triggered",
-                                    page_id=str(domain_event.originator_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                            case Page.TagMentionsUpdated():
-                                logger.info(
-                                    "pipeline_tag_mentions_updated",
-                                    page_id=str(domain_event.originator_id),
-                                    artifact_id=str(domain_event.artifact_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                                await trigger_artifact_tag_aggregation_use_case.execute(
-                                    artifact_id=domain_event.artifact_id,
-                                )
-
-                                # Sync tags to Qdrant payloads (page_embeddings + summary_embeddings)
-                                await sync_page_tags_use_case.execute(
-                                    page_id=domain_event.originator_id,
-                                )
-
-                                logger.info(
-                                    "pipeline_artifact_tag_aggregation_triggered",
-                                    page_id=str(domain_event.originator_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                            case Artifact.TagMentionsUpdated():
-                                logger.info(
-                                    "pipeline_artifact_tag_mentions_updated",
-                                    artifact_id=str(domain_event.originator_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-                                await sync_artifact_metadata_use_case.execute(
-                                    artifact_id=domain_event.originator_id,
-                                )
-                                logger.info(
-                                    "pipeline_artifact_metadata_synced",
-                                    artifact_id=str(domain_event.originator_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                            case Artifact.AuthorMentionsUpdated():
-                                logger.info(
-                                    "pipeline_artifact_author_mentions_updated",
-                                    artifact_id=str(domain_event.originator_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-                                await sync_artifact_metadata_use_case.execute(
-                                    artifact_id=domain_event.originator_id,
-                                )
-                                logger.info(
-                                    "pipeline_artifact_metadata_synced",
-                                    artifact_id=str(domain_event.originator_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                            case Artifact.PresentationDateUpdated():
-                                logger.info(
-                                    "pipeline_artifact_presentation_date_updated",
-                                    artifact_id=str(domain_event.originator_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-                                await sync_artifact_metadata_use_case.execute(
-                                    artifact_id=domain_event.originator_id,
-                                )
-                                logger.info(
-                                    "pipeline_artifact_metadata_synced",
-                                    artifact_id=str(domain_event.originator_id),
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                            case _:
-                                logger.warning(
-                                    "pipeline_unhandled_event",
-                                    event_type=type(domain_event).__name__,
-                                    tracking_id=tracking.notification_id,
-                                )
-
-                        pipeline_tracking.save_position(tracking.notification_id)
-
-                    except Exception:
-                        logger.exception(
-                            "pipeline_event_processing_error",
-                            event_type=type(domain_event).__name__,
-                            tracking_id=tracking.notification_id,
-                        )
-                        # Don't re-raise - continue processing other events
-                        logger.warning("pipeline_continuing_after_error")
-
-            except StopIteration:
+                async for batch in iter_batches(
+                    subscription,
+                    max_size=_BATCH_MAX_EVENTS,
+                    max_wait=_BATCH_MAX_WAIT_SECONDS,
+                ):
+                    # Page summaries in this batch, per artifact; the artifact
+                    # readiness check runs once per artifact after the batch.
+                    summarized_pages: dict[UUID, set[UUID]] = {}
+                    for domain_event, tracking in batch:
+                        try:
+                            event_count += 1
+
+                            # Pipeline events are independent units of work; scope aggregate
+                            # loads to this event so repeat get_by_id calls hit memory.
+                            with aggregate_identity_map():
+                                match domain_event:
+                                    case Page.Created():
+                                        logger.info(
+                                            "pipeline_page_created_event_received",
+                                            page_id=str(domain_event.originator_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                        await trigger_compound_extraction_use_case.execute(
+                                            page_id=domain_event.originator_id,
+                                        )
+
+                                        logger.info(
+                                            "pipeline_compound_extraction_workflow_triggered",
+                                            page_id=str(domain_event.originator_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                    case Artifact.Created():
+                                        logger.info(
+                                            "pipeline_artifact_created_event_received",
+                                            artifact_id=str(domain_event.originator_id),
+                                            storage_location=domain_event.storage_location,
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                        await trigger_artifact_parse_use_case.execute(
+                                            artifact_id=domain_event.originator_id,
+                                        )
+
+                                        logger.info(
+                                            "pipeline_artifact_parse_workflow_triggered",
+                                            artifact_id=str(domain_event.originator_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                        # Note: Sentinel resource registration is handled by
+                                        # ArtifactUploadSaga (with user-specified visibility),
+                                        # not here in the pipeline worker.
+
+                                    case Page.TextMentionUpdated():
+                                        logger.info(
+                                            "pipeline_text_mention_updated",
+                                            page_id=str(domain_event.originator_id),
+                                            artifact_id=str(domain_event.artifact_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                        # The three triggers are independent; start them together so
+                                        # their orchestrator/event store round trips overlap.
+                                        async with asyncio.TaskGroup() as tg:
+                                            # Summarization starts directly — not blocked behind embedding.
+                                            # Embedding happens ONCE after all summaries complete (batch embed).
+                                            tg.create_task(
+                                                trigger_page_summarization_use_case.execute(
+                                                    page_id=domain_event.originator_id,
+                                                ),
+                                            )
+
+                                            # NER runs in parallel with summarization
+                                            tg.create_task(
+                                                trigger_ner_extraction_use_case.execute(
+                                                    page_id=domain_event.originator_id,
+                                                ),
+                                            )
+
+                                            # Doc metadata extraction (title, authors, date) — page 0 only
+                                            tg.create_task(
+                                                trigger_doc_metadata_extraction_use_case.execute(
+                                                    page_id=domain_event.originator_id,
+                                                    artifact_id=domain_event.artifact_id,
+                                                ),
+                                            )
+
+                                        logger.info(
+                                            "pipeline_summarization_ner_metadata_workflows_triggered",
+                                            page_id=str(domain_event.originator_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                    case Page.SummaryCandidateUpdated():
+                                        logger.info(
+                                            "pipeline_summary_candidate_updated",
+                                            page_id=str(domain_event.originator_id),
+                                            artifact_id=str(domain_event.artifact_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                        # Embed this page's summary into the summary_embeddings collection
+                                        summary_candidate = domain_event.summary_candidate
+                                        await trigger_page_summary_embedding_use_case.execute(
+                                            page_id=domain_event.originator_id,
+                                            has_summary=bool(
+                                                summary_candidate and summary_candidate.summary,
+                                            ),
+                                        )
+
+                                        # Whether all pages are done is checked once per artifact
+                                        # after the batch (see trigger_artifact_summaries).
+                                        # artifact_id is on the event — no need to load the page aggregate
+                                        pages = summarized_pages.setdefault(
+                                            domain_event.artifact_id,
+                                            set(),
+                                        )
+                                        pages.add(domain_event.originator_id)
+
+                                        logger.info(
+                                            "pipeline_page_summary_workflows_triggered",
+                                            page_id=str(domain_event.originator_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                    case Artifact.SummaryCandidateUpdated():
+                                        logger.info(
+                                            "pipeline_artifact_summary_candidate_updated",
+                                            artifact_id=str(domain_event.originator_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                        summary_candidate = domain_event.summary_candidate
+                                        await trigger_artifact_summary_embedding_use_case.execute(
+                                            artifact_id=domain_event.originator_id,
+                                            has_summary=bool(
+                                                summary_candidate and summary_candidate.summary,
+                                            ),
+                                        )
+
+                                        logger.info(
+                                            "pipeline_artifact_summary_embedding_triggered",
+                                            artifact_id=str(domain_event.originator_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                    case Page.CompoundMentionsUpdated():
+                                        logger.info(
+                                            "pipeline_compound_mentions_updated",
+                                            page_id=str(domain_event.originator_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                        await trigger_smiles_embedding_use_case.execute(
+                                            page_id=domain_event.originator_id,
+                                            compound_mentions=domain_event.compound_mentions,
+                                        )
+
+                                        logger.info(
+                                            "pipeline_smiles_embedding_workflow_triggered",
+                                            page_id=str(domain_event.originator_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                    case Page.TagMentionsUpdated():
+                                        logger.info(
+                                            "pipeline_tag_mentions_updated",
+                                            page_id=str(domain_event.originator_id),
+                                            artifact_id=str(domain_event.artifact_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                        async with asyncio.TaskGroup() as tg:
+                                            tg.create_task(
+                                                trigger_artifact_tag_aggregation_use_case.execute(
+                                                    artifact_id=domain_event.artifact_id,
+                                                ),
+                                            )
+
+                                            # Sync tags to Qdrant payloads (page_embeddings + summary_embeddings)
+                                            tg.create_task(
+                                                sync_page_tags_use_case.execute(
+                                                    page_id=domain_event.originator_id,
+                                                ),
+                                            )
+
+                                        logger.info(
+                                            "pipeline_artifact_tag_aggregation_triggered",
+                                            page_id=str(domain_event.originator_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                    case Artifact.TagMentionsUpdated():
+                                        logger.info(
+                                            "pipeline_artifact_tag_mentions_updated",
+                                            artifact_id=str(domain_event.originator_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+                                        await sync_artifact_metadata_use_case.execute(
+                                            artifact_id=domain_event.originator_id,
+                                        )
+                                        logger.info(
+                                            "pipeline_artifact_metadata_synced",
+                                            artifact_id=str(domain_event.originator_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                    case Artifact.AuthorMentionsUpdated():
+                                        logger.info(
+                                            "pipeline_artifact_author_mentions_updated",
+                                            artifact_id=str(domain_event.originator_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+                                        await sync_artifact_metadata_use_case.execute(
+                                            artifact_id=domain_event.originator_id,
+                                        )
+                                        logger.info(
+                                            "pipeline_artifact_metadata_synced",
+                                            artifact_id=str(domain_event.originator_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                    case Artifact.PresentationDateUpdated():
+                                        logger.info(
+                                            "pipeline_artifact_presentation_date_updated",
+                                            artifact_id=str(domain_event.originator_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+                                        await sync_artifact_metadata_use_case.execute(
+                                            artifact_id=domain_event.originator_id,
+                                        )
+                                        logger.info(
+                                            "pipeline_artifact_metadata_synced",
+                                            artifact_id=str(domain_event.originator_id),
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                                    case _:
+                                        logger.warning(
+                                            "pipeline_unhandled_event",
+                                            event_type=type(domain_event).__name__,
+                                            tracking_id=tracking.notification_id,
+                                        )
+
+                        except Exception:
+                            logger.exception(
+                                "pipeline_event_processing_error",
+                                event_type=type(domain_event).__name__,
+                                tracking_id=tracking.notification_id,
+                            )
+                            # Don't re-raise - continue processing other events
+                            logger.warning("pipeline_continuing_after_error")
+
+                    await trigger_artifact_summaries(summarized_pages)
+                    pipeline_tracking.save_position(batch[-1][1].notification_id)
+
                 logger.info("pipeline_subscription_stopped")
             finally:
                 logger.info("pipeline_subscription_closed", events_processed=event_count)
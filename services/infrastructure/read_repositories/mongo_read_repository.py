@@ -1,4 +1,5 @@
 import time
+from collections.abc import Collection
 from datetime import UTC, datetime
 from uuid import UUID
 
@@ -87,14 +88,19 @@ class MongoReadRepository(
         pages.sort(key=lambda p: p.index)
         return pages
 
-    async def count_pages_with_summaries(self, artifact_id: UUID) -> int:
+    async def count_pages_with_summaries(
+        self,
+        artifact_id: UUID,
+        exclude_page_ids: Collection[UUID] = (),
+    ) -> int:
         """Count pages belonging to an artifact that have a non-empty summary."""
-        return await self.pages.count_documents(
-            {
-                "artifact_id": str(artifact_id),
-                "summary_candidate.summary": {"$exists": True, "$ne": ""},
-            },
-        )
+        query: dict = {
+            "artifact_id": str(artifact_id),
+            "summary_candidate.summary": {"$exists": True, "$ne": ""},
+        }
+        if exclude_page_ids:
+            query["page_id"] = {"$nin": [str(pid) for pid in exclude_page_ids]}
+        return await self.pages.count_documents(query)
 
     async def get_pages_by_artifact_ids(
         self,
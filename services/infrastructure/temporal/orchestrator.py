@@ -17,6 +17,7 @@ if TYPE_CHECKING:
 
 from application.dtos.workflow_dtos import TemporalWorkflowInfo
 from application.ports.workflow_orchestrator import WorkflowOrchestrator
+from application.workflow_use_cases.workflow_ids import workflow_id_for
 from infrastructure.config import settings
 
 logger = structlog.get_logger()
@@ -62,7 +63,7 @@ class TemporalWorkflowOrchestrator(WorkflowOrchestrator):
         """
         await self._ensure_client()
 
-        workflow_id = f"embedding-{page_id}"
+        workflow_id = workflow_id_for("embedding", page_id)
         input_data = {"page_id": str(page_id), "skip_sparse": skip_sparse}
 
         try:
@@ -92,7 +93,7 @@ class TemporalWorkflowOrchestrator(WorkflowOrchestrator):
         """
         await self._ensure_client()
 
-        workflow_id = f"compound-extraction-{page_id}"
+        workflow_id = workflow_id_for("compound-extraction", page_id)
 
         try:
             await self._client.start_workflow(
@@ -116,7 +117,7 @@ class TemporalWorkflowOrchestrator(WorkflowOrchestrator):
         """Start the SMILES embedding workflow for a page."""
         await self._ensure_client()
 
-        workflow_id = f"smiles-embedding-{page_id}"
+        workflow_id = workflow_id_for("smiles-embedding", page_id)
 
         try:
             await self._client.start_workflow(
@@ -140,7 +141,7 @@ class TemporalWorkflowOrchestrator(WorkflowOrchestrator):
         """Start the LLM summarization workflow for a page."""
         await self._ensure_client()
 
-        workflow_id = f"page-summarization-{page_id}"
+        workflow_id = workflow_id_for("page-summarization", page_id)
 
         try:
             await self._client.start_workflow(
@@ -170,7 +171,7 @@ class TemporalWorkflowOrchestrator(WorkflowOrchestrator):
 
         from temporalio.common import WorkflowIDReusePolicy
 
-        workflow_id = f"artifact-summarization-{artifact_id}"
+        workflow_id = workflow_id_for("artifact-summarization", artifact_id)
 
         try:
             await self._client.start_workflow(
@@ -195,7 +196,7 @@ class TemporalWorkflowOrchestrator(WorkflowOrchestrator):
         """Start the page summary embedding workflow."""
         await self._ensure_client()
 
-        workflow_id = f"page-summary-embedding-{page_id}"
+        workflow_id = workflow_id_for("page-summary-embedding", page_id)
 
         try:
             await self._client.start_workflow(
@@ -221,7 +222,7 @@ class TemporalWorkflowOrchestrator(WorkflowOrchestrator):
 
         from temporalio.common import WorkflowIDReusePolicy
 
-        workflow_id = f"artifact-summary-embedding-{artifact_id}"
+        workflow_id = workflow_id_for("artifact-summary-embedding", artifact_id)
 
         try:
             await self._client.start_workflow(
@@ -249,7 +250,7 @@ class TemporalWorkflowOrchestrator(WorkflowOrchestrator):
 
         from temporalio.common import WorkflowIDReusePolicy
 
-        workflow_id = f"doc-metadata-{artifact_id}"
+        workflow_id = workflow_id_for("doc-metadata", artifact_id)
 
         try:
             await self._client.start_workflow(
@@ -278,7 +279,7 @@ class TemporalWorkflowOrchestrator(WorkflowOrchestrator):
 
         from temporalio.common import WorkflowIDReusePolicy
 
-        workflow_id = f"ner-extraction-{page_id}"
+        workflow_id = workflow_id_for("ner-extraction", page_id)
 
         try:
             await self._client.start_workflow(
@@ -302,7 +303,7 @@ class TemporalWorkflowOrchestrator(WorkflowOrchestrator):
 
         from temporalio.common import WorkflowIDReusePolicy
 
-        workflow_id = f"artifact-tag-aggregation-{artifact_id}"
+        workflow_id = workflow_id_for("artifact-tag-aggregation", artifact_id)
 
         try:
             await self._client.start_workflow(
@@ -329,7 +330,7 @@ class TemporalWorkflowOrchestrator(WorkflowOrchestrator):
 
         from temporalio.common import WorkflowIDReusePolicy
 
-        workflow_id = f"batch-reembed-{artifact_id}"
+        workflow_id = workflow_id_for("batch-reembed", artifact_id)
 
         try:
             await self._client.start_workflow(
@@ -357,7 +358,7 @@ class TemporalWorkflowOrchestrator(WorkflowOrchestrator):
         """Start the durable parse workflow for an artifact."""
         await self._ensure_client()
 
-        workflow_id = f"artifact-parse-{artifact_id}"
+        workflow_id = workflow_id_for("artifact-parse", artifact_id)
 
         try:
             await self._client.start_workflow(
@@ -383,7 +384,7 @@ class TemporalWorkflowOrchestrator(WorkflowOrchestrator):
 
         from temporalio.common import WorkflowIDReusePolicy
 
-        workflow_id = f"batch-reembed-smiles-{artifact_id}"
+        workflow_id = workflow_id_for("batch-reembed-smiles", artifact_id)
 
         try:
             await self._client.start_workflow(
@@ -413,7 +414,7 @@ class TemporalWorkflowOrchestrator(WorkflowOrchestrator):
 
         from temporalio.common import WorkflowIDReusePolicy
 
-        workflow_id = f"batch-reembed-summaries-{artifact_id}"
+        workflow_id = workflow_id_for("batch-reembed-summaries", artifact_id)
 
         try:
             await self._client.start_workflow(
@@ -441,12 +442,12 @@ class TemporalWorkflowOrchestrator(WorkflowOrchestrator):
         """Query Temporal for the status of all workflows associated with a page."""
         await self._ensure_client()
         workflow_ids = {
-            "embedding": f"embedding-{page_id}",
-            "compound_extraction": f"compound-extraction-{page_id}",
-            "smiles_embedding": f"smiles-embedding-{page_id}",
-            "page_summarization": f"page-summarization-{page_id}",
-            "page_summary_embedding": f"page-summary-embedding-{page_id}",
-            "ner_extraction": f"ner-extraction-{page_id}",
+            "embedding": workflow_id_for("embedding", page_id),
+            "compound_extraction": workflow_id_for("compound-extraction", page_id),
+            "smiles_embedding": workflow_id_for("smiles-embedding", page_id),
+            "page_summarization": workflow_id_for("page-summarization", page_id),
+            "page_summary_embedding": workflow_id_for("page-summary-embedding", page_id),
+            "ner_extraction": workflow_id_for("ner-extraction", page_id),
         }
         return await self._query_workflow_statuses(workflow_ids)
 
@@ -458,9 +459,12 @@ class TemporalWorkflowOrchestrator(WorkflowOrchestrator):
         await self._ensure_client()
         workflow_ids = {
             "artifact_processing": str(artifact_id),
-            "artifact_summarization": f"artifact-summarization-{artifact_id}",
-            "artifact_summary_embedding": f"artifact-summary-embedding-{artifact_id}",
-            "doc_metadata_extraction": f"doc-metadata-{artifact_id}",
+            "artifact_summarization": workflow_id_for("artifact-summarization", artifact_id),
+            "artifact_summary_embedding": workflow_id_for(
+                "artifact-summary-embedding",
+                artifact_id,
+            ),
+            "doc_metadata_extraction": workflow_id_for("doc-metadata", artifact_id),
         }
         return await self._query_workflow_statuses(workflow_ids)
 
@@ -30,7 +30,7 @@ from application.use_cases.summary_embedding_use_cases import (
     EmbedPageSummaryUseCase,
 )
 from infrastructure.config import settings
-from infrastructure.di.container import create_container
+from infrastructure.di.container import create_container, warm_up_embedding_models
 from infrastructure.logging import setup_logging
 from infrastructure.temporal.activities.batch_reembed_activities import (
     create_batch_reembed_artifact_pages_activity,
@@ -110,6 +110,18 @@ async def run() -> None:
     except Exception as e:
         logger.warning("qdrant_collection_init_failed", error=str(e))
 
+    # Load the CSER models in the background so the first compound extraction
+    # activity does not pay for it
+    from infrastructure.cser.cser_pipeline_service import CserPipelineService
+
+    CserPipelineService.prewarm()
+
+    try:
+        await warm_up_embedding_models(container)
+        logger.info("embedding_models_warmed_up")
+    except Exception as e:
+        logger.warning("embedding_model_warm_up_failed", error=str(e))
+
     # Resolve dependencies
     generate_embedding_use_case = container[GeneratePageEmbeddingUseCase]
     extract_compound_mentions_use_case = container[ExtractCompoundMentionsUseCase]
@@ -68,29 +68,30 @@ class LangChainTextChunker(TextChunker):
             msg = "Text cannot be empty"
             raise ValueError(msg)
 
-        # Use create_documents to get metadata with offsets
-        docs = self._splitter.create_documents([text])
+        # split_text returns plain strings; create_documents would wrap each one
+        # in a (Pydantic) Document only for us to read page_content back out.
+        pieces = self._splitter.split_text(text)
 
-        total_chunks = len(docs)
+        total_chunks = len(pieces)
 
         chunks = []
-        for i, doc in enumerate(docs):
+        search_start = 0
+        for i, piece in enumerate(pieces):
             # Calculate character offsets by finding the chunk in the original text
             # Start searching from where the previous chunk started to handle overlaps
-            search_start = chunks[-1].start_char if chunks else 0
-            start_char = text.find(doc.page_content, search_start)
+            start_char = text.find(piece, search_start)
             if start_char == -1:
                 # Fallback: search from beginning
-                start_char = text.find(doc.page_content)
-            end_char = (
-                start_char + len(doc.page_content) if start_char != -1 else len(doc.page_content)
-            )
+                start_char = text.find(piece)
+            end_char = start_char + len(piece) if start_char != -1 else len(piece)
+            start_char = max(start_char, 0)
+            search_start = start_char
 
             chunks.append(
                 TextChunk(
                     chunk_index=i,
-                    text=doc.page_content,
-                    start_char=max(start_char, 0),
+                    text=piece,
+                    start_char=start_char,
                     end_char=end_char,
                     total_chunks=total_chunks,
                 ),
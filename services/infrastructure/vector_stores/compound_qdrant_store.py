@@ -112,6 +112,13 @@ class CompoundQdrantStore(CompoundVectorStore):
                         size=self.VECTOR_SIZE,
                         distance=Distance.COSINE,
                     ),
+                    quantization_config=models.ScalarQuantization(
+                        scalar=models.ScalarQuantizationConfig(
+                            type=models.ScalarType.INT8,
+                            quantile=0.99,
+                            always_ram=True,
+                        ),
+                    ),
                 )
                 logger.info(
                     "compound_collection_created",
@@ -187,7 +194,7 @@ class CompoundQdrantStore(CompoundVectorStore):
             points.append(
                 PointStruct(
                     id=point_id,
-                    vector=embedding.vector,
+                    vector=embedding.vector_list(),
                     payload=payload,
                 ),
             )
@@ -283,11 +290,17 @@ class CompoundQdrantStore(CompoundVectorStore):
         try:
             search_result = await client.query_points(
                 collection_name=self.collection_name,
-                query=query_embedding.vector,
+                query=query_embedding.vector_list(),
                 query_filter=query_filter,
                 limit=limit,
                 score_threshold=score_threshold,
                 with_payload=True,
+                search_params=models.SearchParams(
+                    quantization=models.QuantizationSearchParams(
+                        rescore=True,
+                        oversampling=2.0,
+                    ),
+                ),
             )
         except Exception as e:
             logger.exception("compound_search_failed", error=str(e))
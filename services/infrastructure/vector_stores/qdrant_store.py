@@ -180,7 +180,7 @@ class QdrantStore(VectorStore):
         if metadata:
             payload.update(metadata)
 
-        vector: dict = {"dense": embedding.vector}
+        vector: dict = {"dense": embedding.vector_list()}
         if sparse_embedding:
             vector["sparse"] = models.SparseVector(
                 indices=sparse_embedding.indices,
@@ -266,7 +266,7 @@ class QdrantStore(VectorStore):
             if chunk_metadata and chunk_index < len(chunk_metadata):
                 payload.update(chunk_metadata[chunk_index])
 
-            vector: dict = {"dense": embedding.vector}
+            vector: dict = {"dense": embedding.vector_list()}
             if sparse_embeddings and chunk_index < len(sparse_embeddings):
                 se = sparse_embeddings[chunk_index]
                 vector["sparse"] = models.SparseVector(
@@ -509,7 +509,7 @@ class QdrantStore(VectorStore):
         try:
             search_result = await client.query_points(
                 collection_name=self.collection_name,
-                query=query_embedding.vector,
+                query=query_embedding.vector_list(),
                 using="dense",
                 query_filter=query_filter,
                 limit=limit,
@@ -579,7 +579,7 @@ class QdrantStore(VectorStore):
         try:
             grouped = await client.query_points_groups(
                 collection_name=self.collection_name,
-                query=query_embedding.vector,
+                query=query_embedding.vector_list(),
                 using="dense",
                 group_by="page_id",
                 group_size=group_size,
@@ -657,7 +657,7 @@ class QdrantStore(VectorStore):
                 collection_name=self.collection_name,
                 prefetch=[
                     models.Prefetch(
-                        query=dense_query.vector,
+                        query=dense_query.vector_list(),
                         using="dense",
                         limit=prefetch_limit,
                         filter=query_filter,
@@ -729,7 +729,7 @@ class QdrantStore(VectorStore):
                 collection_name=self.collection_name,
                 prefetch=[
                     models.Prefetch(
-                        query=dense_query.vector,
+                        query=dense_query.vector_list(),
                         using="dense",
                         limit=prefetch_limit,
                         filter=query_filter,
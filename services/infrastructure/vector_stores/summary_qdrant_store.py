@@ -75,6 +75,13 @@ class SummaryQdrantStore(SummaryVectorStore):
             await client.create_collection(
                 collection_name=self.collection_name,
                 vectors_config=VectorParams(size=self.vector_size, distance=Distance.COSINE),
+                quantization_config=models.ScalarQuantization(
+                    scalar=models.ScalarQuantizationConfig(
+                        type=models.ScalarType.INT8,
+                        quantile=0.99,
+                        always_ram=True,
+                    ),
+                ),
             )
 
             # Payload indexes for efficient filtering
@@ -143,7 +150,7 @@ class SummaryQdrantStore(SummaryVectorStore):
         try:
             await client.upsert(
                 collection_name=self.collection_name,
-                points=[PointStruct(id=point_id, vector=embedding.vector, payload=payload)],
+                points=[PointStruct(id=point_id, vector=embedding.vector_list(), payload=payload)],
             )
             logger.info(
                 "page_summary_embedding_upserted",
@@ -193,7 +200,7 @@ class SummaryQdrantStore(SummaryVectorStore):
         try:
             await client.upsert(
                 collection_name=self.collection_name,
-                points=[PointStruct(id=point_id, vector=embedding.vector, payload=payload)],
+                points=[PointStruct(id=point_id, vector=embedding.vector_list(), payload=payload)],
             )
             logger.info(
                 "artifact_summary_embedding_upserted",
@@ -349,11 +356,17 @@ class SummaryQdrantStore(SummaryVectorStore):
         try:
             search_result = await client.query_points(
                 collection_name=self.collection_name,
-                query=query_embedding.vector,
+                query=query_embedding.vector_list(),
                 query_filter=query_filter,
                 limit=limit,
                 score_threshold=score_threshold,
                 with_payload=True,
+                search_params=models.SearchParams(
+                    quantization=models.QuantizationSearchParams(
+                        rescore=True,
+                        oversampling=2.0,
+                    ),
+                ),
             )
         except Exception as e:
             logger.exception("summary_search_failed", error=str(e))
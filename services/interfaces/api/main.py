@@ -41,9 +41,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
         # Initialize Qdrant collections on startup
         try:
-            from infrastructure.di.container import create_container
+            # Same cached container the request handlers use, so the models
+            # warmed up below are the ones that serve requests.
+            from infrastructure.di.container import get_container
 
-            container = create_container()
+            container = get_container()
 
             from application.ports.vector_store import VectorStore
 
@@ -98,17 +100,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             # Warm up embedding models so first search request is fast
             from application.ports.embedding_generator import EmbeddingGenerator
             from application.ports.reranker import Reranker
+            from infrastructure.di.container import warm_up_embedding_models
             from infrastructure.embeddings.chemberta_generator import (
                 ChemBertaEmbeddingGenerator,
             )
 
-            generator = container[EmbeddingGenerator]
-            await generator.get_model_info()
-            logger.info("embedding_model_warmed_up")
-
-            chemberta = container[ChemBertaEmbeddingGenerator]
-            await chemberta.get_model_info()
-            logger.info("chemberta_model_warmed_up")
+            await warm_up_embedding_models(container)
+            logger.info("embedding_models_warmed_up")
 
             reranker = container[Reranker]
             if reranker:
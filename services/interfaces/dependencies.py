@@ -1,19 +1,8 @@
 """FastAPI dependency injection integration with Lagom."""
 
-from functools import lru_cache
-
-from lagom import Container
-
 from infrastructure.auth import sentinel
-from infrastructure.di.container import create_container
-
-get_auth = sentinel.get_auth
-
+from infrastructure.di.container import get_container
 
-@lru_cache
-def get_container() -> Container:
-    """Get the DI container instance.
+__all__ = ["get_auth", "get_container"]
 
-    Cached to ensure singleton behavior across requests.
-    """
-    return create_container()
+get_auth = sentinel.get_auth
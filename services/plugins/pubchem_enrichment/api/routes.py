@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import Any
 from uuid import UUID
 
@@ -12,8 +13,9 @@ from infrastructure.config import settings
 router = APIRouter()
 
 
+@cache
 def _get_collection() -> Any:
-    """Get the pubchem_enrichments MongoDB collection."""
+    """Get the pubchem_enrichments MongoDB collection (one client per process)."""
     from motor.motor_asyncio import AsyncIOMotorClient
 
     client = AsyncIOMotorClient(settings.mongo_uri)
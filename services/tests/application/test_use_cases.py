@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from uuid import uuid4
 
 import pytest
+from eventsourcing.application import Application
+from eventsourcing.persistence import ProgrammingError
 from returns.result import Failure, Success
 
 from application.dtos.artifact_dtos import CreateArtifactRequest
@@ -17,12 +20,34 @@ from application.use_cases.artifact_use_cases import (
     UpdateTagMentionsUseCase,
     UpdateTitleMentionUseCase,
 )
+from domain.aggregates.page import Page
 from domain.value_objects.artifact_type import ArtifactType
 from domain.value_objects.mime_type import MimeType
 from domain.value_objects.summary_candidate import SummaryCandidate
 from domain.value_objects.title_mention import TitleMention
+from infrastructure.event_sourced_repositories.page_repository import EventSourcedPageRepository
 from tests.mocks import MockArtifactRepository, MockExternalEventPublisher, MockPageRepository
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from eventsourcing.persistence import StoredEvent
+
+
+def _single_stream_application() -> Application:
+    """In-memory Application whose recorder, like KurrentDB's, rejects multi-stream inserts."""
+    app = Application(env={"PERSISTENCE_MODULE": "eventsourcing.popo"})
+    insert_events = app.recorder.insert_events
+
+    def insert_single_stream(stored_events: Sequence[StoredEvent], **kwargs: object) -> object:
+        if len({event.originator_id for event in stored_events}) > 1:
+            msg = "KurrentDB can't atomically store events in more than one stream"
+            raise ProgrammingError(msg)
+        return insert_events(stored_events, **kwargs)
+
+    app.recorder.insert_events = insert_single_stream  # type: ignore[method-assign]
+    return app
+
 
 class TestCreateArtifactUseCase:
     """Test CreateArtifactUseCase."""
@@ -359,6 +384,29 @@ class TestDeleteArtifactUseCase:
         assert page_repo.pages[page1.id].is_deleted is True
         assert page_repo.pages[page2.id].is_deleted is True
 
+    @pytest.mark.asyncio
+    async def test_delete_artifact_saves_each_page_to_its_own_stream(
+        self,
+        sample_artifact,
+    ) -> None:
+        """Page deletions must not be appended to the event store in one multi-stream write."""
+        artifact_repo = MockArtifactRepository()
+        page_repo = EventSourcedPageRepository(_single_stream_application())
+        pages = [
+            Page.create(name=f"Page {i}", artifact_id=sample_artifact.id, index=i) for i in range(3)
+        ]
+        for page in pages:
+            page_repo.save(page)
+        sample_artifact.add_pages([page.id for page in pages])
+        artifact_repo.save(sample_artifact)
+
+        use_case = DeleteArtifactUseCase(artifact_repo, page_repo)
+
+        result = await use_case.execute(sample_artifact.id)
+
+        assert isinstance(result, Success)
+        assert all(page_repo.get_by_id(page.id).is_deleted for page in pages)
+
     @pytest.mark.asyncio
     async def test_delete_artifact_not_found(self) -> None:
         """Test deleting a non-existent artifact."""
@@ -26,12 +26,16 @@ from application.workflow_use_cases.trigger_page_summarization_use_case import (
 from application.workflow_use_cases.trigger_artifact_parse_use_case import (
     TriggerArtifactParseUseCase,
 )
+from application.workflow_use_cases.trigger_page_summary_embedding_use_case import (
+    TriggerPageSummaryEmbeddingUseCase,
+)
 from application.workflow_use_cases.trigger_smiles_embedding_use_case import (
     TriggerSmilesEmbeddingUseCase,
 )
 from domain.aggregates.artifact import Artifact
 from domain.aggregates.page import Page
 from domain.value_objects.artifact_type import ArtifactType
+from domain.value_objects.compound_mention import CompoundMention
 from domain.value_objects.mime_type import MimeType
 from tests.mocks import (
     MockArtifactRepository,
@@ -99,6 +103,19 @@ class TestTriggerCompoundExtractionUseCase:
         with pytest.raises(RuntimeError):
             await use_case.execute(page_id=uuid4())
 
+    @pytest.mark.asyncio
+    async def test_retrigger_starts_workflow_again(self) -> None:
+        # Workflows use ALLOW_DUPLICATE, so a re-trigger must reach the orchestrator
+        orchestrator = MockWorkflowOrchestrator()
+        use_case = TriggerCompoundExtractionUseCase(orchestrator)
+        page_id = uuid4()
+
+        first = await use_case.execute(page_id=page_id)
+        second = await use_case.execute(page_id=page_id)
+
+        assert first.workflow_id == second.workflow_id
+        assert orchestrator.compound_extraction_calls == [page_id, page_id]
+
 
 class TestTriggerArtifactParseUseCase:
     @pytest.mark.asyncio
@@ -128,6 +145,35 @@ class TestTriggerSmilesEmbeddingUseCase:
         assert f"smiles-embedding-{page_id}" == result.workflow_id
         assert orchestrator.smiles_embedding_calls == [page_id]
 
+    @pytest.mark.asyncio
+    async def test_skips_when_no_valid_smiles(self) -> None:
+        orchestrator = MockWorkflowOrchestrator()
+        use_case = TriggerSmilesEmbeddingUseCase(orchestrator)
+        mentions = [CompoundMention(smiles="C1=CC=CC=C1", extracted_id="Benzene")]
+
+        result = await use_case.execute(page_id=uuid4(), compound_mentions=mentions)
+
+        assert result is None
+        assert orchestrator.smiles_embedding_calls == []
+
+    @pytest.mark.asyncio
+    async def test_starts_when_valid_smiles_present(self) -> None:
+        orchestrator = MockWorkflowOrchestrator()
+        use_case = TriggerSmilesEmbeddingUseCase(orchestrator)
+        page_id = uuid4()
+        mentions = [
+            CompoundMention(
+                smiles="C1=CC=CC=C1",
+                canonical_smiles="c1ccccc1",
+                is_smiles_valid=True,
+            ),
+        ]
+
+        result = await use_case.execute(page_id=page_id, compound_mentions=mentions)
+
+        assert result is not None
+        assert orchestrator.smiles_embedding_calls == [page_id]
+
     @pytest.mark.asyncio
     async def test_propagates_orchestrator_exception(self) -> None:
         orchestrator = MockWorkflowOrchestrator(raise_on_call=RuntimeError("timeout"))
@@ -165,6 +211,30 @@ class TestTriggerPageSummarizationUseCase:
 # ============================================================================
 
 
+class TestTriggerPageSummaryEmbeddingUseCase:
+    @pytest.mark.asyncio
+    async def test_starts_workflow_and_returns_response(self) -> None:
+        orchestrator = MockWorkflowOrchestrator()
+        use_case = TriggerPageSummaryEmbeddingUseCase(orchestrator)
+        page_id = uuid4()
+
+        result = await use_case.execute(page_id=page_id)
+
+        assert result is not None
+        assert f"page-summary-embedding-{page_id}" == result.workflow_id
+        assert orchestrator.page_summary_embedding_calls == [page_id]
+
+    @pytest.mark.asyncio
+    async def test_skips_when_no_summary(self) -> None:
+        orchestrator = MockWorkflowOrchestrator()
+        use_case = TriggerPageSummaryEmbeddingUseCase(orchestrator)
+
+        result = await use_case.execute(page_id=uuid4(), has_summary=False)
+
+        assert result is None
+        assert orchestrator.page_summary_embedding_calls == []
+
+
 def _make_artifact_with_pages(n_pages: int = 3) -> tuple[Artifact, list[Page]]:
     """Create an artifact with N pages for trigger use case tests."""
     artifact = Artifact.create(
@@ -264,6 +334,52 @@ class TestTriggerArtifactSummarizationUseCase:
         assert result is None
         assert orchestrator.artifact_summarization_calls == []
 
+    @pytest.mark.asyncio
+    async def test_counts_pages_summarized_in_the_same_batch(self) -> None:
+        artifact, pages = _make_artifact_with_pages(5)
+        artifact_repo = MockArtifactRepository()
+        artifact_repo.save(artifact)
+        orchestrator = MockWorkflowOrchestrator()
+        # 3 summaries visible in read model + 2 pages from the current batch = 5 total
+        read_model = MockPageReadModel(summarized_page_ids={p.id for p in pages[:3]})
+
+        use_case = TriggerArtifactSummarizationUseCase(
+            artifact_repository=artifact_repo,
+            page_read_model=read_model,
+            workflow_orchestrator=orchestrator,
+        )
+
+        result = await use_case.execute(
+            artifact_id=artifact.id,
+            summarized_page_ids={p.id for p in pages[3:]},
+        )
+
+        assert result is not None
+        assert orchestrator.artifact_summarization_calls == [artifact.id]
+
+    @pytest.mark.asyncio
+    async def test_does_not_double_count_already_projected_batch_pages(self) -> None:
+        artifact, pages = _make_artifact_with_pages(5)
+        artifact_repo = MockArtifactRepository()
+        artifact_repo.save(artifact)
+        orchestrator = MockWorkflowOrchestrator()
+        # The batch's 2 pages are already projected: only 3 of 5 pages have summaries
+        read_model = MockPageReadModel(summarized_page_ids={p.id for p in pages[:3]})
+
+        use_case = TriggerArtifactSummarizationUseCase(
+            artifact_repository=artifact_repo,
+            page_read_model=read_model,
+            workflow_orchestrator=orchestrator,
+        )
+
+        result = await use_case.execute(
+            artifact_id=artifact.id,
+            summarized_page_ids={p.id for p in pages[1:3]},
+        )
+
+        assert result is None
+        assert orchestrator.artifact_summarization_calls == []
+
     @pytest.mark.asyncio
     async def test_skips_when_no_pages(self) -> None:
         artifact, _ = _make_artifact_with_pages(0)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 from pydantic import ValidationError
 
@@ -55,6 +57,12 @@ class TestMimeType:
         mime_type = MimeType.PDF
         assert mime_type == "application/pdf"
 
+    def test_from_value(self) -> None:
+        """Test lookup by MIME string returns the enum member."""
+        assert MimeType.from_value("application/pdf") is MimeType.PDF
+        with pytest.raises(ValueError, match="not a valid MimeType"):
+            MimeType.from_value("text/plain")
+
 
 class TestTitleMention:
     """Test TitleMention value object."""
@@ -162,6 +170,17 @@ class TestTagMention:
         mention2 = TagMention(tag="biology", confidence=0.88)
         assert mention1 != mention2
 
+    def test_validate_many(self) -> None:
+        """Test validating a batch of TagMentions in one call."""
+        mentions = TagMention.validate_many(
+            [{"tag": "chemistry", "confidence": 0.88}, {"tag": "biology"}],
+        )
+        assert mentions == [TagMention(tag="chemistry"), TagMention(tag="biology")]
+        assert all(type(m) is TagMention for m in mentions)
+
+        with pytest.raises(ValidationError):
+            TagMention.validate_many([{"tag": "chemistry"}, {"tag": " "}])
+
 
 class TestTextMention:
     """Test TextMention value object."""
@@ -214,9 +233,37 @@ class TestValueObjectImmutability:
             model_name="test",
             dimensions=2,
         )
-        with pytest.raises(ValidationError):
+        with pytest.raises(FrozenInstanceError):
             te.model_name = "changed"  # type: ignore[misc]
 
+    def test_text_embedding_rejects_mismatched_dimensions(self) -> None:
+        from uuid import uuid4
+
+        from domain.value_objects.text_embedding import TextEmbedding
+
+        with pytest.raises(ValueError, match="don't match vector length"):
+            TextEmbedding(embedding_id=uuid4(), vector=[0.1, 0.2], model_name="test", dimensions=3)
+
+    def test_text_embedding_vector_list_returns_plain_floats(self) -> None:
+        from uuid import uuid4
+
+        from domain.value_objects.text_embedding import TextEmbedding
+
+        te = TextEmbedding(
+            embedding_id=uuid4(),
+            vector=(0.5, 0.25),
+            model_name="test",
+            dimensions=2,
+        )
+
+        assert te.vector_list() == [0.5, 0.25]
+
+    def test_text_chunk_rejects_blank_text(self) -> None:
+        from domain.value_objects.text_chunk import TextChunk
+
+        with pytest.raises(ValueError, match="cannot be empty"):
+            TextChunk(chunk_index=0, text="  ", start_char=0, end_char=2, total_chunks=1)
+
     def test_blob_ref_is_frozen(self) -> None:
         from domain.value_objects.blob_ref import BlobRef
 
@@ -232,3 +279,129 @@ class TestValueObjectImmutability:
         ts = TagSource(page_id=uuid4(), page_index=0)
         with pytest.raises(ValidationError):
             ts.page_index = 5  # type: ignore[misc]
+
+
+class TestFieldConstraints:
+    @pytest.mark.parametrize("text", ["", "   ", "\n\t", "\x1c", "\u3000\x1f"])
+    def test_text_mention_rejects_blank_text(self, text: str) -> None:
+        from domain.value_objects.text_mention import TextMention
+
+        with pytest.raises(ValidationError) as exc_info:
+            TextMention(text=text)
+
+        assert exc_info.value.errors()[0]["type"] == "string_pattern_mismatch"
+
+    def test_text_mention_keeps_surrounding_whitespace(self) -> None:
+        from domain.value_objects.text_mention import TextMention
+
+        assert TextMention(text="  body  ").text == "  body  "
+
+    def test_compound_mention_rejects_blank_smiles(self) -> None:
+        with pytest.raises(ValidationError):
+            CompoundMention(smiles=" ")
+
+    def test_workflow_status_rejects_out_of_range_progress(self) -> None:
+        from domain.value_objects.workflow_status import WorkflowStatus
+
+        with pytest.raises(ValidationError):
+            WorkflowStatus.in_progress(progress=1.5)
+
+    def test_workflow_status_rejects_completion_before_start(self) -> None:
+        from datetime import UTC, datetime, timedelta
+
+        from domain.value_objects.workflow_status import WorkflowStatus
+
+        started_at = datetime.now(UTC)
+        with pytest.raises(ValidationError, match="completed_at must be after"):
+            WorkflowStatus.completed(
+                started_at=started_at,
+                completed_at=started_at - timedelta(seconds=1),
+            )
+
+
+class TestWorkflowStatus:
+    def test_state_queries(self) -> None:
+        from domain.value_objects.workflow_status import WorkflowStatus
+
+        failed = WorkflowStatus.failed("boom")
+
+        assert failed.is_failed
+        assert failed.is_terminal
+        assert not failed.is_pending
+        assert not WorkflowStatus.in_progress(progress=0.5).is_terminal
+
+    def test_queries_follow_model_copy_updates(self) -> None:
+        from domain.value_objects.workflow_state import WorkflowState
+        from domain.value_objects.workflow_status import WorkflowStatus
+
+        status = WorkflowStatus.in_progress(progress=0.25)
+        assert status.progress_percentage == 25.0
+        assert not status.is_terminal
+
+        done = status.model_copy(update={"state": WorkflowState.COMPLETED, "progress": 1.0})
+
+        assert done.is_completed
+        assert done.is_terminal
+        assert not done.is_in_progress
+        assert done.progress_percentage == 100.0
+
+    def test_pending_matches_validated_instance(self) -> None:
+        from uuid import uuid4
+
+        from domain.value_objects.workflow_state import WorkflowState
+        from domain.value_objects.workflow_status import WorkflowStatus
+
+        workflow_id = uuid4()
+        status = WorkflowStatus.pending("queued", workflow_id=workflow_id)
+
+        assert status == WorkflowStatus(
+            state=WorkflowState.PENDING,
+            message="queued",
+            workflow_id=workflow_id,
+        )
+        assert status.is_pending
+        assert status.progress_percentage == 0.0
+
+    @pytest.mark.parametrize(
+        ("seconds", "expected"),
+        [
+            (0, "0s"),
+            (59.9, "59s"),
+            (60, "1m"),
+            (125, "2m 5s"),
+            (3600, "1h"),
+            (3605, "1h 5s"),
+            (3660, "1h 1m"),
+            (5025, "1h 23m 45s"),
+        ],
+    )
+    def test_elapsed_formatted(self, seconds: float, expected: str) -> None:
+        from datetime import UTC, datetime, timedelta
+
+        from domain.value_objects.workflow_status import WorkflowStatus
+
+        completed_at = datetime.now(UTC)
+        status = WorkflowStatus.completed(
+            started_at=completed_at - timedelta(seconds=seconds),
+            completed_at=completed_at,
+        )
+
+        assert status.elapsed_formatted == expected
+
+
+class TestEmbeddingHashing:
+    def test_embedding_metadata_hash_matches_embedding_id(self) -> None:
+        from datetime import UTC, datetime
+        from uuid import uuid4
+
+        from domain.value_objects.embedding_metadata import EmbeddingMetadata
+
+        embedding_id = uuid4()
+        em = EmbeddingMetadata(
+            embedding_id=embedding_id,
+            model_name="test",
+            dimensions=2,
+            generated_at=datetime.now(UTC),
+        )
+
+        assert hash(em) == hash(embedding_id)
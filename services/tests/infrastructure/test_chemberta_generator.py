@@ -0,0 +1,73 @@
+"""Unit tests for ChemBERTa batching and caching (no model or torch required)."""
+
+from __future__ import annotations
+
+from infrastructure.embeddings.chemberta_generator import (
+    ChemBertaEmbeddingGenerator,
+    _length_buckets,
+)
+
+
+def test_length_buckets_group_by_power_of_two_shortest_first() -> None:
+    lengths = [40, 300, 45, 70, 64, 12]
+
+    assert _length_buckets(lengths) == [[5], [0, 2], [3, 4], [1]]
+
+
+def test_length_buckets_cover_every_index_once() -> None:
+    lengths = [7, 512, 33, 33, 200, 1, 64]
+
+    buckets = _length_buckets(lengths)
+
+    assert sorted(i for bucket in buckets for i in bucket) == list(range(len(lengths)))
+    for bucket in buckets:
+        longest = max(lengths[i] for i in bucket)
+        shortest = min(lengths[i] for i in bucket)
+        assert longest < 2 * shortest
+
+
+def test_length_buckets_empty() -> None:
+    assert _length_buckets([]) == []
+
+
+class _CountingGenerator(ChemBertaEmbeddingGenerator):
+    """Replaces the model forward pass with a deterministic fake."""
+
+    def __init__(self, cache_size: int) -> None:
+        super().__init__(cache_size=cache_size)
+        self.forwarded: list[list[str]] = []
+
+    def _forward(self, texts: list[str]) -> list[list[float]]:
+        self.forwarded.append(texts)
+        return [[float(len(text)), 0.5] for text in texts]
+
+
+def test_encode_batch_only_forwards_cache_misses() -> None:
+    generator = _CountingGenerator(cache_size=10)
+
+    first = generator._encode_batch(["CCO", "c1ccccc1", "CCO"])
+    second = generator._encode_batch(["c1ccccc1", "CCN"])
+
+    assert first == [[3.0, 0.5], [8.0, 0.5], [3.0, 0.5]]
+    assert second == [[8.0, 0.5], [3.0, 0.5]]
+    assert generator.forwarded == [["CCO", "c1ccccc1"], ["CCN"]]
+
+
+def test_encode_batch_evicts_least_recently_used() -> None:
+    generator = _CountingGenerator(cache_size=2)
+
+    generator._encode_batch(["CCO", "CCN"])
+    generator._encode_batch(["CCO"])  # refresh CCO
+    generator._encode_batch(["CCC"])  # evicts CCN
+    generator._encode_batch(["CCO", "CCN"])
+
+    assert generator.forwarded == [["CCO", "CCN"], ["CCC"], ["CCN"]]
+
+
+def test_encode_batch_without_cache_always_forwards() -> None:
+    generator = _CountingGenerator(cache_size=0)
+
+    generator._encode_batch(["CCO"])
+    generator._encode_batch(["CCO"])
+
+    assert generator.forwarded == [["CCO"], ["CCO"]]
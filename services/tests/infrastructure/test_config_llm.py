@@ -45,3 +45,11 @@ def test_per_lane_reasoning_defaults_none(monkeypatch: pytest.MonkeyPatch) -> No
     s = _isolated_settings(monkeypatch, "CHAT_SYNTHESIS_REASONING", "CHAT_RETRIEVAL_REASONING")
     assert s.chat_synthesis_reasoning is None
     assert s.chat_retrieval_reasoning is None
+
+
+def test_global_settings_is_the_cached_instance() -> None:
+    from infrastructure import config
+    from infrastructure.config import get_settings, settings
+
+    assert settings is get_settings()
+    assert config.settings is settings
@@ -0,0 +1,98 @@
+"""Tests for the DI container wiring (no KurrentDB, Mongo or models required)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from lagom import Container
+
+import infrastructure.di.container as container_module
+from application.ports.repositories.artifact_read_models import ArtifactReadModel
+from application.ports.repositories.page_read_models import PageReadModel
+from application.ports.repositories.tag_browse_read_model import TagBrowseReadModel
+from application.ports.repositories.user_activity_store import UserActivityStore
+from application.ports.repositories.user_preferences_store import UserPreferencesStore
+from application.ports.smiles_validator import SmilesValidator
+from application.ports.text_chunker import TextChunker
+from application.ports.title_extractor import TitleExtractorPort
+from application.ports.workflow_status_cache import WorkflowStatusCache
+from application.use_cases.artifact_use_cases import AddPagesUseCase, CreateArtifactUseCase
+from application.use_cases.page_use_cases import CreatePageUseCase, DeletePageUseCase
+from infrastructure.chemistry.rdkit_smiles_validator import RdkitSmilesValidator
+from infrastructure.config import get_settings
+from infrastructure.file_services.font_title_extractor import FontTitleExtractor
+from infrastructure.read_repositories.mongo_read_repository import MongoReadRepository
+from infrastructure.read_repositories.mongo_user_store import MongoUserStore
+from infrastructure.read_repositories.mongo_workflow_status_cache import (
+    MongoWorkflowStatusCache,
+)
+from infrastructure.text_chunkers.langchain_chunker import LangChainTextChunker
+
+
+class _InMemoryApplication(container_module.DocuStoreApplication):
+    """Swaps the KurrentDB persistence module for eventsourcing's in-memory one."""
+
+    def __init__(self, env: dict[str, str] | None = None) -> None:
+        super().__init__({"PERSISTENCE_MODULE": "eventsourcing.popo"})
+
+
+@pytest.fixture
+def container(monkeypatch: pytest.MonkeyPatch) -> Iterator[Container]:
+    monkeypatch.setenv("ENABLE_EXTERNAL_EVENT_STREAMING", "false")
+    monkeypatch.setenv("RERANKER_ENABLED", "false")
+    monkeypatch.setattr(container_module, "DocuStoreApplication", _InMemoryApplication)
+    get_settings.cache_clear()
+    yield container_module.create_container()
+    get_settings.cache_clear()
+
+
+# The ports are plain Protocols, so the check is against the adapter class.
+@pytest.mark.parametrize(
+    ("port", "adapter_type"),
+    [
+        (SmilesValidator, RdkitSmilesValidator),
+        (TextChunker, LangChainTextChunker),
+        (TitleExtractorPort, FontTitleExtractor),
+        (WorkflowStatusCache, MongoWorkflowStatusCache),
+        (PageReadModel, MongoReadRepository),
+    ],
+)
+def test_adapters_resolve_to_one_instance_of_their_port(
+    container: Container,
+    port: type,
+    adapter_type: type,
+) -> None:
+    adapter = container[port]
+
+    assert isinstance(adapter, adapter_type)
+    assert container[port] is adapter
+
+
+def test_read_model_ports_share_the_mongo_repository(container: Container) -> None:
+    repository = container[MongoReadRepository]
+
+    assert container[PageReadModel] is repository
+    assert container[ArtifactReadModel] is repository
+    assert container[TagBrowseReadModel] is repository
+
+
+def test_user_store_ports_share_the_mongo_user_store(container: Container) -> None:
+    store = container[MongoUserStore]
+
+    assert container[UserPreferencesStore] is store
+    assert container[UserActivityStore] is store
+
+
+@pytest.mark.parametrize(
+    "use_case_type",
+    [CreatePageUseCase, DeletePageUseCase, CreateArtifactUseCase, AddPagesUseCase],
+)
+def test_use_cases_resolve_to_one_instance(
+    container: Container,
+    use_case_type: type,
+) -> None:
+    use_case = container[use_case_type]
+
+    assert isinstance(use_case, use_case_type)
+    assert container[use_case_type] is use_case
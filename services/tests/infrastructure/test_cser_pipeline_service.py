@@ -0,0 +1,110 @@
+"""Unit tests for the CSER adapter's page rendering (fake ChemPipeline, no models)."""
+
+from __future__ import annotations
+
+from itertools import pairwise
+from types import SimpleNamespace
+
+import fitz
+import pytest
+
+from infrastructure.cser.cser_pipeline_service import CserPipelineService, _tile_spans
+
+
+class _FakePipeline:
+    """Stands in for ChemPipeline, returning canned pairs for each image in turn."""
+
+    def __init__(self, *pairs_per_image: list[SimpleNamespace]) -> None:
+        self._pairs_per_image = list(pairs_per_image)
+        self.image_sizes: list[tuple[int, int]] = []
+
+    def process(self, image: object) -> list[SimpleNamespace]:
+        self.image_sizes.append(image.size)  # type: ignore[attr-defined]
+        return self._pairs_per_image.pop(0)
+
+
+def _pair(smiles: str, label: str | None, confidence: float | None) -> SimpleNamespace:
+    return SimpleNamespace(smiles=smiles, label_text=label, match_confidence=confidence)
+
+
+def test_tile_spans_keep_a_short_side_whole() -> None:
+    assert _tile_spans(800, 1000, 0.15) == [(0.0, 800)]
+    assert _tile_spans(1000, 1000, 0.15) == [(0.0, 1000)]
+
+
+def test_tile_spans_at_an_exact_multiple_still_overlap() -> None:
+    spans = _tile_spans(2000, 1000, 0.15)
+
+    assert len(spans) == 3
+    assert spans[0] == (0.0, 1000)
+    assert spans[-1] == (1000, 2000)
+
+
+@pytest.mark.parametrize("length", [1001, 1700, 2000, 2551.5, 9999])
+@pytest.mark.parametrize("overlap", [0.0, 0.15, 0.5])
+def test_tile_spans_cover_the_side_with_the_minimum_overlap(length: float, overlap: float) -> None:
+    spans = _tile_spans(length, 1000, overlap)
+
+    assert spans[0][0] == 0
+    assert spans[-1][1] == pytest.approx(length)
+    for start, end in spans:
+        assert end - start == pytest.approx(1000)
+    for (_, previous_end), (next_start, _) in pairwise(spans):
+        assert previous_end - next_start >= overlap * 1000 - 1e-9
+
+
+def _service(
+    monkeypatch: pytest.MonkeyPatch,
+    pipeline: _FakePipeline,
+    width: float,
+    height: float,
+) -> CserPipelineService:
+    """Build the adapter over a one-page PDF, with ``pipeline`` as the shared ChemPipeline."""
+    monkeypatch.setattr(CserPipelineService, "_pipeline", pipeline)
+    with fitz.open() as doc:
+        doc.new_page(width=width, height=height)
+        pdf_bytes = doc.tobytes()
+    blob_store = SimpleNamespace(get_bytes=lambda _key: pdf_bytes)
+    return CserPipelineService(blob_store, render_zoom=1.0, max_tile_side=1000)  # type: ignore[arg-type]
+
+
+def test_page_within_tile_size_is_processed_whole(monkeypatch: pytest.MonkeyPatch) -> None:
+    pipeline = _FakePipeline([_pair("CCO", "1", 0.9)])
+
+    results = _service(monkeypatch, pipeline, 800, 600).extract_compounds_from_pdf_page("k", 0)
+
+    assert pipeline.image_sizes == [(800, 600)]
+    assert [(r.smiles, r.label_text, r.match_confidence) for r in results] == [("CCO", "1", 0.9)]
+
+
+def test_oversized_page_is_processed_one_tile_per_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    pipeline = _FakePipeline([_pair("CCO", "1", 0.9)], [_pair("CCN", "2", 0.8)])
+
+    results = _service(monkeypatch, pipeline, 1600, 600).extract_compounds_from_pdf_page("k", 0)
+
+    assert pipeline.image_sizes == [(1000, 600), (1000, 600)]
+    assert sorted(r.smiles for r in results) == ["CCN", "CCO"]
+
+
+def test_tiled_page_keeps_the_most_confident_copy_of_a_shared_pair(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pipeline = _FakePipeline(
+        [_pair("CCO", "1", 0.6), _pair("CCN", "2", 0.7)],
+        [_pair("CCO", "1", 0.9)],
+    )
+
+    results = _service(monkeypatch, pipeline, 1600, 600).extract_compounds_from_pdf_page("k", 0)
+
+    assert sorted((r.smiles, r.label_text, r.match_confidence) for r in results) == [
+        ("CCN", "2", 0.7),
+        ("CCO", "1", 0.9),
+    ]
+
+
+def test_untiled_page_keeps_duplicate_pairs(monkeypatch: pytest.MonkeyPatch) -> None:
+    pipeline = _FakePipeline([_pair("CCO", None, None), _pair("CCO", None, None)])
+
+    results = _service(monkeypatch, pipeline, 800, 600).extract_compounds_from_pdf_page("k", 0)
+
+    assert len(results) == 2
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
+from typing import TYPE_CHECKING
 from uuid import uuid4
 
+import pytest
+from eventsourcing.application import AggregateNotFoundError as EventSourcingNotFoundError
+from eventsourcing.application import Application
+
 from domain.aggregates.artifact import Artifact
 from domain.aggregates.page import Page
+from domain.exceptions import AggregateNotFoundError, InfrastructureError
 from domain.value_objects.artifact_type import ArtifactType
 from domain.value_objects.compound_mention import CompoundMention
 from domain.value_objects.mime_type import MimeType
@@ -14,11 +21,22 @@ from domain.value_objects.summary_candidate import SummaryCandidate
 from domain.value_objects.tag_mention import TagMention
 from domain.value_objects.text_mention import TextMention
 from domain.value_objects.title_mention import TitleMention
+from infrastructure.embeddings.ids import batch_embedding_ids
 from infrastructure.event_projectors.artifact_projector import ArtifactProjector
 from infrastructure.event_projectors.event_projector import EventProjector
 from infrastructure.event_projectors.page_projector import PageProjector
+from infrastructure.event_sourced_repositories.aggregate_cache import aggregate_cache_env
+from infrastructure.event_sourced_repositories.identity_map import aggregate_identity_map
+from infrastructure.event_sourced_repositories.page_repository import (
+    EventSourcedPageRepository,
+)
+from infrastructure.lib.micro_batcher import MicroBatcher
+from infrastructure.lib.subscription_batches import iter_batches
 from infrastructure.serialization.pydantic_transcoder import PydanticTranscoding
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 class FakeMaterializer:
     def __init__(self) -> None:
@@ -307,9 +325,231 @@ class TestEventProjector:
         assert len(materializer.upsert_page_calls) == 1
 
 
+class FakeApplication:
+    """Stands in for the eventsourcing Application, counting store loads."""
+
+    def __init__(self, *aggregates: object, fail_save: bool = False) -> None:
+        self._aggregates = {a.id: a for a in aggregates}  # type: ignore[attr-defined]
+        self.loads = 0
+        self.fail_save = fail_save
+        self.get_error: Exception | None = None
+        self.repository = SimpleNamespace(get=self._get)
+
+    def _get(self, aggregate_id: object) -> object:
+        self.loads += 1
+        if self.get_error is not None:
+            raise self.get_error
+        if aggregate_id not in self._aggregates:
+            raise EventSourcingNotFoundError(aggregate_id)
+        return self._aggregates[aggregate_id]
+
+    def save(self, *_aggregates: object) -> None:
+        if self.fail_save:
+            msg = "store unavailable"
+            raise RuntimeError(msg)
+
+
 class TestEventSourcedRepository:
     """Test event sourced repositories."""
 
+    def _page(self) -> Page:
+        return Page(name="Page 1", artifact_id=uuid4(), index=0)
+
+    def test_get_by_id_loads_from_store_without_scope(self) -> None:
+        page = self._page()
+        app = FakeApplication(page)
+        repo = EventSourcedPageRepository(app)  # type: ignore[arg-type]
+
+        repo.get_by_id(page.id)
+        repo.get_by_id(page.id)
+
+        assert app.loads == 2
+
+    def test_identity_map_dedupes_loads_within_scope(self) -> None:
+        page = self._page()
+        app = FakeApplication(page)
+        repo = EventSourcedPageRepository(app)  # type: ignore[arg-type]
+
+        with aggregate_identity_map():
+            first = repo.get_by_id(page.id)
+            second = repo.get_by_id(page.id)
+
+        assert first is second
+        assert app.loads == 1
+
+    def test_missing_aggregate_raises_domain_not_found(self) -> None:
+        repo = EventSourcedPageRepository(FakeApplication())  # type: ignore[arg-type]
+
+        with pytest.raises(AggregateNotFoundError):
+            repo.get_by_id(uuid4())
+
+    def test_store_error_mentioning_not_found_is_infrastructure_error(self) -> None:
+        app = FakeApplication()
+        app.get_error = RuntimeError("connection not found")
+        repo = EventSourcedPageRepository(app)  # type: ignore[arg-type]
+
+        with pytest.raises(InfrastructureError):
+            repo.get_by_id(uuid4())
+
+    def test_failed_save_evicts_from_identity_map(self) -> None:
+        page = self._page()
+        app = FakeApplication(page, fail_save=True)
+        repo = EventSourcedPageRepository(app)  # type: ignore[arg-type]
+
+        with aggregate_identity_map():
+            loaded = repo.get_by_id(page.id)
+            with pytest.raises(InfrastructureError):
+                repo.save(loaded)
+            repo.get_by_id(page.id)
+
+        assert app.loads == 2
+
+    def test_unsaved_mutation_is_not_served_from_identity_map(self) -> None:
+        page = self._page()
+        app = FakeApplication(page)
+        repo = EventSourcedPageRepository(app)  # type: ignore[arg-type]
+
+        with aggregate_identity_map():
+            loaded = repo.get_by_id(page.id)
+            loaded.update_text_mention(TextMention(text="draft"))
+            repo.get_by_id(page.id)
+
+        assert app.loads == 2
+
+    def test_saved_mutation_is_served_from_identity_map(self) -> None:
+        page = self._page()
+        app = FakeApplication(page)
+        repo = EventSourcedPageRepository(app)  # type: ignore[arg-type]
+
+        with aggregate_identity_map():
+            loaded = repo.get_by_id(page.id)
+            loaded.update_text_mention(TextMention(text="draft"))
+            repo.save(loaded)
+            reloaded = repo.get_by_id(page.id)
+
+        assert reloaded is loaded
+        assert app.loads == 1
+
+    def test_aggregate_cache_fast_forwards_repeat_loads(self) -> None:
+        app = Application(
+            env={"PERSISTENCE_MODULE": "eventsourcing.popo", **aggregate_cache_env(8)}
+        )
+        repo = EventSourcedPageRepository(app)
+        page = Page.create(name="Page 1", artifact_id=uuid4(), index=0)
+        repo.save(page)
+
+        select_events = app.recorder.select_events
+        selects: list[dict[str, object]] = []
+
+        def record_select(originator_id: object, **kwargs: object) -> object:
+            selects.append(kwargs)
+            return select_events(originator_id, **kwargs)  # type: ignore[arg-type]
+
+        app.recorder.select_events = record_select  # type: ignore[method-assign]
+
+        first = repo.get_by_id(page.id)
+        first.delete()
+        second = repo.get_by_id(page.id)
+
+        # The second load reads only events after the cached version and
+        # gets its own copy, so the unsaved delete doesn't leak into it.
+        assert [select.get("gt") for select in selects] == [None, page.version]
+        assert second is not first
+        assert not second.is_deleted
+
+
+class TestIterBatches:
+    """Test batching of a blocking subscription iterator."""
+
+    @pytest.mark.asyncio
+    async def test_yields_all_items_in_order(self) -> None:
+        batches = [batch async for batch in iter_batches(range(10), max_size=4, max_wait=0.05)]
+
+        assert [item for batch in batches for item in batch] == list(range(10))
+        assert all(len(batch) <= 4 for batch in batches)
+
+    @pytest.mark.asyncio
+    async def test_reraises_iterator_error_after_yielding_prior_items(self) -> None:
+        def items() -> Iterator[int]:
+            yield 1
+            yield 2
+            msg = "subscription lost"
+            raise RuntimeError(msg)
+
+        received: list[int] = []
+
+        async def consume() -> None:
+            async for batch in iter_batches(items(), max_size=8, max_wait=0.05):
+                received.extend(batch)
+
+        with pytest.raises(RuntimeError, match="subscription lost"):
+            await consume()
+
+        assert received == [1, 2]
+
+
+class TestBatchEmbeddingIds:
+    """Test derivation of a batch of embedding IDs from one random UUID."""
+
+    def test_ids_are_distinct_version_4_uuids(self) -> None:
+        ids = batch_embedding_ids(1000)
+
+        assert len(set(ids)) == 1000
+        assert all(embedding_id.version == 4 for embedding_id in ids)
+
+    def test_batches_do_not_share_ids(self) -> None:
+        assert not set(batch_embedding_ids(100)) & set(batch_embedding_ids(100))
+
+
+class TestMicroBatcher:
+    """Test coalescing of concurrent single-item calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submits_share_one_batch(self) -> None:
+        calls: list[list[int]] = []
+
+        def square(items: list[int]) -> list[int]:
+            calls.append(items)
+            return [item * item for item in items]
+
+        batcher = MicroBatcher(square, max_size=16, max_wait=0.05)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+        assert results == [0, 1, 4, 9, 16]
+        assert calls == [[0, 1, 2, 3, 4]]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_without_waiting(self) -> None:
+        calls: list[list[int]] = []
+
+        def echo(items: list[int]) -> list[int]:
+            calls.append(items)
+            return items
+
+        batcher = MicroBatcher(echo, max_size=2, max_wait=60)
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(4))),
+            timeout=5,
+        )
+
+        assert results == [0, 1, 2, 3]
+        assert calls == [[0, 1], [2, 3]]
+
+    @pytest.mark.asyncio
+    async def test_batch_error_reaches_every_caller(self) -> None:
+        def fail(_items: list[int]) -> list[int]:
+            msg = "model unavailable"
+            raise RuntimeError(msg)
+
+        batcher = MicroBatcher(fail, max_size=8, max_wait=0.01)
+        results = await asyncio.gather(
+            batcher.submit(1),
+            batcher.submit(2),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
 
 class TestReadModelMaterializer:
     """Test read model materializer."""
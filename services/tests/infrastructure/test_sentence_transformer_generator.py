@@ -0,0 +1,34 @@
+"""Unit tests for the sentence-transformers backend check (no model or torch required)."""
+
+from __future__ import annotations
+
+import pytest
+
+from infrastructure.embeddings import sentence_transformer_generator
+from infrastructure.embeddings.sentence_transformer_generator import check_backend_installed
+
+
+def test_torch_backend_needs_no_extra() -> None:
+    check_backend_installed("torch")
+
+
+def test_missing_backend_runtime_names_the_extra(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sentence_transformer_generator, "_module_available", lambda _: False)
+
+    with pytest.raises(
+        ImportError, match=r"missing: openvino, optimum\.intel\. .*uv sync --extra openvino"
+    ):
+        check_backend_installed("openvino")
+
+
+def test_missing_onnx_runtime_points_away_from_extras(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sentence_transformer_generator, "_module_available", lambda _: False)
+
+    with pytest.raises(ImportError, match=r"missing: onnxruntime, .*No docu-store extra"):
+        check_backend_installed("onnx")
+
+
+def test_installed_backend_runtime_passes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sentence_transformer_generator, "_module_available", lambda _: True)
+
+    check_backend_installed("openvino")
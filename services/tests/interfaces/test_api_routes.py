@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from uuid import UUID, uuid4
 
 import pytest
@@ -72,7 +72,9 @@ class FakePageReadModel(PageReadModel):
     ) -> list[PageResponse]:
         return [self._pages[pid] for pid in page_ids if pid in self._pages]
 
-    async def count_pages_with_summaries(self, artifact_id: UUID) -> int:
+    async def count_pages_with_summaries(
+        self, artifact_id: UUID, exclude_page_ids: Collection[UUID] = (),
+    ) -> int:
         return 0
 
     async def get_pages_by_artifact_ids(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID, uuid4
@@ -501,9 +502,11 @@ class MockPageReadModel:
         self,
         pages: dict[UUID, Any] | None = None,
         summary_count: int = 0,
+        summarized_page_ids: set[UUID] | None = None,
     ) -> None:
         self._pages = pages or {}
         self._summary_count = summary_count
+        self._summarized_page_ids = summarized_page_ids
 
     async def get_page_by_id(self, page_id: UUID, workspace_id: UUID | None = None) -> Any:
         return self._pages.get(page_id)
@@ -514,7 +517,13 @@ class MockPageReadModel:
     async def list_pages(self, *args: Any, **kwargs: Any) -> list:
         return list(self._pages.values())
 
-    async def count_pages_with_summaries(self, artifact_id: UUID) -> int:
+    async def count_pages_with_summaries(
+        self,
+        artifact_id: UUID,
+        exclude_page_ids: Collection[UUID] = (),
+    ) -> int:
+        if self._summarized_page_ids is not None:
+            return len(self._summarized_page_ids - set(exclude_page_ids))
         if self._summary_count > 0:
             return self._summary_count
         return sum(